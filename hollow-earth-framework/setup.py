@@ -37,7 +37,7 @@ else:
 
 setup(
     name="hollow-earth-framework",
-    version="1.0.0",
+    version="1.1.0",
     author="Hollow Earth Framework Team",
     author_email="your.email@example.com",  # Replace with actual email
     description="Mathematical framework for analyzing alternative geological models",
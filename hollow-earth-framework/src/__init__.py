@@ -14,11 +14,11 @@ Key Features:
 - Inconsistency detection in standard models
 
 Author: Hollow Earth Framework Team
-Version: 1.0.0
+Version: 1.1.0
 License: MIT
 """
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 __author__ = "Hollow Earth Framework Team"
 __license__ = "MIT"
 
@@ -29,17 +29,61 @@ try:
         SeismicWaveguideModel,
         SphericalShell,
         ModelConfiguration,
+        ShellTable,
         PhysicalConstants,
         CONSTANTS
     )
+    from .mathematical_framework.ensemble import ENSEMBLE_PARAMETERS, evaluate_hollow_earth_ensemble
+    from .mathematical_framework.parameter_sweep import SweepSpec, run_parameter_sweep, iter_sweep_results
+    from .mathematical_framework.result_store import ResultStore, default_store_path
+    from .mathematical_framework.density_profiles import RadialDensityProfile
+    from .mathematical_framework.gravity_field import FIELD_FRAMES, sun_gravity, compute_gravity_field
+    from .mathematical_framework.trajectories import TRAJECTORY_STATUS, integrate_trajectories
+    from .mathematical_framework.sun_stability import contact_times, analyze_sun_stability
+    from .mathematical_framework.rotation import radau_darwin_j2, moment_of_inertia_batch, moment_of_inertia_for_configurations
+    from .mathematical_framework.ray_tracing import RAY_TYPES, shell_velocities, trace_rays
+    from .mathematical_framework.travel_time_tables import TravelTimeTable, get_travel_time_table
+    from .mathematical_framework.catalog_scoring import iter_catalog_chunks, score_catalog
+    from .mathematical_framework.cavity_modes import spherical_bessel_derivative_roots, cavity_mode_spectrum
+    from .mathematical_framework.synthetic_seismograms import ricker_wavelet, generate_synthetic_seismograms
     
     __all__ = [
         'HollowEarthModel',
         'SeismicWaveguideModel', 
         'SphericalShell',
         'ModelConfiguration',
+        'ShellTable',
         'PhysicalConstants',
-        'CONSTANTS'
+        'CONSTANTS',
+        'ENSEMBLE_PARAMETERS',
+        'evaluate_hollow_earth_ensemble',
+        'SweepSpec',
+        'run_parameter_sweep',
+        'iter_sweep_results',
+        'ResultStore',
+        'default_store_path',
+        'RadialDensityProfile',
+        'FIELD_FRAMES',
+        'sun_gravity',
+        'compute_gravity_field',
+        'TRAJECTORY_STATUS',
+        'integrate_trajectories',
+        'contact_times',
+        'analyze_sun_stability',
+        'radau_darwin_j2',
+        'moment_of_inertia_batch',
+        'moment_of_inertia_for_configurations',
+        'RAY_TYPES',
+        'shell_velocities',
+        'trace_rays',
+        'TravelTimeTable',
+        'get_travel_time_table',
+        'iter_catalog_chunks',
+        'score_catalog',
+        'spherical_bessel_derivative_roots',
+        'cavity_mode_spectrum',
+        'ricker_wavelet',
+        'generate_synthetic_seismograms'
     ]
     
 except ImportError:
@@ -68,19 +112,63 @@ from .core_equations import (
     SeismicWaveguideModel,
     SphericalShell, 
     ModelConfiguration,
+    ShellTable,
     PhysicalConstants,
     CONSTANTS,
     demonstrate_framework
 )
+from .ensemble import ENSEMBLE_PARAMETERS, evaluate_hollow_earth_ensemble
+from .parameter_sweep import SweepSpec, run_parameter_sweep, iter_sweep_results
+from .result_store import ResultStore, default_store_path
+from .density_profiles import RadialDensityProfile
+from .gravity_field import FIELD_FRAMES, sun_gravity, compute_gravity_field
+from .trajectories import TRAJECTORY_STATUS, integrate_trajectories
+from .sun_stability import contact_times, analyze_sun_stability
+from .rotation import radau_darwin_j2, moment_of_inertia_batch, moment_of_inertia_for_configurations
+from .ray_tracing import RAY_TYPES, shell_velocities, trace_rays
+from .travel_time_tables import TravelTimeTable, get_travel_time_table
+from .catalog_scoring import iter_catalog_chunks, score_catalog
+from .cavity_modes import spherical_bessel_derivative_roots, cavity_mode_spectrum
+from .synthetic_seismograms import ricker_wavelet, generate_synthetic_seismograms
 
 __all__ = [
     'HollowEarthModel',
     'SeismicWaveguideModel',
     'SphericalShell',
     'ModelConfiguration', 
+    'ShellTable',
     'PhysicalConstants',
     'CONSTANTS',
-    'demonstrate_framework'
+    'demonstrate_framework',
+    'ENSEMBLE_PARAMETERS',
+    'evaluate_hollow_earth_ensemble',
+    'SweepSpec',
+    'run_parameter_sweep',
+    'iter_sweep_results',
+    'ResultStore',
+    'default_store_path',
+    'RadialDensityProfile',
+    'FIELD_FRAMES',
+    'sun_gravity',
+    'compute_gravity_field',
+    'TRAJECTORY_STATUS',
+    'integrate_trajectories',
+    'contact_times',
+    'analyze_sun_stability',
+    'radau_darwin_j2',
+    'moment_of_inertia_batch',
+    'moment_of_inertia_for_configurations',
+    'RAY_TYPES',
+    'shell_velocities',
+    'trace_rays',
+    'TravelTimeTable',
+    'get_travel_time_table',
+    'iter_catalog_chunks',
+    'score_catalog',
+    'spherical_bessel_derivative_roots',
+    'cavity_mode_spectrum',
+    'ricker_wavelet',
+    'generate_synthetic_seismograms'
 ]
 
 # ============================================================================
@@ -13,14 +13,42 @@ CONCEPTO REVOLUCIONARIO:
 - Sistema completamente AUTO-REGULADO y PROPORCIONAL
 """
 
+import json
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-from dataclasses import dataclass, field
-from typing import List, Dict, Tuple
+from scipy.integrate import solve_ivp
+from dataclasses import asdict, dataclass, field
+from typing import Iterator, List, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ETIQUETAS DE ESTADO (los códigos vectorizados son índices en estas tuplas)
+ESTADOS_VOLCANICOS = (
+    "EQUILIBRADO - Actividad volcánica manejable",
+    "ACTIVO - Mayor actividad volcánica",
+    "HIPERACTIVO - Intensa actividad volcánica",
+)
+ESTADOS_ENERGETICOS = (
+    "ÓPTIMO - Energía abundante",
+    "ESTABLE - Energía suficiente",
+    "DECLIVE - Energía limitada",
+    "CRÍTICO - Energía agotándose",
+)
+ESTADOS_GENERALES = (
+    "ÓPTIMO - Sistema funcionando perfectamente",
+    "ESTABLE - Sistema funcionando bien",
+    "FUNCIONAL - Sistema con limitaciones",
+    "PROBLEMÁTICO - Sistema con fallas múltiples",
+)
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+
+def _json_bytes(value) -> np.ndarray:
+    """Valor JSON como arreglo de bytes para guardarlo en un .npz."""
+    return np.frombuffer(json.dumps(value).encode(), dtype=np.uint8)
+
 @dataclass
 class ProportionalGrowthSystem:
     """Sistema de crecimiento proporcional automático para Tierra Hueca expansiva."""
@@ -249,7 +277,7 @@ class ProportionalGrowthSystem:
         required_solar_power = cavity_surface_area * solar_flux_needed
         
         # Vida útil del sol
-        sun_lifetime_years = total_fusion_energy / (required_solar_power * 365.25 * 24 * 3600)
+        sun_lifetime_years = total_fusion_energy / (required_solar_power * SECONDS_PER_YEAR)
         
         return {
             'core_mass_kg': core_mass,
@@ -270,6 +298,626 @@ class ProportionalGrowthSystem:
             'system_energy_status': self._assess_energy_status(sun_lifetime_years, radioactive_fraction)
         }
     
+    def simulate_evolution_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evolución vectorizada del sistema sobre un arreglo de tiempos.
+        
+        Mismas ecuaciones que calculate_proportional_expansion,
+        analyze_volcanic_feedback y analyze_energy_balance, pero los
+        intermedios compartidos (factor de expansión, radios, áreas, masa del
+        sol) se calculan una sola vez para todo el arreglo. Los parámetros
+        del sistema también pueden ser arreglos (p. ej. muestras de
+        parámetros): todo se difunde (broadcast) contra years.
+        
+        Args:
+            years: Años de evolución, cualquier forma (10^6+ muestras)
+            
+        Returns:
+            Diccionario columnar de arreglos NumPy con los campos de expansión,
+            volcánicos y energéticos; los estados son códigos int8 que indexan
+            ESTADOS_VOLCANICOS, ESTADOS_ENERGETICOS y ESTADOS_GENERALES
+        """
+        
+        years = np.asarray(years, dtype=np.float64)
+        
+        # EXPANSIÓN (intermedios compartidos)
+        core_growth = self.core_expansion_rate * years
+        expansion_factor = 1 + (core_growth / self.initial_dense_core)
+        
+        earth_radius = self.initial_earth_radius * expansion_factor
+        outer_crust = self.initial_outer_crust * expansion_factor
+        dense_core = self.initial_dense_core * expansion_factor
+        inner_crust = self.initial_inner_crust * expansion_factor
+        cavity_radius = self.initial_cavity_radius * expansion_factor
+        
+        sun_size_factor = (expansion_factor ** 2) ** (1/3)
+        sun_radius = self.initial_sun_radius * sun_size_factor
+        sun_mass = self.initial_sun_mass * (sun_size_factor ** 3)
+        
+        # MASAS Y GRAVEDADES
+        below_outer_crust = earth_radius - outer_crust
+        outer_crust_volume = (4/3) * np.pi * (earth_radius**3 - below_outer_crust**3)
+        dense_core_volume = (4/3) * np.pi * (below_outer_crust**3 - (below_outer_crust - dense_core)**3)
+        inner_crust_volume = (4/3) * np.pi * ((cavity_radius + inner_crust)**3 - cavity_radius**3)
+        
+        total_shell_mass = (
+            outer_crust_volume * self.crust_density +
+            dense_core_volume * self.dense_core_density +
+            inner_crust_volume * self.crust_density
+        )
+        total_system_mass = total_shell_mass + sun_mass
+        surface_gravity = self.G * total_shell_mass / earth_radius**2
+        interior_gravity = self.G * sun_mass / cavity_radius**2
+        
+        # INTENSIDAD LUMÍNICA
+        original_distance = self.initial_cavity_radius - self.initial_sun_radius
+        sun_distance = cavity_radius - sun_radius
+        light_intensity_ratio = (original_distance / sun_distance) ** 2 * (sun_mass / self.initial_sun_mass)
+        light_ok = np.abs(light_intensity_ratio - 1.0) < 0.05
+        
+        # ACTIVIDAD VOLCÁNICA
+        surface_factor = expansion_factor ** 2
+        exterior_surface_area = 4 * np.pi * earth_radius**2
+        interior_surface_area = 4 * np.pi * cavity_radius**2
+        exterior_volcanos = exterior_surface_area * (1 / (100e3**2))
+        interior_volcanos = interior_surface_area * (1 / (200e3**2))
+        material_per_volcano_per_year = 1e6 * self.crust_density
+        annual_exterior_material = exterior_volcanos * material_per_volcano_per_year
+        annual_interior_material = interior_volcanos * material_per_volcano_per_year
+        annual_gas_to_sun = annual_interior_material * 0.1
+        
+        # BALANCE ENERGÉTICO
+        core_mass = (4/3) * np.pi * dense_core**3 * self.dense_core_density
+        radioactive_fraction = 0.5 ** (years / 4.5e9)
+        radioactive_power = core_mass * 1e-12 * radioactive_fraction
+        available_fuel = sun_mass * 0.7
+        total_fusion_energy = available_fuel * 0.007 * (3e8) ** 2
+        required_solar_power = interior_surface_area * 100
+        sun_lifetime_years = total_fusion_energy / (required_solar_power * SECONDS_PER_YEAR)
+        
+        # CLASIFICADORES VECTORIZADOS (mismos umbrales que _assess_*)
+        volcanic_status = np.select([surface_factor < 2, surface_factor < 5], [0, 1], 2)
+        energy_status = np.select([
+            (sun_lifetime_years > 1e11) & (radioactive_fraction > 0.1),
+            (sun_lifetime_years > 1e10) & (radioactive_fraction > 0.01),
+            sun_lifetime_years > 1e9,
+        ], [0, 1, 2], 3)
+        checks_ok = (light_ok.astype(np.int8) +
+                     ((surface_gravity >= 8) & (surface_gravity <= 12)) +
+                     (sun_lifetime_years / 1e9 > 10) +
+                     (surface_factor < 10))
+        system_status = np.select([checks_ok == 4, checks_ok >= 3, checks_ok >= 2], [0, 1, 2], 3)
+        
+        shape = np.broadcast(years, expansion_factor).shape
+        return {
+            'years': np.broadcast_to(years, shape),
+            'expansion_factor': expansion_factor,
+            'core_growth_km': core_growth / 1000,
+            
+            # DIMENSIONES EXPANDIDAS
+            'new_earth_radius_km': earth_radius / 1000,
+            'new_outer_crust_km': outer_crust / 1000,
+            'new_dense_core_km': dense_core / 1000,
+            'new_inner_crust_km': inner_crust / 1000,
+            'new_cavity_radius_km': cavity_radius / 1000,
+            'new_cavity_diameter_km': cavity_radius * 2 / 1000,
+            'earth_radius_increase_km': (earth_radius - self.initial_earth_radius) / 1000,
+            'cavity_increase_km': (cavity_radius - self.initial_cavity_radius) / 1000,
+            
+            # SOL CENTRAL
+            'new_sun_radius_km': sun_radius / 1000,
+            'new_sun_diameter_km': sun_radius * 2 / 1000,
+            'new_sun_mass_kg': sun_mass,
+            'sun_growth_factor': sun_size_factor,
+            'sun_increase_km': (sun_radius - self.initial_sun_radius) / 1000,
+            
+            # MASAS Y GRAVEDADES
+            'new_total_system_mass_kg': total_system_mass,
+            'new_surface_gravity': surface_gravity,
+            'new_interior_gravity': interior_gravity,
+            'mass_increase_percent': (total_system_mass / self.initial_earth_mass - 1) * 100,
+            
+            # INTENSIDAD LUMÍNICA
+            'new_sun_distance_km': sun_distance / 1000,
+            'light_intensity_ratio': light_intensity_ratio,
+            'light_intensity_maintained': light_ok,
+            
+            # ACTIVIDAD VOLCÁNICA
+            'volcanic_activity_scale': surface_factor,
+            'exterior_surface_area_km2': exterior_surface_area / 1e6,
+            'interior_surface_area_km2': interior_surface_area / 1e6,
+            'exterior_volcanos_needed': exterior_volcanos,
+            'interior_volcanos_needed': interior_volcanos,
+            'total_volcanos_needed': exterior_volcanos + interior_volcanos,
+            'annual_exterior_material_tons': annual_exterior_material / 1000,
+            'annual_interior_material_tons': annual_interior_material / 1000,
+            'annual_gas_to_sun_tons': annual_gas_to_sun / 1000,
+            
+            # ENERGÍA
+            'core_mass_kg': core_mass,
+            'radioactive_power_w': radioactive_power,
+            'radioactive_fraction_remaining': radioactive_fraction,
+            'available_fusion_fuel_kg': available_fuel,
+            'total_fusion_energy_j': total_fusion_energy,
+            'required_solar_power_w': required_solar_power,
+            'sun_lifetime_years': sun_lifetime_years,
+            'sun_lifetime_billion_years': sun_lifetime_years / 1e9,
+            'energy_balance_ratio': radioactive_power / required_solar_power,
+            
+            # ESTADOS (códigos)
+            'volcanic_status_code': volcanic_status.astype(np.int8),
+            'energy_status_code': energy_status.astype(np.int8),
+            'system_status_code': system_status.astype(np.int8),
+        }
+    
+    def _coupled_coefficients(self) -> Tuple[float, float, float]:
+        """Coeficientes del modelo acoplado (por m² de cavidad y año) y constante de decaimiento."""
+        # Gas volcánico al sol: 1 volcán por 200 km², 1000 m³/año por volcán, 10% gases
+        gas_per_area = 0.1 * 1e6 * self.crust_density / (200e3**2)
+        # Masa convertida en energía para 100 W/m² sobre la cavidad (E = mc²)
+        burn_per_area = 100 * SECONDS_PER_YEAR / (3e8) ** 2
+        decay_rate = np.log(2) / 4.5e9  # Uranio-238
+        return gas_per_area, burn_per_area, decay_rate
+    
+    def _coupled_rhs(self, t: float, y: np.ndarray, volcanic_factor: float = 1.0) -> np.ndarray:
+        """
+        Derivadas del sistema acoplado (por año).
+        
+        Estado y = (crecimiento del núcleo [m], fracción radiactiva,
+        masa del sol [kg], combustible de fusión [kg], gas volcánico
+        acumulado [kg]):
+            núcleo:      d(g)/dt = tasa_expansión · fracción_radiactiva
+            decaimiento: d(f)/dt = -λ·f
+            sol:         d(M)/dt = gas_volcánico + acreción_directa - quemado
+            combustible: d(H)/dt = 0.7·(gas + acreción) - quemado / 0.007
+            gas:         d(V)/dt = gas_volcánico
+        El gas volcánico y el quemado escalan con el área de la cavidad,
+        que crece con el núcleo: ahí está el acoplamiento.
+        """
+        gas_per_area, burn_per_area, decay_rate = self._coupled_coefficients()
+        cavity_radius = self.initial_cavity_radius * (1 + y[0] / self.initial_dense_core)
+        cavity_area = 4 * np.pi * cavity_radius**2
+        
+        gas_rate = volcanic_factor * gas_per_area * cavity_area
+        inflow = gas_rate + self.sun_accretion_rate
+        burn_rate = burn_per_area * cavity_area
+        return np.array([
+            self.core_expansion_rate * y[1],
+            -decay_rate * y[1],
+            inflow - burn_rate,
+            0.7 * inflow - burn_rate / 0.007,
+            gas_rate,
+        ])
+    
+    def _coupled_jacobian(self, t: float, y: np.ndarray, volcanic_factor: float = 1.0) -> np.ndarray:
+        """Jacobiano analítico de _coupled_rhs."""
+        gas_per_area, burn_per_area, decay_rate = self._coupled_coefficients()
+        cavity_radius = self.initial_cavity_radius * (1 + y[0] / self.initial_dense_core)
+        # d(área de la cavidad)/d(crecimiento del núcleo)
+        d_area = 8 * np.pi * cavity_radius * self.initial_cavity_radius / self.initial_dense_core
+        d_gas = volcanic_factor * gas_per_area * d_area
+        d_burn = burn_per_area * d_area
+        
+        jacobian = np.zeros((5, 5))
+        jacobian[0, 1] = self.core_expansion_rate
+        jacobian[1, 1] = -decay_rate
+        jacobian[2, 0] = d_gas - d_burn
+        jacobian[3, 0] = 0.7 * d_gas - d_burn / 0.007
+        jacobian[4, 0] = d_gas
+        return jacobian
+    
+    def coupled_initial_state(self) -> np.ndarray:
+        """
+        Estado inicial del modo acoplado.
+        
+        Returns:
+            Estado (5,) en el orden de _coupled_rhs, o (5, N) si los
+            parámetros del sistema son arreglos
+        """
+        sun_mass = np.asarray(self.initial_sun_mass, dtype=np.float64)
+        return np.array([np.zeros_like(sun_mass), np.ones_like(sun_mass), sun_mass,
+                         0.7 * sun_mass, np.zeros_like(sun_mass)])
+    
+    def _coupled_light_and_gravity(self, state: np.ndarray,
+                                   initial_gravity: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Intensidad lumínica relativa y gravedad superficial para estados (5, ...)."""
+        expansion_factor = 1 + state[0] / self.initial_dense_core
+        # Densidad media del sol constante: radio ∝ masa^(1/3); luminosidad ∝ masa
+        sun_radius = self.initial_sun_radius * np.cbrt(state[2] / self.initial_sun_mass)
+        original_distance = self.initial_cavity_radius - self.initial_sun_radius
+        distance = self.initial_cavity_radius * expansion_factor - sun_radius
+        light = (original_distance / distance) ** 2 * (state[2] / self.initial_sun_mass)
+        # Todas las capas escalan con el factor: masa ∝ factor³, radio² ∝ factor²
+        return light, initial_gravity * expansion_factor
+    
+    def _solve_coupled(self, t_span: Tuple[float, float], y0: np.ndarray,
+                       t_eval: Optional[np.ndarray], method: str, rtol: float,
+                       atol: Optional[np.ndarray], events: Optional[List] = None):
+        """Llama a solve_ivp con el Jacobiano analítico y tolerancias escaladas al estado."""
+        if atol is None:
+            atol = 1e-10 * np.array([self.initial_dense_core, 1.0, self.initial_sun_mass,
+                                     self.initial_sun_mass, self.initial_sun_mass])
+        # El Jacobiano sólo lo usan los métodos implícitos
+        options = {'jac': self._coupled_jacobian} if method in ('Radau', 'BDF', 'LSODA') else {}
+        solution = solve_ivp(self._coupled_rhs, t_span, y0, method=method, t_eval=t_eval,
+                             events=events, rtol=rtol, atol=atol, **options)
+        if not solution.success:
+            logger.warning(f"Integración acoplada incompleta: {solution.message}")
+        return solution
+    
+    def integrate_coupled_evolution(self, max_years: float = 1e10,
+                                    output_years: Optional[np.ndarray] = None,
+                                    method: str = 'LSODA',
+                                    rtol: float = 1e-8,
+                                    atol: Optional[np.ndarray] = None,
+                                    stop_on_event: bool = False) -> Dict:
+        """
+        Modo dinámico: integra el lazo núcleo → volcanes → sol como EDO acoplada.
+        
+        A diferencia de calculate_proportional_expansion, el sol no crece por
+        prescripción (power_factor ** (1/3)) sino por la acreción real de
+        gases volcánicos (más la acreción directa sun_accretion_rate, kg/año)
+        menos la masa quemada por fusión, y la expansión del núcleo está
+        impulsada por el calor radiactivo que decae. Paso adaptativo con
+        scipy solve_ivp y Jacobiano analítico.
+        
+        Eventos (cruces de salida, en años):
+            light_below_95 / light_above_105: intensidad fuera de ±5%
+            gravity_below_8 / gravity_above_12: gravedad fuera de 8–12 m/s²
+        
+        Args:
+            max_years: Horizonte de integración (años)
+            output_years: Tiempos de salida (por defecto: los pasos del integrador)
+            method: Método de solve_ivp ('LSODA', 'Radau', 'BDF', 'RK45', ...)
+            rtol: Tolerancia relativa
+            atol: Tolerancia absoluta por componente (por defecto escalada al estado)
+            stop_on_event: Detener la integración en el primer evento
+            
+        Returns:
+            Diccionario columnar con 'years', las variables de estado, las
+            magnitudes derivadas (factor de expansión, radios, gravedad,
+            intensidad lumínica, vida útil del sol), 'events' (nombre → años)
+            y estadísticas del integrador
+        """
+        
+        initial_gravity = self.calculate_proportional_expansion(0.0)['new_surface_gravity']
+        
+        def light_below_95(t, y):
+            return self._coupled_light_and_gravity(y, initial_gravity)[0] - 0.95
+        
+        def light_above_105(t, y):
+            return self._coupled_light_and_gravity(y, initial_gravity)[0] - 1.05
+        
+        def gravity_below_8(t, y):
+            return self._coupled_light_and_gravity(y, initial_gravity)[1] - 8.0
+        
+        def gravity_above_12(t, y):
+            return self._coupled_light_and_gravity(y, initial_gravity)[1] - 12.0
+        
+        events = [light_below_95, light_above_105, gravity_below_8, gravity_above_12]
+        for event, direction in zip(events, (-1, 1, -1, 1)):
+            event.direction = direction
+            event.terminal = stop_on_event
+        
+        solution = self._solve_coupled((0.0, max_years), self.coupled_initial_state(),
+                                       output_years, method, rtol, atol, events)
+        results = self.coupled_columns(solution.t, solution.y, initial_gravity)
+        results['events'] = {event.__name__: times for event, times in zip(events, solution.t_events)}
+        results['success'] = solution.success
+        results['nfev'] = solution.nfev
+        results['njev'] = solution.njev
+        return results
+    
+    def coupled_columns(self, years: np.ndarray, state: np.ndarray,
+                        initial_gravity: float) -> Dict[str, np.ndarray]:
+        """
+        Columnas de salida del modo acoplado a partir de estados.
+        
+        Args:
+            years: Años de cada estado, forma (N,)
+            state: Estados (5, N), p. ej. de advance_coupled_state
+            initial_gravity: Gravedad superficial en el año 0 (m/s²)
+            
+        Returns:
+            Diccionario columnar, como el de integrate_coupled_evolution
+        """
+        gas_per_area, burn_per_area, _ = self._coupled_coefficients()
+        core_growth, radioactive_fraction, sun_mass, sun_fuel, cumulative_gas = state
+        
+        expansion_factor = 1 + core_growth / self.initial_dense_core
+        earth_radius = self.initial_earth_radius * expansion_factor
+        cavity_radius = self.initial_cavity_radius * expansion_factor
+        sun_radius = self.initial_sun_radius * np.cbrt(sun_mass / self.initial_sun_mass)
+        cavity_area = 4 * np.pi * cavity_radius**2
+        light, surface_gravity = self._coupled_light_and_gravity(state, initial_gravity)
+        
+        # Vida útil: combustible restante al ritmo de consumo actual
+        required_solar_power = cavity_area * 100
+        sun_lifetime_years = sun_fuel * 0.007 * (3e8) ** 2 / (required_solar_power * SECONDS_PER_YEAR)
+        
+        return {
+            'years': years,
+            'core_growth_km': core_growth / 1000,
+            'radioactive_fraction_remaining': radioactive_fraction,
+            'sun_mass_kg': sun_mass,
+            'sun_fuel_kg': sun_fuel,
+            'cumulative_gas_to_sun_tons': cumulative_gas / 1000,
+            
+            'expansion_factor': expansion_factor,
+            'earth_radius_km': earth_radius / 1000,
+            'cavity_radius_km': cavity_radius / 1000,
+            'sun_radius_km': sun_radius / 1000,
+            'surface_gravity': surface_gravity,
+            'interior_gravity': self.G * sun_mass / cavity_radius**2,
+            'light_intensity_ratio': light,
+            'light_intensity_maintained': np.abs(light - 1.0) < 0.05,
+            'annual_gas_to_sun_tons': gas_per_area * cavity_area / 1000,
+            'sun_lifetime_years': sun_lifetime_years,
+            'sun_lifetime_billion_years': sun_lifetime_years / 1e9,
+        }
+    
+    def iter_evolution_chunks(self, max_years: float, step_years: float,
+                              chunk_size: int = 100_000,
+                              start_years: float = 0.0,
+                              coupled: bool = False,
+                              method: str = 'LSODA',
+                              rtol: float = 1e-8,
+                              checkpoint_path: Optional[str] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Genera la evolución en bloques de tamaño fijo (memoria constante).
+        
+        La malla temporal start_years + k·step_years se produce bloque a
+        bloque, así que ni la malla ni la evolución completa existen nunca
+        en memoria: escritores y agregadores consumen cada bloque y lo
+        descartan. En modo acoplado el integrador continúa cada bloque desde
+        el estado final del anterior.
+        
+        Con checkpoint_path, cada vez que el consumidor pide el bloque
+        siguiente se guarda en un .npz el límite de bloque (índice, estado y
+        año del integrador); resume_evolution_chunks continúa desde el
+        primer bloque no consumido con salida bit a bit idéntica.
+        
+        Args:
+            max_years: Último año de la malla (incluido si cae en ella)
+            step_years: Paso de la malla (años)
+            chunk_size: Filas por bloque
+            start_years: Primer año de la malla
+            coupled: Usar el modo dinámico (integrate_coupled_evolution) en lugar
+                de las ecuaciones proporcionales (simulate_evolution_arrays)
+            method: Método de solve_ivp en modo acoplado
+            rtol: Tolerancia relativa en modo acoplado
+            checkpoint_path: Archivo .npz de puntos de control (None: sin puntos de control)
+            
+        Yields:
+            Diccionarios columnares con hasta chunk_size filas, con las mismas
+            columnas que simulate_evolution_arrays o el modo acoplado
+        """
+        
+        run = {
+            'max_years': float(max_years),
+            'step_years': float(step_years),
+            # Tolerancia: 0.3 // 0.1 == 2.0 en coma flotante perdería el último paso
+            'n_steps': int(np.floor((max_years - start_years) / step_years + 1e-9)) + 1,
+            'chunk_size': int(chunk_size),
+            'start_years': float(start_years),
+            'coupled': bool(coupled),
+            'method': method,
+            'rtol': float(rtol),
+        }
+        
+        state = np.empty(0)
+        if coupled:
+            state = self.coupled_initial_state()
+            if start_years > 0:
+                state = self._solve_coupled((0.0, start_years), state, None, method, rtol, None).y[:, -1]
+        
+        return self._iter_chunks(run, 0, state, float(start_years), checkpoint_path)
+    
+    @classmethod
+    def resume_evolution_chunks(cls, checkpoint_path: str) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Reanuda iter_evolution_chunks desde su punto de control.
+        
+        Args:
+            checkpoint_path: Archivo .npz escrito por iter_evolution_chunks
+            
+        Yields:
+            Los bloques restantes, idénticos a los de la corrida original
+        """
+        
+        with np.load(checkpoint_path) as checkpoint:
+            run = json.loads(checkpoint['run'].tobytes())
+            if 'chunk_size' not in run:
+                raise ValueError(f"{checkpoint_path} no es un punto de control de iter_evolution_chunks")
+            system = cls(**json.loads(checkpoint['system'].tobytes()))
+            first = int(checkpoint['step'])
+            state = checkpoint['state']
+            previous_years = float(checkpoint['previous_years'])
+        
+        logger.info(f"Reanudando bloques de evolución en la fila {first}/{run['n_steps']}")
+        return system._iter_chunks(run, first, state, previous_years, checkpoint_path)
+    
+    def _iter_chunks(self, run: Dict, first_row: int, state: np.ndarray, previous_years: float,
+                     checkpoint_path: Optional[str]) -> Iterator[Dict[str, np.ndarray]]:
+        """Generador de bloques compartido por iter_evolution_chunks y su reanudación."""
+        n_steps, chunk_size = run['n_steps'], run['chunk_size']
+        initial_gravity = self.calculate_proportional_expansion(0.0)['new_surface_gravity']
+        
+        for first in range(first_row, n_steps, chunk_size):
+            years = run['start_years'] + run['step_years'] * np.arange(first, min(first + chunk_size, n_steps))
+            
+            if not run['coupled']:
+                yield self.simulate_evolution_arrays(years)
+            else:
+                if years[-1] > previous_years:
+                    solution = self._solve_coupled((previous_years, years[-1]), state, years,
+                                                   run['method'], run['rtol'], None)
+                    states = solution.y
+                else:
+                    states = state[:, np.newaxis]
+                state, previous_years = states[:, -1], float(years[-1])
+                yield self.coupled_columns(years, states, initial_gravity)
+            
+            # El consumidor pidió el bloque siguiente: éste ya está procesado
+            done = first + chunk_size
+            if checkpoint_path and done < n_steps:
+                self._write_checkpoint(checkpoint_path, run, done, state,
+                                       previous_years=np.float64(previous_years))
+    
+    def advance_coupled_state(self, state: np.ndarray, years: float, n_steps: int,
+                              volcanic_factor=1.0) -> np.ndarray:
+        """
+        Avanza estados del modo acoplado con RK4 de paso fijo.
+        
+        Args:
+            state: Estados (5,) o (5, N), como en _coupled_rhs
+            years: Intervalo a avanzar (años)
+            n_steps: Pasos RK4 en el intervalo
+            volcanic_factor: Multiplicador de la actividad volcánica (escalar o (N,))
+            
+        Returns:
+            Estados al final del intervalo
+        """
+        h = years / n_steps
+        for _ in range(n_steps):
+            k1 = self._coupled_rhs(0.0, state, volcanic_factor)
+            k2 = self._coupled_rhs(0.0, state + h / 2 * k1, volcanic_factor)
+            k3 = self._coupled_rhs(0.0, state + h / 2 * k2, volcanic_factor)
+            k4 = self._coupled_rhs(0.0, state + h * k3, volcanic_factor)
+            state = state + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        return state
+    
+    def run_monte_carlo_evolution(self, max_years: float = 1e10,
+                                  step_years: float = 1e6,
+                                  n_realizations: int = 1000,
+                                  volcanic_sigma: float = 0.0,
+                                  seed: Optional[int] = None,
+                                  checkpoint_path: Optional[str] = None,
+                                  checkpoint_interval: int = 1000) -> Dict:
+        """
+        Conjunto Monte Carlo del modo acoplado con puntos de control.
+        
+        Integra _coupled_rhs con RK4 de paso fijo para todas las
+        realizaciones a la vez. En cada paso la actividad volcánica de cada
+        realización se multiplica por un factor lognormal de media 1
+        (volcanic_sigma = 0: corrida determinista). Con paso fijo el estado
+        completo del integrador es (paso, estado), así que cada
+        checkpoint_interval pasos se guardan ese estado, los tiempos de salida
+        y el estado del generador aleatorio en un .npz binario;
+        resume_monte_carlo_evolution continúa bit a bit idéntica.
+        
+        Args:
+            max_years: Horizonte (años)
+            step_years: Paso máximo del integrador (años)
+            n_realizations: Número de realizaciones
+            volcanic_sigma: Desviación del logaritmo del factor volcánico
+            seed: Semilla del generador aleatorio
+            checkpoint_path: Archivo .npz de puntos de control (None: sin puntos de control)
+            checkpoint_interval: Pasos entre puntos de control
+            
+        Returns:
+            Diccionario columnar (una fila por realización) con el estado final,
+            'light_exit_years' y 'gravity_exit_years' (primera salida de ±5% y
+            de 8–12 m/s², NaN si nunca sale) y 'n_steps'
+        """
+        
+        run = {
+            'max_years': float(max_years),
+            'n_steps': int(np.ceil(max_years / step_years)),
+            'n_realizations': int(n_realizations),
+            'volcanic_sigma': float(volcanic_sigma),
+            'checkpoint_interval': int(checkpoint_interval),
+        }
+        rng = np.random.default_rng(seed)
+        state = np.repeat(self.coupled_initial_state()[:, np.newaxis], n_realizations, axis=1)
+        
+        initial_gravity = self.calculate_proportional_expansion(0.0)['new_surface_gravity']
+        light, gravity = self._coupled_light_and_gravity(state, initial_gravity)
+        exit_years = np.full((2, n_realizations), np.nan)
+        exit_years[0, np.abs(light - 1.0) >= 0.05] = 0.0
+        exit_years[1, (gravity < 8) | (gravity > 12)] = 0.0
+        
+        return self._run_monte_carlo(run, 0, state, exit_years, rng, checkpoint_path)
+    
+    @classmethod
+    def resume_monte_carlo_evolution(cls, checkpoint_path: str) -> Dict:
+        """
+        Reanuda una corrida de run_monte_carlo_evolution desde su punto de control.
+        
+        El sistema, los parámetros de la corrida, el estado del integrador y
+        el del generador aleatorio salen del archivo, y la corrida sigue
+        guardando puntos de control en él.
+        
+        Args:
+            checkpoint_path: Archivo .npz escrito por run_monte_carlo_evolution
+            
+        Returns:
+            Mismo diccionario que run_monte_carlo_evolution
+        """
+        
+        with np.load(checkpoint_path) as checkpoint:
+            system = cls(**json.loads(checkpoint['system'].tobytes()))
+            run = json.loads(checkpoint['run'].tobytes())
+            rng_state = json.loads(checkpoint['rng_state'].tobytes())
+            step = int(checkpoint['step'])
+            state = checkpoint['state']
+            exit_years = checkpoint['exit_years']
+        
+        rng = np.random.Generator(getattr(np.random, rng_state['bit_generator'])())
+        rng.bit_generator.state = rng_state
+        logger.info(f"Reanudando corrida Monte Carlo en el paso {step}/{run['n_steps']}")
+        return system._run_monte_carlo(run, step, state, exit_years, rng, checkpoint_path)
+    
+    def _run_monte_carlo(self, run: Dict, first_step: int, state: np.ndarray,
+                         exit_years: np.ndarray, rng: np.random.Generator,
+                         checkpoint_path: Optional[str]) -> Dict:
+        """Bucle RK4 de paso fijo compartido por la corrida y su reanudación."""
+        n_steps = run['n_steps']
+        h = run['max_years'] / n_steps
+        sigma = run['volcanic_sigma']
+        initial_gravity = self.calculate_proportional_expansion(0.0)['new_surface_gravity']
+        light, gravity = self._coupled_light_and_gravity(state, initial_gravity)
+        
+        for step in range(first_step, n_steps):
+            if sigma > 0:
+                factor = rng.lognormal(-sigma**2 / 2, sigma, run['n_realizations'])
+            else:
+                factor = 1.0
+            
+            state = self.advance_coupled_state(state, h, 1, factor)
+            
+            # PRIMERAS SALIDAS (interpoladas dentro del paso)
+            new_light, new_gravity = self._coupled_light_and_gravity(state, initial_gravity)
+            for row, previous, current, low, high in ((0, light, new_light, 0.95, 1.05),
+                                                      (1, gravity, new_gravity, 8.0, 12.0)):
+                leaving = np.isnan(exit_years[row]) & ((current < low) | (current > high))
+                if np.any(leaving):
+                    bound = np.where(current < low, low, high)
+                    fraction = (previous - bound) / (previous - current)
+                    exit_years[row, leaving] = (step + fraction[leaving]) * h
+            light, gravity = new_light, new_gravity
+            
+            done = step + 1
+            if checkpoint_path and done % run['checkpoint_interval'] == 0 and done < n_steps:
+                self._write_checkpoint(checkpoint_path, run, done, state, exit_years=exit_years,
+                                       rng_state=_json_bytes(rng.bit_generator.state))
+        
+        results = self.coupled_columns(np.full(run['n_realizations'], run['max_years']),
+                                        state, initial_gravity)
+        results['light_exit_years'] = exit_years[0]
+        results['gravity_exit_years'] = exit_years[1]
+        results['n_steps'] = n_steps
+        return results
+    
+    def _write_checkpoint(self, path: str, run: Dict, step: int, state: np.ndarray,
+                          **arrays: np.ndarray):
+        """Escribe un punto de control de forma atómica (archivo temporal + reemplazo)."""
+        tmp = f'{path}.tmp{os.getpid()}'
+        with open(tmp, 'wb') as f:
+            np.savez(f, step=np.int64(step), state=state, system=_json_bytes(asdict(self)),
+                     run=_json_bytes(run), **arrays)
+        os.replace(tmp, path)
+    
     def simulate_system_evolution(self, max_years: float = 1e9) -> Dict:
         """
         Simula la evolución completa del sistema expansivo.
@@ -282,70 +930,67 @@ class ProportionalGrowthSystem:
         """
         
         time_points = [1e6, 1e7, 1e8, 5e8, 1e9, 5e9, 1e10]  # Hasta 10 mil millones de años
+        time_points = [years for years in time_points if years <= max_years]
+        evolution = self.simulate_evolution_arrays(np.array(time_points))
         evolution_timeline = {}
         
-        for years in time_points:
-            if years <= max_years:
-                expansion = self.calculate_proportional_expansion(years)
-                volcanic = self.analyze_volcanic_feedback(years)
-                energy = self.analyze_energy_balance(years)
+        for i, years in enumerate(time_points):
+            evolution_timeline[f"{years:.0e}_years"] = {
+                'time_description': self._format_time(years),
+                
+                # DIMENSIONES
+                'earth_radius_km': float(evolution['new_earth_radius_km'][i]),
+                'cavity_diameter_km': float(evolution['new_cavity_diameter_km'][i]),
+                'sun_diameter_km': float(evolution['new_sun_diameter_km'][i]),
+                
+                # CRECIMIENTO
+                'expansion_factor': float(evolution['expansion_factor'][i]),
+                'earth_growth_km': float(evolution['earth_radius_increase_km'][i]),
+                'cavity_growth_km': float(evolution['cavity_increase_km'][i]),
+                'sun_growth_km': float(evolution['sun_increase_km'][i]),
+                
+                # GRAVEDAD Y MASA
+                'surface_gravity': float(evolution['new_surface_gravity'][i]),
+                'interior_gravity': float(evolution['new_interior_gravity'][i]),
+                'mass_increase_percent': float(evolution['mass_increase_percent'][i]),
+                
+                # ACTIVIDAD VOLCÁNICA
+                'total_volcanos': float(evolution['total_volcanos_needed'][i]),
+                'volcanic_activity_scale': float(evolution['volcanic_activity_scale'][i]),
+                
+                # ENERGÍA
+                'sun_lifetime_billion_years': float(evolution['sun_lifetime_billion_years'][i]),
+                'radioactive_fraction': float(evolution['radioactive_fraction_remaining'][i]),
+                
+                # INTENSIDAD LUMÍNICA
+                'light_intensity_maintained': bool(evolution['light_intensity_maintained'][i]),
+                'light_intensity_ratio': float(evolution['light_intensity_ratio'][i]),
                 
-                evolution_timeline[f"{years:.0e}_years"] = {
-                    'time_description': self._format_time(years),
-                    
-                    # DIMENSIONES
-                    'earth_radius_km': expansion['new_earth_radius_km'],
-                    'cavity_diameter_km': expansion['new_cavity_diameter_km'],
-                    'sun_diameter_km': expansion['new_sun_diameter_km'],
-                    
-                    # CRECIMIENTO
-                    'expansion_factor': expansion['expansion_factor'],
-                    'earth_growth_km': expansion['earth_radius_increase_km'],
-                    'cavity_growth_km': expansion['cavity_increase_km'],
-                    'sun_growth_km': expansion['sun_increase_km'],
-                    
-                    # GRAVEDAD Y MASA
-                    'surface_gravity': expansion['new_surface_gravity'],
-                    'interior_gravity': expansion['new_interior_gravity'],
-                    'mass_increase_percent': expansion['mass_increase_percent'],
-                    
-                    # ACTIVIDAD VOLCÁNICA
-                    'total_volcanos': volcanic['total_volcanos_needed'],
-                    'volcanic_activity_scale': volcanic['volcanic_activity_scale'],
-                    
-                    # ENERGÍA
-                    'sun_lifetime_billion_years': energy['sun_lifetime_billion_years'],
-                    'radioactive_fraction': energy['radioactive_fraction_remaining'],
-                    
-                    # INTENSIDAD LUMÍNICA
-                    'light_intensity_maintained': expansion['light_intensity_maintained'],
-                    'light_intensity_ratio': expansion['light_intensity_ratio'],
-                    
-                    # ESTADO GENERAL
-                    'system_status': self._assess_overall_status(expansion, volcanic, energy)
-                }
+                # ESTADO GENERAL
+                'system_status': ESTADOS_GENERALES[evolution['system_status_code'][i]]
+            }
         
         return evolution_timeline
     
     def _assess_volcanic_balance(self, expansion_factor: float, surface_factor: float) -> str:
         """Evalúa el equilibrio volcánico."""
         if surface_factor < 2:
-            return "EQUILIBRADO - Actividad volcánica manejable"
+            return ESTADOS_VOLCANICOS[0]
         elif surface_factor < 5:
-            return "ACTIVO - Mayor actividad volcánica"
+            return ESTADOS_VOLCANICOS[1]
         else:
-            return "HIPERACTIVO - Intensa actividad volcánica"
+            return ESTADOS_VOLCANICOS[2]
     
     def _assess_energy_status(self, sun_lifetime: float, radioactive_fraction: float) -> str:
         """Evalúa el estado energético."""
         if sun_lifetime > 1e11 and radioactive_fraction > 0.1:
-            return "ÓPTIMO - Energía abundante"
+            return ESTADOS_ENERGETICOS[0]
         elif sun_lifetime > 1e10 and radioactive_fraction > 0.01:
-            return "ESTABLE - Energía suficiente"
+            return ESTADOS_ENERGETICOS[1]
         elif sun_lifetime > 1e9:
-            return "DECLIVE - Energía limitada"
+            return ESTADOS_ENERGETICOS[2]
         else:
-            return "CRÍTICO - Energía agotándose"
+            return ESTADOS_ENERGETICOS[3]
     
     def _assess_overall_status(self, expansion: Dict, volcanic: Dict, energy: Dict) -> str:
         """Evalúa el estado general del sistema."""
@@ -357,13 +1002,13 @@ class ProportionalGrowthSystem:
         volcanic_ok = volcanic['volcanic_activity_scale'] < 10
         
         if all([light_ok, gravity_ok, energy_ok, volcanic_ok]):
-            return "ÓPTIMO - Sistema funcionando perfectamente"
+            return ESTADOS_GENERALES[0]
         elif sum([light_ok, gravity_ok, energy_ok, volcanic_ok]) >= 3:
-            return "ESTABLE - Sistema funcionando bien"  
+            return ESTADOS_GENERALES[1]
         elif sum([light_ok, gravity_ok, energy_ok, volcanic_ok]) >= 2:
-            return "FUNCIONAL - Sistema con limitaciones"
+            return ESTADOS_GENERALES[2]
         else:
-            return "PROBLEMÁTICO - Sistema con fallas múltiples"
+            return ESTADOS_GENERALES[3]
     
     def _format_time(self, years: float) -> str:
         """Formato legible para períodos de tiempo."""
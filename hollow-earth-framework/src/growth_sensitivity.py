@@ -0,0 +1,359 @@
+"""
+ANÁLISIS DE SENSIBILIDAD GLOBAL - SISTEMA DE CRECIMIENTO PROPORCIONAL
+Índices de Sobol (primer orden y totales) y cribado de Morris
+
+Mide qué parámetros ajustables de ProportionalGrowthSystem (tasas, densidades,
+radios iniciales) controlan la gravedad superficial, la intensidad lumínica y
+la vida útil del sol en horizontes elegidos. Las muestras se evalúan en
+bloques vectorizados (los campos del sistema son arreglos y todo se difunde),
+repartidos en un pool de procesos; cada bloque devuelve sólo sumas
+acumuladas, así que la memoria no depende del tamaño del estudio.
+
+License: MIT
+"""
+
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.stats import qmc
+
+# Añadir path para importar el sistema evolutivo
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from geological_feedback_system import ProportionalGrowthSystem
+
+logger = logging.getLogger(__name__)
+
+# PARÁMETROS AJUSTABLES (campos de ProportionalGrowthSystem)
+PARAMETROS_AJUSTABLES = (
+    'initial_earth_radius',
+    'initial_outer_crust',
+    'initial_dense_core',
+    'initial_inner_crust',
+    'initial_cavity_radius',
+    'initial_sun_radius',
+    'initial_sun_mass',
+    'crust_density',
+    'dense_core_density',
+    'core_expansion_rate',
+    'sun_accretion_rate',
+)
+
+# Sólo el modo acoplado usa la acreción directa al sol
+PARAMETROS_ACOPLADOS = ('sun_accretion_rate',)
+
+# SALIDAS: nombre → columna de simulate_evolution_arrays (modo proporcional)
+SALIDAS_PROPORCIONALES = {
+    'surface_gravity': 'new_surface_gravity',
+    'interior_gravity': 'new_interior_gravity',
+    'light_intensity_ratio': 'light_intensity_ratio',
+    'sun_lifetime_years': 'sun_lifetime_years',
+}
+
+DEFAULT_OUTPUTS = ('surface_gravity', 'light_intensity_ratio', 'sun_lifetime_years')
+DEFAULT_HORIZONS = (1e8, 1e9, 1e10)
+
+def default_bounds(relative_range: float = 0.2,
+                   parameters: Optional[Sequence[str]] = None,
+                   coupled: bool = False) -> Dict[str, Tuple[float, float]]:
+    """
+    Rangos uniformes de ±relative_range alrededor de los valores por defecto.
+
+    Sin lista explícita se usan PARAMETROS_AJUSTABLES, quitando los de
+    PARAMETROS_ACOPLADOS fuera del modo acoplado: en el proporcional no
+    influyen y sólo añadirían evaluaciones con índices nulos.
+    """
+    if parameters is None:
+        parameters = [name for name in PARAMETROS_AJUSTABLES
+                      if coupled or name not in PARAMETROS_ACOPLADOS]
+    nominal = ProportionalGrowthSystem()
+    return {name: (getattr(nominal, name) * (1 - relative_range),
+                   getattr(nominal, name) * (1 + relative_range)) for name in parameters}
+
+def _evaluate(names: Sequence[str], values: np.ndarray, horizons: np.ndarray,
+              outputs: Sequence[str], coupled: bool, coupled_step_years: float,
+              model: Optional[Callable] = None) -> np.ndarray:
+    """
+    Evalúa un bloque de muestras de parámetros.
+
+    Args:
+        names: Parámetros variados
+        values: Valores de los parámetros, forma (n, d)
+        horizons: Horizontes en años, ordenados, forma (H,)
+        outputs: Salidas pedidas
+        coupled: Usar el modo acoplado en lugar de las ecuaciones proporcionales
+        coupled_step_years: Paso máximo de RK4 en modo acoplado
+        model: Modelo propio f(values, horizons) en lugar de ProportionalGrowthSystem
+
+    Returns:
+        Arreglo (n_salidas, H, n)
+    """
+    if model is not None:
+        return np.broadcast_to(model(values, horizons), (len(outputs), len(horizons), len(values)))
+
+    system = ProportionalGrowthSystem(**{name: values[:, i] for i, name in enumerate(names)})
+
+    if not coupled:
+        evolution = system.simulate_evolution_arrays(horizons[:, np.newaxis])
+        return np.stack([np.broadcast_to(evolution[SALIDAS_PROPORCIONALES[name]],
+                                         (len(horizons), len(values))) for name in outputs])
+
+    # MODO ACOPLADO: RK4 de horizonte en horizonte para todo el bloque
+    initial_gravity = system.calculate_proportional_expansion(0.0)['new_surface_gravity']
+    state = system.coupled_initial_state().reshape(5, -1)
+    state = np.broadcast_to(state, (5, len(values))).copy()
+    results = np.empty((len(outputs), len(horizons), len(values)))
+    previous = 0.0
+    for j, years in enumerate(horizons):
+        if years > previous:
+            n_steps = int(np.ceil((years - previous) / coupled_step_years))
+            state = system.advance_coupled_state(state, years - previous, n_steps)
+        previous = years
+        columns = system.coupled_columns(np.full(len(values), years), state, initial_gravity)
+        for k, name in enumerate(outputs):
+            results[k, j] = columns[name]
+    return results
+
+def _sobol_block(start: int, count: int, seed: int, names: Sequence[str],
+                 lower: np.ndarray, upper: np.ndarray, horizons: np.ndarray,
+                 outputs: Sequence[str], coupled: bool, coupled_step_years: float,
+                 shift: np.ndarray, model: Optional[Callable]) -> Dict[str, np.ndarray]:
+    """Filas [start, start + count) del diseño de Saltelli; devuelve sumas acumuladas."""
+    d = len(names)
+    sampler = qmc.Sobol(d=2 * d, scramble=True, seed=seed)
+    if start:
+        sampler.fast_forward(start)
+    u = sampler.random(count)
+    a = lower + u[:, :d] * (upper - lower)
+    b = lower + u[:, d:] * (upper - lower)
+
+    # Matrices A, B y A_B^(i) (A con la columna i de B), evaluadas juntas
+    mixed = np.repeat(a[np.newaxis], d, axis=0)
+    mixed[np.arange(d), :, np.arange(d)] = b.T
+    values = np.concatenate([a, b, mixed.reshape(d * count, d)])
+    f = _evaluate(names, values, horizons, outputs, coupled, coupled_step_years, model) - shift[..., np.newaxis]
+    f_a, f_b = f[..., :count], f[..., count:2 * count]
+    f_mixed = f[..., 2 * count:].reshape(f.shape[:2] + (d, count))
+
+    return {
+        'count': count,
+        'sum': f_a.sum(axis=-1) + f_b.sum(axis=-1),
+        'sum_sq': (f_a**2).sum(axis=-1) + (f_b**2).sum(axis=-1),
+        # Saltelli (2010): V_i ≈ mean(f_B·(f_ABi - f_A)); Jansen: VT_i ≈ mean((f_A - f_ABi)²)/2
+        'first': np.einsum('ohn,ohdn->ohd', f_b, f_mixed - f_a[:, :, np.newaxis]),
+        'total': ((f_a[:, :, np.newaxis] - f_mixed)**2).sum(axis=-1) / 2,
+    }
+
+def _morris_block(seed: np.random.SeedSequence, n_trajectories: int, levels: int,
+                  names: Sequence[str], lower: np.ndarray, upper: np.ndarray,
+                  horizons: np.ndarray, outputs: Sequence[str], coupled: bool,
+                  coupled_step_years: float, model: Optional[Callable]) -> Dict[str, np.ndarray]:
+    """Un bloque de trayectorias de Morris; devuelve sumas de efectos elementales."""
+    rng = np.random.default_rng(seed)
+    d = len(names)
+    delta = levels / (2 * (levels - 1))
+
+    # Base en la mitad inferior de la malla: x + Δ sigue en [0, 1]
+    base = rng.integers(0, levels // 2, size=(n_trajectories, d)) / (levels - 1)
+    order = np.argsort(rng.random((n_trajectories, d)), axis=1)
+    steps = np.zeros((n_trajectories, d + 1, d))
+    rows = np.arange(n_trajectories)
+    for k in range(d):
+        steps[:, k + 1] = steps[:, k]
+        steps[rows, k + 1, order[:, k]] = delta
+    points = (base[:, np.newaxis] + steps).reshape(-1, d)
+
+    f = _evaluate(names, lower + points * (upper - lower), horizons, outputs, coupled,
+                  coupled_step_years, model)
+    f = f.reshape(f.shape[:2] + (n_trajectories, d + 1))
+    effects_in_order = np.diff(f, axis=-1) / delta
+    effects = np.empty_like(effects_in_order)
+    effects[..., rows[:, np.newaxis], order] = effects_in_order
+
+    return {
+        'count': n_trajectories,
+        'sum': effects.sum(axis=-2),
+        'sum_abs': np.abs(effects).sum(axis=-2),
+        'sum_sq': (effects**2).sum(axis=-2),
+    }
+
+def _run_blocks(function, args, max_workers: Optional[int]):
+    """Ejecuta bloques en línea (max_workers=0) o en un pool de procesos, en orden."""
+    if max_workers == 0:
+        for a in args:
+            yield function(*a)
+    else:
+        max_workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(function, *zip(*args))
+
+def _accumulate(total: Optional[Dict], block: Dict) -> Dict:
+    """Suma los acumuladores de un bloque."""
+    if total is None:
+        return dict(block)
+    return {key: total[key] + value for key, value in block.items()}
+
+def _prepare(bounds: Optional[Dict[str, Tuple[float, float]]], horizons: Sequence[float],
+             outputs: Sequence[str], coupled: bool, model: Optional[Callable]):
+    """Valida parámetros y salidas y convierte los rangos en arreglos."""
+    if model is not None:
+        if not bounds:
+            raise ValueError("Con un modelo propio hay que dar bounds")
+    else:
+        bounds = bounds or default_bounds(coupled=coupled)
+        unknown = [name for name in bounds if name not in ProportionalGrowthSystem.__dataclass_fields__]
+        if unknown:
+            raise ValueError(f"Parámetros desconocidos: {unknown}")
+        missing = [name for name in outputs if name not in SALIDAS_PROPORCIONALES]
+        if missing:
+            raise ValueError(f"Salidas desconocidas: {missing} (disponibles: {tuple(SALIDAS_PROPORCIONALES)})")
+    names = tuple(bounds)
+    lower = np.array([bounds[name][0] for name in names], dtype=np.float64)
+    upper = np.array([bounds[name][1] for name in names], dtype=np.float64)
+    return names, lower, upper, np.sort(np.asarray(horizons, dtype=np.float64))
+
+def sobol_indices(n_samples: int = 2**14,
+                  horizons: Sequence[float] = DEFAULT_HORIZONS,
+                  outputs: Sequence[str] = DEFAULT_OUTPUTS,
+                  bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                  coupled: bool = False,
+                  coupled_step_years: float = 1e8,
+                  seed: int = 0,
+                  block_size: int = 2**13,
+                  max_workers: Optional[int] = 0,
+                  model: Optional[Callable] = None) -> Dict:
+    """
+    Índices de Sobol de primer orden y totales (diseño de Saltelli).
+
+    Con d parámetros el estudio evalúa el modelo n_samples·(d + 2) veces.
+    Las muestras base salen de una secuencia de Sobol aleatorizada; cada
+    bloque la regenera desde su desplazamiento (fast_forward), así que los
+    índices no dependen del número de procesos.
+
+    Args:
+        n_samples: Muestras base (se redondea a potencia de 2)
+        horizons: Horizontes de evaluación (años)
+        outputs: Salidas (claves de SALIDAS_PROPORCIONALES)
+        bounds: Rango uniforme (mín, máx) por parámetro (por defecto:
+            default_bounds(coupled=coupled), ±20% alrededor de los valores por defecto)
+        coupled: Evaluar el modo acoplado (RK4) en lugar del proporcional
+        coupled_step_years: Paso máximo de RK4 en modo acoplado (años)
+        seed: Semilla de la aleatorización de la secuencia de Sobol
+        block_size: Muestras base por bloque (potencia de 2)
+        max_workers: Procesos (None: os.cpu_count(), 0: en línea)
+        model: Modelo propio f(values (n, d), horizons (H,)) → (n_salidas, H, n)
+            en lugar de ProportionalGrowthSystem; exige bounds, outputs son sólo
+            etiquetas y debe poder serializarse (pickle) si max_workers != 0
+
+    Returns:
+        Diccionario con 'parameters', 'outputs', 'horizons', 'first_order' y
+        'total' de forma (n_salidas, H, d), 'variance' (n_salidas, H) y
+        'n_evaluations'
+    """
+
+    start_time = time.perf_counter()
+    names, lower, upper, horizons = _prepare(bounds, horizons, outputs, coupled, model)
+    n_samples = 1 << max(int(n_samples) - 1, 0).bit_length()
+    block_size = min(1 << (max(int(block_size), 1).bit_length() - 1), n_samples)
+
+    # Centrar en el punto nominal evita cancelaciones en las sumas de cuadrados
+    shift = _evaluate(names, ((lower + upper) / 2)[np.newaxis], horizons, outputs,
+                      coupled, coupled_step_years, model)[..., 0]
+    args = [(start, block_size, seed, names, lower, upper, horizons, tuple(outputs),
+             coupled, coupled_step_years, shift, model) for start in range(0, n_samples, block_size)]
+
+    totals = None
+    for block in _run_blocks(_sobol_block, args, max_workers):
+        totals = _accumulate(totals, block)
+
+    n = totals['count']
+    mean = totals['sum'] / (2 * n)
+    variance = totals['sum_sq'] / (2 * n) - mean**2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first_order = totals['first'] / n / variance[..., np.newaxis]
+        total = totals['total'] / n / variance[..., np.newaxis]
+
+    n_evaluations = n * (len(names) + 2)
+    logger.info(f"Sobol: {n_evaluations} evaluaciones en {time.perf_counter() - start_time:.2f} s")
+
+    return {
+        'parameters': names,
+        'outputs': tuple(outputs),
+        'horizons': horizons,
+        'first_order': first_order,
+        'total': total,
+        'variance': variance,
+        'n_evaluations': n_evaluations,
+    }
+
+def morris_screening(n_trajectories: int = 1000,
+                     levels: int = 4,
+                     horizons: Sequence[float] = DEFAULT_HORIZONS,
+                     outputs: Sequence[str] = DEFAULT_OUTPUTS,
+                     bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                     coupled: bool = False,
+                     coupled_step_years: float = 1e8,
+                     seed: int = 0,
+                     block_size: int = 10_000,
+                     max_workers: Optional[int] = 0,
+                     model: Optional[Callable] = None) -> Dict:
+    """
+    Cribado de Morris: efectos elementales sobre trayectorias de un factor a la vez.
+
+    Cada trayectoria recorre los d parámetros en orden aleatorio con un paso
+    Δ = p / (2(p - 1)) en la malla unitaria de p niveles (d + 1 evaluaciones).
+    Los efectos se expresan por unidad del rango de cada parámetro.
+
+    Args:
+        n_trajectories: Número de trayectorias
+        levels: Niveles de la malla (par)
+        horizons: Horizontes de evaluación (años)
+        outputs: Salidas (claves de SALIDAS_PROPORCIONALES)
+        bounds: Rango (mín, máx) por parámetro (por defecto: default_bounds(coupled=coupled))
+        coupled: Evaluar el modo acoplado (RK4) en lugar del proporcional
+        coupled_step_years: Paso máximo de RK4 en modo acoplado (años)
+        seed: Semilla raíz; el bloque k usa el hijo k de SeedSequence(seed)
+        block_size: Trayectorias por bloque
+        max_workers: Procesos (None: os.cpu_count(), 0: en línea)
+        model: Modelo propio, como en sobol_indices
+
+    Returns:
+        Diccionario con 'parameters', 'outputs', 'horizons', 'mu', 'mu_star' y
+        'sigma' de forma (n_salidas, H, d) y 'n_evaluations'
+    """
+
+    if levels < 2 or levels % 2:
+        raise ValueError("levels debe ser par y >= 2")
+    start_time = time.perf_counter()
+    names, lower, upper, horizons = _prepare(bounds, horizons, outputs, coupled, model)
+
+    sizes = [min(block_size, n_trajectories - start) for start in range(0, n_trajectories, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(s, n, levels, names, lower, upper, horizons, tuple(outputs), coupled, coupled_step_years, model)
+            for s, n in zip(seeds, sizes)]
+
+    totals = None
+    for block in _run_blocks(_morris_block, args, max_workers):
+        totals = _accumulate(totals, block)
+
+    n = totals['count']
+    mu = totals['sum'] / n
+    sigma = np.sqrt(np.maximum(totals['sum_sq'] / n - mu**2, 0.0) * n / max(n - 1, 1))
+
+    n_evaluations = n * (len(names) + 1)
+    logger.info(f"Morris: {n_evaluations} evaluaciones en {time.perf_counter() - start_time:.2f} s")
+
+    return {
+        'parameters': names,
+        'outputs': tuple(outputs),
+        'horizons': horizons,
+        'mu': mu,
+        'mu_star': totals['sum_abs'] / n,
+        'sigma': sigma,
+        'n_evaluations': n_evaluations,
+    }
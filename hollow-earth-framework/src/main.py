@@ -31,6 +31,7 @@ try:
         SeismicWaveguideModel, 
         demonstrate_framework
     )
+    from mathematical_framework.result_store import ResultStore
     print("✅ Framework modules loaded successfully")
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -42,7 +43,7 @@ def print_banner():
     """Print the framework banner."""
     banner = """
 ╔══════════════════════════════════════════════════════════════════╗
-║              🌍  HOLLOW EARTH FRAMEWORK v1.0.0  🌍              ║
+║              🌍  HOLLOW EARTH FRAMEWORK v1.1.0  🌍              ║
 ║                                                                  ║
 ║              Mathematical Analysis of Alternative                 ║
 ║                    Geological Models                             ║
@@ -109,16 +110,21 @@ def waveguide_focus():
         print(f"      Predicted: {data['predicted']}")
         print(f"      Match: {data['match']}")
 
-def export_results(export_dir):
-    """Export results and configurations to specified directory."""
+def export_results(export_dir, store_path=None):
+    """Export results and configurations to specified directory.
+
+    Optimizer results are reused from and saved to a result store only
+    when store_path is given.
+    """
     print(f"\n💾 EXPORTING RESULTS to {export_dir}")
     print("=" * 50)
     
     # Create export directory
     Path(export_dir).mkdir(parents=True, exist_ok=True)
     
-    # Initialize models
-    model = HollowEarthModel()
+    # Initialize models (optimizer results are reused from an explicit result store)
+    store = ResultStore(store_path) if store_path is not None else None
+    model = HollowEarthModel(result_store=store)
     
     # Create and export different configurations
     configs = {
@@ -149,6 +155,11 @@ def export_results(export_dir):
         json.dump(waveguide_data, f, indent=2, default=str)
     print(f"   ✅ Exported waveguide analysis to {waveguide_file}")
     
+    if store is not None:
+        stats = store.stats()
+        print(f"   🗄️  Result store: {stats['hits']} hits, {stats['misses']} misses ({stats['path']})")
+        store.close()
+    
     print(f"\n🎉 Export complete! Check {export_dir}/ for all files.")
 
 def main():
@@ -171,6 +182,8 @@ Examples:
                        help='Focus on seismic waveguide analysis')
     parser.add_argument('--export', type=str, metavar='DIR',
                        help='Export results to specified directory')
+    parser.add_argument('--store', type=str, metavar='PATH',
+                       help='Reuse and save optimizer results in this SQLite result store')
     
     args = parser.parse_args()
     
@@ -183,7 +196,7 @@ Examples:
     elif args.waveguide:
         waveguide_focus()
     elif args.export:
-        export_results(args.export)
+        export_results(args.export, store_path=args.store)
         # Also run quick demo
         quick_demo()
     else:
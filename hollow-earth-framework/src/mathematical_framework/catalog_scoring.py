@@ -0,0 +1,253 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Catalog Scoring - streaming travel-time residuals against a real catalog
+
+Reads a local earthquake arrival catalog (CSV, any number of rows) in
+fixed-size chunks and scores every arrival against the travel times
+predicted by the hollow model and by the standard solid Earth model.
+Predictions come from the memory-mapped travel-time tables, residual
+statistics are accumulated per model and phase (including fixed-bin
+histograms for medians), so memory stays constant for any catalog size.
+
+Catalog columns (header row required):
+    phase                          'P' or 'S'
+    depth_km                       source depth
+    distance_deg                   epicentral distance, or instead
+    event_lat, event_lon,          event and station coordinates (degrees)
+    station_lat, station_lon
+    travel_time                    observed travel time (s), or instead
+    arrival_time, origin_time      epoch seconds
+Other columns (event_id, station, ...) are ignored. Rows with a missing
+travel time, distance or depth are counted separately and not scored.
+
+License: MIT
+"""
+
+import csv
+import itertools
+import logging
+import time
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from .core_equations import HollowEarthModel, ModelConfiguration
+from .travel_time_tables import get_travel_time_table
+
+logger = logging.getLogger(__name__)
+
+# Residual histograms (used for medians) have fixed-width bins spanning at
+# least ±MIN_RESIDUAL_RANGE, widened to the longest tabulated travel time;
+# residuals beyond the range are clipped into the edge bins and counted
+RESIDUAL_BIN_WIDTH = 0.1        # s
+MIN_RESIDUAL_RANGE = 1800.0     # s
+
+def residual_bins(max_travel_time: float = 0.0) -> np.ndarray:
+    """Histogram bin edges (s) covering ±max(MIN_RESIDUAL_RANGE, max_travel_time)."""
+    half_width = max(MIN_RESIDUAL_RANGE, float(max_travel_time))
+    n_half = int(np.ceil(half_width / RESIDUAL_BIN_WIDTH))
+    return np.arange(-n_half, n_half + 1) * RESIDUAL_BIN_WIDTH
+
+_NUMERIC_COLUMNS = ('depth_km', 'distance_deg', 'event_lat', 'event_lon', 'station_lat',
+                    'station_lon', 'travel_time', 'arrival_time', 'origin_time')
+
+def _to_float(values) -> np.ndarray:
+    """Convert a column of strings to float64, with NaN for blanks and junk."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        out = np.empty(len(values))
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except ValueError:
+                out[i] = np.nan
+        return out
+
+def great_circle_distance(lat1: np.ndarray, lon1: np.ndarray,
+                          lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """Angular distance in degrees between points given in degrees (haversine)."""
+    lat1, lon1, lat2, lon2 = (np.radians(a) for a in (lat1, lon1, lat2, lon2))
+    h = (np.sin((lat2 - lat1) / 2)**2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2)
+    return np.degrees(2 * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0))))
+
+def iter_catalog_chunks(path: str, chunk_size: int = 100_000) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Stream a catalog CSV as columnar chunks.
+
+    Args:
+        path: CSV file with a header row
+        chunk_size: Rows per chunk
+
+    Yields:
+        Dictionaries with 'phase' (str array), 'depth' (m), 'distance_deg'
+        and 'travel_time' (s) arrays of up to chunk_size rows
+    """
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader)]
+        index = {name: i for i, name in enumerate(header)}
+
+        if 'phase' not in index or 'depth_km' not in index:
+            raise ValueError("Catalog needs 'phase' and 'depth_km' columns")
+        has_distance = 'distance_deg' in index
+        if not has_distance and not all(c in index for c in ('event_lat', 'event_lon',
+                                                             'station_lat', 'station_lon')):
+            raise ValueError("Catalog needs 'distance_deg' or event/station coordinates")
+        has_travel_time = 'travel_time' in index
+        if not has_travel_time and not ('arrival_time' in index and 'origin_time' in index):
+            raise ValueError("Catalog needs 'travel_time' or 'arrival_time' and 'origin_time'")
+
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                return
+            # Short rows are padded so their missing fields parse as NaN
+            # instead of truncating every column to the shortest row
+            rows = [row + [''] * (len(header) - len(row)) if len(row) < len(header) else row
+                    for row in rows]
+            columns = list(zip(*rows))
+            column = {name: columns[i] for name, i in index.items()}
+            numeric = {name: _to_float(column[name]) for name in _NUMERIC_COLUMNS if name in column}
+
+            if has_distance:
+                distance = numeric['distance_deg']
+            else:
+                distance = great_circle_distance(numeric['event_lat'], numeric['event_lon'],
+                                                 numeric['station_lat'], numeric['station_lon'])
+            if has_travel_time:
+                travel_time = numeric['travel_time']
+            else:
+                travel_time = numeric['arrival_time'] - numeric['origin_time']
+
+            yield {
+                'phase': np.char.upper(np.char.strip(np.array(column['phase'], dtype=str))),
+                'depth': numeric['depth_km'] * 1000.0,
+                'distance_deg': distance,
+                'travel_time': travel_time,
+            }
+
+class _ResidualAccumulator:
+    """Running residual statistics with a fixed-size histogram."""
+
+    def __init__(self, bins: np.ndarray):
+        self.bins = bins
+        self.count = 0
+        self.unpredicted = 0
+        self.clipped = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.total_abs = 0.0
+        self.histogram = np.zeros(len(bins) - 1, dtype=np.int64)
+
+    def add(self, residuals: np.ndarray):
+        predicted = np.isfinite(residuals)
+        r = residuals[predicted]
+        self.unpredicted += int(np.count_nonzero(~predicted))
+        self.count += len(r)
+        self.total += float(r.sum())
+        self.total_sq += float(np.dot(r, r))
+        self.total_abs += float(np.abs(r).sum())
+        self.clipped += int(np.count_nonzero((r < self.bins[0]) | (r >= self.bins[-1])))
+        clipped = np.clip(r, self.bins[0], np.nextafter(self.bins[-1], 0))
+        self.histogram += np.histogram(clipped, self.bins)[0]
+
+    def summary(self) -> Dict:
+        if self.count == 0:
+            return {'count': 0, 'unpredicted': self.unpredicted, 'clipped': 0}
+        cumulative = np.cumsum(self.histogram)
+        median_bin = int(np.searchsorted(cumulative, self.count / 2))
+        return {
+            'count': self.count,
+            'unpredicted': self.unpredicted,
+            'clipped': self.clipped,
+            'mean': self.total / self.count,
+            'rms': np.sqrt(self.total_sq / self.count),
+            'mae': self.total_abs / self.count,
+            'median': float(0.5 * (self.bins[median_bin] + self.bins[median_bin + 1])),
+        }
+
+def score_catalog(path: str,
+                  hollow_config: Optional[ModelConfiguration] = None,
+                  standard_config: Optional[ModelConfiguration] = None,
+                  chunk_size: int = 100_000,
+                  table_dir: Optional[str] = None) -> Dict:
+    """
+    Score catalog arrivals against the hollow and standard Earth models.
+
+    Residual = observed - predicted travel time. Arrivals that a model
+    cannot explain (shadow zones, depths or phases outside its table) count
+    as 'unpredicted' for that model. Arrivals with a missing (non-finite)
+    travel time, distance or depth are not scored and are reported in
+    'n_missing_observations' instead, so incomplete picks do not inflate
+    the misfit.
+
+    Args:
+        path: Catalog CSV (see module docstring for columns)
+        hollow_config: Hollow model (default: create_hollow_earth_model())
+        standard_config: Reference model (default: create_standard_earth_model())
+        chunk_size: Rows parsed and scored at once
+        table_dir: Travel-time table cache directory
+
+    Returns:
+        Dictionary with per-model, per-phase residual statistics (including
+        the count of residuals clipped to the median histogram's range), the
+        number of arrivals, skipped phases and missing observations, and the
+        fraction of arrivals the hollow model fits better
+    """
+    start = time.perf_counter()
+    if hollow_config is None or standard_config is None:
+        model = HollowEarthModel()
+        hollow_config = hollow_config or model.create_hollow_earth_model()
+        standard_config = standard_config or model.create_standard_earth_model()
+
+    tables = {
+        'hollow': get_travel_time_table(hollow_config, cache_dir=table_dir),
+        'standard': get_travel_time_table(standard_config, cache_dir=table_dir),
+    }
+    phases = tables['hollow'].phases
+    bins = residual_bins(max(float(np.nanmax(table.times, initial=0.0)) for table in tables.values()))
+    stats = {name: {phase: _ResidualAccumulator(bins) for phase in phases} for name in tables}
+
+    n_arrivals = 0
+    n_skipped = 0
+    n_missing = 0
+    hollow_better = 0
+    n_compared = 0
+    for chunk in iter_catalog_chunks(path, chunk_size):
+        n_arrivals += len(chunk['phase'])
+        known = np.isin(chunk['phase'], phases)
+        complete = (np.isfinite(chunk['travel_time']) & np.isfinite(chunk['distance_deg']) &
+                    np.isfinite(chunk['depth']))
+        n_skipped += int(np.count_nonzero(~known))
+        n_missing += int(np.count_nonzero(known & ~complete))
+
+        for phase in phases:
+            rows = (chunk['phase'] == phase) & complete
+            if not np.any(rows):
+                continue
+            observed = chunk['travel_time'][rows]
+            residuals = {}
+            for name, table in tables.items():
+                predicted = table.travel_time(chunk['distance_deg'][rows], chunk['depth'][rows], phase)
+                residuals[name] = observed - predicted
+                stats[name][phase].add(residuals[name])
+
+            both = np.isfinite(residuals['hollow']) & np.isfinite(residuals['standard'])
+            n_compared += int(np.count_nonzero(both))
+            hollow_better += int(np.count_nonzero(
+                np.abs(residuals['hollow'][both]) < np.abs(residuals['standard'][both])))
+
+    results = {
+        'n_arrivals': n_arrivals,
+        'n_skipped_phases': n_skipped,
+        'n_missing_observations': n_missing,
+        'models': {name: {phase: acc.summary() for phase, acc in by_phase.items()}
+                   for name, by_phase in stats.items()},
+        'hollow_better_fraction': hollow_better / n_compared if n_compared else np.nan,
+    }
+
+    logger.info(f"Scored {n_arrivals} arrivals in {time.perf_counter() - start:.2f} s; "
+                f"hollow model fits better for {results['hollow_better_fraction']:.1%}")
+    return results
@@ -0,0 +1,121 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Cavity Modes - acoustic eigenmodes of a spherical cavity
+
+Normal modes of a gas-filled spherical cavity with a (nearly) rigid rock
+wall: p ∝ j_l(k·r)·Y_lm with j_l'(k·a) = 0, so f_nl = c·x'_nl / (2π·a).
+The dimensionless roots x'_nl do not depend on the radius; they are
+bracketed on a grid for all l at once (scipy.special) and refined by
+vectorized bisection, then broadcast over any array of cavity radii.
+Damping combines the energy transmitted into the wall at each reflection
+(impedance contrast, Sabine-type decay) with an optional intrinsic Q of
+the gas, giving Q and ringing times for every mode.
+
+License: MIT
+"""
+
+import numpy as np
+from scipy.special import spherical_jn
+from typing import Dict, Optional, Sequence, Union
+
+from .core_equations import CONSTANTS, SeismicWaveguideModel
+
+# Bisection iterations: halves the bracket down to float64 resolution
+_BISECTION_STEPS = 60
+
+def spherical_bessel_derivative_roots(l_max: int, n_roots: int) -> np.ndarray:
+    """
+    First positive roots of j_l'(x) for l = 0..l_max.
+
+    The trivial root x = 0 of j_0' (uniform pressure) is excluded.
+
+    Args:
+        l_max: Highest angular degree
+        n_roots: Roots per degree
+
+    Returns:
+        Array of shape (l_max + 1, n_roots)
+    """
+    degrees = np.arange(l_max + 1)[:, np.newaxis]
+    # Roots of j_l' are about π apart and the first lies near l + 1
+    x_max = (n_roots + 2) * np.pi + l_max + 2.0
+    while True:
+        x = np.arange(0.05, x_max, 0.05)
+        values = spherical_jn(degrees, x, derivative=True)
+        change = np.signbit(values[:, :-1]) != np.signbit(values[:, 1:])
+        if change.sum(axis=1).min() >= n_roots:
+            break
+        x_max *= 1.5
+
+    # Bracket index of the first n_roots sign changes per degree
+    rank = np.cumsum(change, axis=1)
+    brackets = np.stack([np.argmax(change & (rank == k + 1), axis=1) for k in range(n_roots)], axis=1)
+
+    l = np.broadcast_to(degrees, brackets.shape)
+    lo, hi = x[brackets], x[brackets + 1]
+    f_lo = spherical_jn(l, lo, derivative=True)
+    for _ in range(_BISECTION_STEPS):
+        mid = 0.5 * (lo + hi)
+        f_mid = spherical_jn(l, mid, derivative=True)
+        left = np.signbit(f_mid) != np.signbit(f_lo)
+        hi = np.where(left, mid, hi)
+        lo = np.where(left, lo, mid)
+        f_lo = np.where(left, f_lo, f_mid)
+    return 0.5 * (lo + hi)
+
+def cavity_mode_spectrum(cavity_radii: Union[float, Sequence[float]],
+                         l_max: int = 10,
+                         n_max: int = 5,
+                         air_density: float = CONSTANTS.RHO_AIR,
+                         wall_density: float = CONSTANTS.RHO_CRUST,
+                         q_medium: float = np.inf,
+                         waveguide: Optional[SeismicWaveguideModel] = None) -> Dict[str, np.ndarray]:
+    """
+    Acoustic eigenfrequencies, Q and ringing times for many cavity radii.
+
+    Wall losses: a plane wave hitting the wall loses the fraction
+    α = 4·Z_gas·Z_wall / (Z_gas + Z_wall)² of its energy, so the mode energy
+    decays with τ_E = 4V / (c·α·S) = 4a / (3c·α) and Q_wall = 2π·f·τ_E.
+
+    Args:
+        cavity_radii: Cavity radius or radii (m), shape (R,)
+        l_max: Highest angular degree
+        n_max: Radial overtones per degree
+        air_density: Density of the cavity gas (kg/m³)
+        wall_density: Density of the wall rock (kg/m³)
+        q_medium: Intrinsic quality factor of the gas (inf: lossless)
+        waveguide: Velocity source: v_air in the gas, v_p_crust in the wall
+
+    Returns:
+        Dictionary with per-mode arrays 'l', 'n', 'x' and 'degeneracy' (M,),
+        sorted by frequency, and per-radius arrays 'frequency' (Hz), 'q' and
+        'ringing_time' (s, amplitude 1/e) of shape (R, M)
+    """
+    waveguide = waveguide or SeismicWaveguideModel()
+    radii = np.atleast_1d(np.asarray(cavity_radii, dtype=np.float64))
+    c = waveguide.v_air
+
+    roots = spherical_bessel_derivative_roots(l_max, n_max)
+    l, n = np.meshgrid(np.arange(l_max + 1), np.arange(1, n_max + 1), indexing='ij')
+    order = np.argsort(roots, axis=None)
+    x, l, n = roots.ravel()[order], l.ravel()[order], n.ravel()[order]
+
+    frequency = c * x / (2 * np.pi * radii[:, np.newaxis])
+
+    z_gas = air_density * c
+    z_wall = wall_density * waveguide.v_p_crust
+    absorption = 4 * z_gas * z_wall / (z_gas + z_wall)**2
+    energy_decay_time = 4 * radii / (3 * c * absorption)
+    q_wall = 2 * np.pi * frequency * energy_decay_time[:, np.newaxis]
+    q = 1.0 / (1.0 / q_wall + 1.0 / q_medium)
+
+    return {
+        'l': l,
+        'n': n,
+        'x': x,
+        'degeneracy': 2 * l + 1,
+        'frequency': frequency,
+        'q': q,
+        'ringing_time': q / (np.pi * frequency),
+        'wall_absorption': absorption,
+    }
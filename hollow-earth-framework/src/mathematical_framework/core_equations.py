@@ -14,9 +14,13 @@ import scipy.optimize
 from scipy.integrate import quad
 from typing import List, Dict, Tuple, Optional, Union
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import json
+import hashlib
 import logging
+import copy
+from collections import OrderedDict
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,12 +35,18 @@ class PhysicalConstants:
     R_EARTH: float = 6.371e6  # Earth's radius (m)
     G_SURFACE: float = 9.80665  # Standard surface gravity (m/s²)
     RHO_WATER: float = 1000.0  # Water density (kg/m³)
+    RHO_AIR: float = 1.225  # Sea-level air density (kg/m³)
     RHO_CRUST: float = 2800.0  # Average crustal density (kg/m³)
     RHO_MANTLE: float = 4500.0  # Average mantle density (kg/m³)
     RHO_CORE: float = 11000.0  # Core density (kg/m³)
+    OMEGA_EARTH: float = 7.2921159e-5  # Earth's rotation rate (rad/s)
+    MOI_FACTOR_EARTH: float = 0.3307  # Observed I/(M·R²)
+    J2_EARTH: float = 1.08263e-3  # Observed dynamical form factor
 
 CONSTANTS = PhysicalConstants()
 
+FRAMEWORK_VERSION = '1.1.0'
+
 # ============================================================================
 # SEISMIC WAVEGUIDE ANALYSIS MODULE
 # ============================================================================
@@ -50,14 +60,25 @@ class SeismicWaveguideModel:
     creating seismic wave trapping analogous to optical fibers.
     """
     
-    def __init__(self):
-        """Initialize seismic waveguide analysis."""
-        # Standard seismic velocities (m/s)
-        self.v_p_crust = 6000      # P-wave velocity in crust
-        self.v_s_crust = 3500      # S-wave velocity in crust  
-        self.v_p_mantle = 8000     # P-wave velocity in mantle
-        self.v_s_mantle = 4500     # S-wave velocity in mantle
-        self.v_air = 343           # Sound velocity in air
+    def __init__(self, v_p_crust: float = 6000, v_s_crust: float = 3500,
+                 v_p_mantle: float = 8000, v_s_mantle: float = 4500,
+                 v_air: float = 343):
+        """
+        Initialize seismic waveguide analysis.
+        
+        Args:
+            v_p_crust: P-wave velocity in crust (m/s)
+            v_s_crust: S-wave velocity in crust (m/s)
+            v_p_mantle: P-wave velocity in mantle (m/s)
+            v_s_mantle: S-wave velocity in mantle (m/s)
+            v_air: Sound velocity in the cavity medium (m/s)
+        """
+        # Seismic velocities (m/s), standard values by default
+        self.v_p_crust = v_p_crust      # P-wave velocity in crust
+        self.v_s_crust = v_s_crust      # S-wave velocity in crust  
+        self.v_p_mantle = v_p_mantle    # P-wave velocity in mantle
+        self.v_s_mantle = v_s_mantle    # S-wave velocity in mantle
+        self.v_air = v_air              # Sound velocity in air
         
         # Critical angles for total internal reflection
         self.critical_angles = {}
@@ -72,13 +93,95 @@ class SeismicWaveguideModel:
             'mantle_crust': (self.v_p_mantle, self.v_p_crust)
         }
         
-        for interface, (v1, v2) in interfaces.items():
-            if v2 < v1:  # Total internal reflection possible
-                sin_critical = v2 / v1
-                critical_angle = np.arcsin(sin_critical) * 180 / np.pi
-                self.critical_angles[interface] = critical_angle
-            else:
-                self.critical_angles[interface] = 90.0  # No total internal reflection
+        v1, v2 = np.array(list(interfaces.values()), dtype=np.float64).T
+        angles = self.critical_angle(v1, v2)
+        for interface, angle in zip(interfaces, angles):
+            self.critical_angles[interface] = float(angle)
+    
+    @staticmethod
+    def critical_angle(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """
+        Critical angle (degrees) from medium 1 into medium 2, element-wise.
+        
+        Total internal reflection is taken as possible when v2 < v1, with
+        sin(θc) = v2 / v1; otherwise the angle is 90°.
+        
+        Args:
+            v1: Velocity of the incident medium (m/s)
+            v2: Velocity of the second medium (m/s)
+            
+        Returns:
+            Critical angles in degrees
+        """
+        v1, v2 = np.broadcast_arrays(np.asarray(v1, dtype=np.float64), np.asarray(v2, dtype=np.float64))
+        ratio = np.divide(v2, v1, out=np.ones_like(v1), where=v1 > 0)
+        return np.where(v2 < v1, np.degrees(np.arcsin(np.clip(ratio, 0.0, 1.0))), 90.0)
+    
+    @classmethod
+    def critical_angle_matrix(cls, velocities: np.ndarray) -> np.ndarray:
+        """
+        Critical angles between every pair of layers, for many models at once.
+        
+        Args:
+            velocities: Layer velocities (m/s), shape (..., K)
+            
+        Returns:
+            Array of shape (..., K, K); entry [i, j] is the critical angle
+            from layer i into layer j in degrees
+        """
+        velocities = np.asarray(velocities, dtype=np.float64)
+        return cls.critical_angle(velocities[..., :, np.newaxis], velocities[..., np.newaxis, :])
+    
+    @classmethod
+    def analyze_velocity_models(cls, v_p: np.ndarray, v_s: np.ndarray,
+                                v_cavity: np.ndarray, cavity_radius: np.ndarray,
+                                shell_thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Critical-angle matrices and waveguide parameters for N velocity models.
+        
+        Vectorized equivalent of building N SeismicWaveguideModel objects and
+        calling calculate_waveguide_modes on each. Shells are ordered from the
+        surface inwards; the cavity medium is appended as the last layer (it
+        carries no S waves), and the shell bounding the cavity acts as the
+        waveguide cladding.
+        
+        Args:
+            v_p: Shell P-wave velocities (m/s), shape (N, S)
+            v_s: Shell S-wave velocities (m/s), shape (N, S)
+            v_cavity: Sound velocity of the cavity medium (m/s), scalar or (N,)
+            cavity_radius: Radius of central cavity (m), scalar or (N,)
+            shell_thickness: Thickness of shell (m), scalar or (N,)
+            
+        Returns:
+            Dictionary with 'critical_angles_p' and 'critical_angles_s'
+            (N, S+1, S+1) and length-N waveguide parameter arrays
+        """
+        v_p = np.atleast_2d(np.asarray(v_p, dtype=np.float64))
+        v_s = np.atleast_2d(np.asarray(v_s, dtype=np.float64))
+        n = len(v_p)
+        v_cavity = np.broadcast_to(np.asarray(v_cavity, dtype=np.float64), (n,))
+        cavity_radius = np.broadcast_to(np.asarray(cavity_radius, dtype=np.float64), (n,))
+        shell_thickness = np.broadcast_to(np.asarray(shell_thickness, dtype=np.float64), (n,))
+        
+        layers_p = np.column_stack((v_p, v_cavity))
+        layers_s = np.column_stack((v_s, np.zeros(n)))
+        
+        # Same formulas as calculate_waveguide_modes, with the wall shell as cladding
+        v_wall = v_p[:, -1]
+        na_equivalent = np.sqrt((v_wall**2 - v_cavity**2) / v_wall**2)
+        v_parameter = (2 * np.pi * cavity_radius / 1000) * na_equivalent  # Assuming 1km wavelength
+        num_modes = np.where(v_parameter > 2.405, np.floor(v_parameter**2 / 2), 1).astype(np.int64)
+        
+        return {
+            'critical_angles_p': cls.critical_angle_matrix(layers_p),
+            'critical_angles_s': cls.critical_angle_matrix(layers_s),
+            'wall_cavity_critical_angle': cls.critical_angle(v_wall, v_cavity),
+            'numerical_aperture_equivalent': na_equivalent,
+            'v_parameter': v_parameter,
+            'estimated_modes': num_modes,
+            'fundamental_frequency_hz': v_cavity / (2 * cavity_radius),
+            'cladding_radius': cavity_radius + shell_thickness,
+        }
     
     def analyze_fiber_optic_analogy(self) -> Dict:
         """
@@ -271,45 +374,352 @@ class SphericalShell:
         """Average radius for calculations."""
         return (self.outer_radius + self.inner_radius) / 2.0
 
-@dataclass
+@dataclass(frozen=True, eq=False)
+class ShellTable:
+    """
+    Struct-of-arrays representation of a shell stack.
+
+    Shells are stored innermost first in contiguous, read-only float64
+    arrays. Volumes, masses and cumulative masses are computed once at
+    construction so gravity, mass and validation code never touch the
+    per-shell dataclasses.
+
+    Attributes:
+        outer_radii: Outer radius of each shell (m), ascending
+        inner_radii: Inner radius of each shell (m)
+        densities: Material density of each shell (kg/m³)
+        names: Descriptive shell names
+        material_types: Material type of each shell
+        volumes: Shell volumes (m³)
+        masses: Shell masses (kg)
+        cumulative_masses: cumulative_masses[k] is the mass of the k
+            innermost shells (kg), length n_shells + 1
+    """
+    outer_radii: np.ndarray
+    inner_radii: np.ndarray
+    densities: np.ndarray
+    names: Tuple[str, ...] = ()
+    material_types: Tuple[str, ...] = ()
+    volumes: np.ndarray = field(init=False, repr=False)
+    masses: np.ndarray = field(init=False, repr=False)
+    cumulative_masses: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Normalize arrays and compute cached volumes and masses."""
+        outer = np.ascontiguousarray(self.outer_radii, dtype=np.float64)
+        inner = np.ascontiguousarray(self.inner_radii, dtype=np.float64)
+        density = np.ascontiguousarray(self.densities, dtype=np.float64)
+
+        if not (outer.ndim == inner.ndim == density.ndim == 1):
+            raise ValueError("Shell table columns must be one-dimensional")
+        if not (len(outer) == len(inner) == len(density)):
+            raise ValueError("Shell table columns must have the same length")
+        if np.any(outer <= inner):
+            raise ValueError("Outer radii must be > inner radii")
+        if np.any(inner < 0):
+            raise ValueError("Radii must be positive")
+        if np.any(density <= 0):
+            raise ValueError("Density must be positive")
+
+        # Innermost shell first so boundaries can be binary-searched
+        order = np.argsort(outer, kind='stable')
+        outer, inner, density = outer[order], inner[order], density[order]
+        names = tuple(self.names[i] for i in order) if self.names else ("",) * len(outer)
+        material_types = (tuple(self.material_types[i] for i in order)
+                          if self.material_types else ("unknown",) * len(outer))
+
+        volumes = (4.0/3.0) * np.pi * (outer**3 - inner**3)
+        masses = density * volumes
+        cumulative_masses = np.concatenate(([0.0], np.cumsum(masses)))
+
+        for name, value in [('outer_radii', outer), ('inner_radii', inner),
+                            ('densities', density), ('volumes', volumes),
+                            ('masses', masses), ('cumulative_masses', cumulative_masses)]:
+            value.flags.writeable = False
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, 'names', names)
+        object.__setattr__(self, 'material_types', material_types)
+
+    @classmethod
+    def from_shells(cls, shells: List[SphericalShell]) -> 'ShellTable':
+        """Build a shell table from a list of SphericalShell objects."""
+        return cls(
+            outer_radii=[shell.outer_radius for shell in shells],
+            inner_radii=[shell.inner_radius for shell in shells],
+            densities=[shell.density for shell in shells],
+            names=tuple(shell.name for shell in shells),
+            material_types=tuple(shell.material_type for shell in shells)
+        )
+
+    def to_shells(self) -> List[SphericalShell]:
+        """Expand the table into SphericalShell objects (outermost first)."""
+        return [
+            SphericalShell(
+                outer_radius=float(self.outer_radii[i]),
+                inner_radius=float(self.inner_radii[i]),
+                density=float(self.densities[i]),
+                name=self.names[i],
+                material_type=self.material_types[i]
+            )
+            for i in reversed(range(len(self)))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.outer_radii)
+
+    @property
+    def total_mass(self) -> float:
+        """Total mass of all shells in kg."""
+        return float(self.cumulative_masses[-1])
+
+    @property
+    def content_hash(self) -> str:
+        """Digest of radii and densities, computed once (the table is immutable)."""
+        digest = self.__dict__.get('_content_hash')
+        if digest is None:
+            h = hashlib.blake2b(digest_size=16)
+            for column in (self.outer_radii, self.inner_radii, self.densities):
+                h.update(column.tobytes())
+            digest = h.hexdigest()
+            object.__setattr__(self, '_content_hash', digest)
+        return digest
+
+    @property
+    def moment_of_inertia(self) -> float:
+        """Polar moment of inertia of all shells, Σ 8π/15·ρ·(b⁵ - a⁵), in kg·m²."""
+        return float(np.sum((8.0/15.0) * np.pi * self.densities *
+                            (self.outer_radii**5 - self.inner_radii**5)))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the numeric columns in bytes."""
+        return sum(a.nbytes for a in (self.outer_radii, self.inner_radii, self.densities,
+                                      self.volumes, self.masses, self.cumulative_masses))
+
+    def enclosed_mass(self, radii: np.ndarray) -> np.ndarray:
+        """
+        Mass enclosed within each radius.
+
+        Fully enclosed shells come from cumulative_masses through a binary
+        search over the outer boundaries; only the shell containing the
+        radius is integrated partially. Shells are assumed non-overlapping.
+
+        Args:
+            radii: Distances from center (m), any shape
+
+        Returns:
+            Enclosed mass (kg) with the same shape as radii
+        """
+        radii = np.asarray(radii, dtype=np.float64)
+        r = radii.ravel()
+
+        # Number of shells lying completely inside each radius
+        n_enclosed = np.searchsorted(self.outer_radii, r, side='right')
+        enclosed = self.cumulative_masses[n_enclosed]
+
+        # Partial contribution of the shell that contains the radius
+        partial = n_enclosed < len(self)
+        k = n_enclosed[partial]
+        r_part = r[partial]
+        r_in = self.inner_radii[k]
+        r_out = self.outer_radii[k]
+        volume_fraction = np.where(
+            r_part > r_in,
+            (r_part**3 - r_in**3) / (r_out**3 - r_in**3),
+            0.0
+        )
+        enclosed[partial] += self.masses[k] * volume_fraction
+
+        return enclosed.reshape(radii.shape)
+
+    def pressure(self, radii: np.ndarray, central_mass: float = 0.0) -> np.ndarray:
+        """
+        Hydrostatic pressure at each radius, zero at the outer surface.
+
+        P(r) = ∫_r^R ρ(s)·g(s) ds has a closed form inside a constant-density
+        shell, so whole-shell integrals are accumulated once from the surface
+        inwards and only the shell containing each radius is integrated
+        partially. Pressure is constant across gaps between shells; there is
+        no material (and no pressure) in the cavity or above the surface.
+
+        Args:
+            radii: Distances from center (m), any shape
+            central_mass: Optional point mass at the center (kg), e.g. a central sun
+
+        Returns:
+            Pressure (Pa) with the same shape as radii
+        """
+        radii = np.asarray(radii, dtype=np.float64)
+        r = radii.ravel()
+
+        def shell_integral(k, lower):
+            # ∫_lower^b ρ·G·(M_below + M_c + 4/3·π·ρ·(s³ - a³))/s² ds
+            a, b, rho = self.inner_radii[k], self.outer_radii[k], self.densities[k]
+            point_mass = self.cumulative_masses[k] + central_mass - (4.0/3.0) * np.pi * rho * a**3
+            # A solid innermost shell has no point mass, and its 1/lower term is 0·∞ at the center
+            with np.errstate(divide='ignore', invalid='ignore'):
+                point_term = np.where(point_mass != 0, point_mass * (1.0/lower - 1.0/b), 0.0)
+            return CONSTANTS.G * rho * (point_term + (2.0/3.0) * np.pi * rho * (b**2 - lower**2))
+
+        shells = np.arange(len(self))
+        full = shell_integral(shells, self.inner_radii)
+        # Pressure at the top of each shell: everything above it
+        pressure_top = np.concatenate((np.cumsum(full[::-1])[::-1][1:], [0.0]))
+
+        inside = (r >= self.inner_radii[0]) & (r <= self.outer_radii[-1])
+        k = np.minimum(np.searchsorted(self.outer_radii, r, side='left'), len(self) - 1)
+        lower = np.clip(r, self.inner_radii[k], self.outer_radii[k])
+        pressure = np.where(inside, pressure_top[k] + shell_integral(k, lower), 0.0)
+
+        return pressure.reshape(radii.shape)
+
+@dataclass(init=False)
 class ModelConfiguration:
-    """Complete configuration for a hollow Earth model."""
-    shells: List[SphericalShell]
+    """
+    Complete configuration for a hollow Earth model.
+
+    The ShellTable is the only stored copy of the shell stack. Passing
+    SphericalShell objects converts them to a table; the ``shells`` list
+    is rebuilt from the table on first access and kept so in-place edits
+    can be applied with invalidate_cache().
+
+    A central sun is part of the planet: ``total_mass`` and
+    ``surface_gravity`` count it, ``shell_mass`` does not. Gravity and
+    pressure profiles are those of the shells, with the sun added as a
+    point mass where it applies.
+    """
     central_hollow_radius: float
+    shell_mass: Optional[float] = None
     total_mass: Optional[float] = None
     surface_gravity: Optional[float] = None
     central_sun: Optional[Dict] = None
-    
+    density_profile: Optional['RadialDensityProfile'] = field(default=None, repr=False)
+    shell_table: ShellTable = field(default=None, repr=False, compare=False)
+
+    def __init__(self, shells: Optional[List[SphericalShell]] = None,
+                 central_hollow_radius: Optional[float] = None,
+                 total_mass: Optional[float] = None,
+                 surface_gravity: Optional[float] = None,
+                 central_sun: Optional[Dict] = None,
+                 density_profile: Optional['RadialDensityProfile'] = None,
+                 shell_table: Optional[ShellTable] = None):
+        if (shells is None) == (shell_table is None):
+            raise ValueError("Pass exactly one of shells or shell_table")
+        if shell_table is None:
+            if not shells:
+                raise ValueError("Configuration must contain at least one shell")
+            shell_table = ShellTable.from_shells(shells)
+        if central_hollow_radius is None:
+            central_hollow_radius = float(shell_table.inner_radii[0]) if len(shell_table) else 0.0
+        self.shell_table = shell_table
+        self.central_hollow_radius = central_hollow_radius
+        self.shell_mass = None
+        self.total_mass = total_mass
+        self.surface_gravity = surface_gravity
+        self.central_sun = central_sun
+        self.density_profile = density_profile
+        self._shells = None
+        self.__post_init__()
+
     def __post_init__(self):
         """Validate and compute derived properties."""
         self._validate_configuration()
+        self.shell_mass = self.calculate_shell_mass()
         self.total_mass = self.calculate_total_mass()
         self.surface_gravity = self.calculate_surface_gravity()
+
+    @classmethod
+    def from_shell_table(cls, table: ShellTable,
+                         central_hollow_radius: Optional[float] = None,
+                         central_sun: Optional[Dict] = None) -> 'ModelConfiguration':
+        """
+        Build a configuration from a ShellTable.
+
+        Args:
+            table: Shell table to use as-is
+            central_hollow_radius: Cavity radius (default: innermost inner radius)
+            central_sun: Optional central sun parameters
+
+        Returns:
+            ModelConfiguration backed by the table
+        """
+        return cls(shell_table=table, central_hollow_radius=central_hollow_radius,
+                   central_sun=central_sun)
+
+    @classmethod
+    def from_density_profile(cls, profile: 'RadialDensityProfile',
+                             central_sun: Optional[Dict] = None) -> 'ModelConfiguration':
+        """
+        Build a configuration from a continuous RadialDensityProfile.
+
+        The shells are the profile's layers at their mean density (same
+        layer masses); gravity queries use the continuous profile itself.
+
+        Args:
+            profile: Radial density profile
+            central_sun: Optional central sun parameters
+
+        Returns:
+            ModelConfiguration carrying the profile
+        """
+        return cls(
+            shell_table=profile.to_shell_table(),
+            central_hollow_radius=profile.inner_radius,
+            central_sun=central_sun,
+            density_profile=profile
+        )
+
+    @property
+    def shells(self) -> List[SphericalShell]:
+        """SphericalShell objects (outermost first), expanded from the table on first access."""
+        if self._shells is None:
+            self._shells = self.shell_table.to_shells()
+        return self._shells
+
+    def invalidate_cache(self):
+        """
+        Apply in-place edits of the shells or central sun and recompute derived state.
+
+        Rebuilds the shell table from the shells (if they were expanded),
+        re-validates and recomputes the masses and surface gravity. Use
+        HollowEarthModel.invalidate_cache(config) to also drop cached results.
+        """
+        if self._shells is not None:
+            self.shell_table = ShellTable.from_shells(self._shells)
+            self._shells = None
+        self.__post_init__()
+
+    def enclosed_mass(self, radii: np.ndarray) -> np.ndarray:
+        """Mass enclosed within each radius, from the density profile if set, else the shells."""
+        source = self.density_profile if self.density_profile is not None else self.shell_table
+        return source.enclosed_mass(radii)
     
     def _validate_configuration(self):
-        """Ensure shells are properly ordered and non-overlapping."""
-        if not self.shells:
+        """Ensure shells are non-overlapping and enclose the central hollow."""
+        table = self.shell_table
+        if not len(table):
             raise ValueError("Configuration must contain at least one shell")
         
-        # Sort shells by outer radius (descending)
-        self.shells.sort(key=lambda s: s.outer_radius, reverse=True)
-        
-        # Check for overlaps and gaps
-        for i in range(len(self.shells) - 1):
-            if self.shells[i].inner_radius != self.shells[i+1].outer_radius:
-                warnings.warn(f"Gap or overlap between shells {i} and {i+1}")
+        # Check for overlaps and gaps (shells numbered outermost first)
+        for j in np.flatnonzero(table.inner_radii[1:] != table.outer_radii[:-1]):
+            i = len(table) - 2 - j
+            warnings.warn(f"Gap or overlap between shells {i} and {i+1}")
         
         # Check central hollow
-        if self.shells and self.shells[-1].inner_radius != self.central_hollow_radius:
-            if self.shells[-1].inner_radius < self.central_hollow_radius:
-                raise ValueError("Central hollow radius cannot exceed innermost shell")
+        if table.inner_radii[0] < self.central_hollow_radius:
+            raise ValueError("Central hollow radius cannot exceed innermost shell")
     
-    def calculate_total_mass(self) -> float:
+    def calculate_shell_mass(self) -> float:
         """Calculate total mass of all shells."""
-        return sum(shell.mass for shell in self.shells)
+        return self.shell_table.total_mass
+    
+    def calculate_total_mass(self) -> float:
+        """Calculate total mass: shells plus central sun."""
+        sun_mass = self.central_sun['mass'] if self.central_sun else 0.0
+        return self.calculate_shell_mass() + sun_mass
     
     def calculate_surface_gravity(self) -> float:
-        """Calculate surface gravity."""
+        """Calculate surface gravity of the total mass."""
         return CONSTANTS.G * self.total_mass / (CONSTANTS.R_EARTH**2)
 
 # ============================================================================
@@ -325,21 +735,111 @@ class HollowEarthModel:
     physical conservation laws.
     """
     
-    def __init__(self, validate_physics: bool = True):
+    # Search bounds of the mass optimizers
+    MASS_OPTIMIZATION_BOUNDS = [
+        (7000.0, 20000.0),  # Dense shell density (kg/m³)
+        (50e3, 500e3)       # Inner shell thickness (m)
+    ]
+    
+    # Additional search bounds of the gravity balance optimizer
+    GRAVITY_BALANCE_BOUNDS = {
+        'outer_shell_thickness': (50e3, 2000e3),   # m
+        'dense_shell_thickness': (800e3, 5000e3),  # m
+        'sun_radius': (50e3, 500e3)                # m
+    }
+    
+    # Structural limits of validate_physical_constraints
+    MIN_CAVITY_RADIUS = 1000e3        # m
+    MIN_DENSE_SHELL_DENSITY = 8000.0  # kg/m³
+    MIN_DENSE_MASS_FRACTION = 0.7     # of the shell mass
+    
+    # Gap between central sun and cavity wall (m)
+    SUN_SAFETY_MARGIN = 200e3
+    
+    def __init__(self, validate_physics: bool = True, cache_size: int = 1024,
+                 result_store=None):
         """
         Initialize the hollow Earth model.
         
         Args:
             validate_physics: Whether to enforce physical validation
+            cache_size: Maximum number of cached results (0 disables caching)
+            result_store: Optional persistent ResultStore consulted by the optimizers
         """
         self.validate_physics = validate_physics
         self.constants = CONSTANTS
-        self._cached_results = {}
+        self.result_store = result_store
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cached_results = OrderedDict()
+        self.last_optimization = None
         
         logger.info("HollowEarthModel initialized")
         logger.info(f"Earth mass: {self.constants.M_EARTH:.3e} kg")
         logger.info(f"Earth radius: {self.constants.R_EARTH/1000:.1f} km")
     
+    # ------------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------------
+    
+    def _config_key(self, config: ModelConfiguration) -> Tuple:
+        """Content key of a configuration: shell table digest plus cavity and sun."""
+        sun_key = json.dumps(config.central_sun, sort_keys=True, default=str) if config.central_sun else None
+        profile_key = config.density_profile.content_hash if config.density_profile is not None else None
+        return (config.shell_table.content_hash, float(config.central_hollow_radius),
+                config.total_mass, sun_key, profile_key)
+    
+    def _cached(self, key: Tuple, compute):
+        """Return the cached result for key, computing and storing it on a miss (LRU)."""
+        if self.cache_size <= 0:
+            return compute()
+        
+        if key in self._cached_results:
+            self._cached_results.move_to_end(key)
+            self.cache_hits += 1
+            value = self._cached_results[key]
+        else:
+            self.cache_misses += 1
+            value = compute()
+            self._cached_results[key] = value
+            while len(self._cached_results) > self.cache_size:
+                self._cached_results.popitem(last=False)
+        
+        # Callers may modify returned dicts/arrays; never hand out the cached object
+        return copy.deepcopy(value)
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Cache statistics: hits, misses, current size and maximum size."""
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self._cached_results),
+            'max_size': self.cache_size
+        }
+    
+    def invalidate_cache(self, config: Optional[ModelConfiguration] = None):
+        """
+        Drop cached results.
+        
+        Call with the configuration after mutating it in place: entries for
+        its previous contents are removed and its derived state is rebuilt.
+        
+        Args:
+            config: Configuration whose results to drop (default: clear everything)
+        """
+        if config is None:
+            self._cached_results.clear()
+            return
+        
+        digest = config.shell_table.content_hash
+        stale = [key for key in self._cached_results
+                 if any(isinstance(part, tuple) and part and part[0] == digest for part in key)]
+        for key in stale:
+            del self._cached_results[key]
+        
+        config.invalidate_cache()
+    
     def create_standard_earth_model(self) -> ModelConfiguration:
         """
         Create a standard (solid) Earth model for comparison.
@@ -498,15 +998,16 @@ class HollowEarthModel:
         sun_density = required_sun_mass / sun_volume
         
         # Distance from surface for comfort
-        safe_distance = cavity_radius - sun_radius - 200e3  # 200km safety margin
+        safe_distance = cavity_radius - sun_radius - self.SUN_SAFETY_MARGIN
         
         # Calculate interior gravity (shell contribution + sun contribution)
         g_interior_from_shells = self.calculate_gravity_at_radius(cavity_radius, config)  # ~0
         g_interior_from_sun = CONSTANTS.G * required_sun_mass / (cavity_radius**2)        # ~9.8
         g_interior_total = g_interior_from_shells + g_interior_from_sun                   # ~9.8
         
-        # Exterior gravity remains unchanged (sun is inside)
-        g_surface_original = CONSTANTS.G * config.total_mass / (CONSTANTS.R_EARTH**2)
+        # Exterior gravity: the shells plus the sun as a point mass
+        g_surface_original = CONSTANTS.G * config.shell_mass / (CONSTANTS.R_EARTH**2)
+        g_surface_from_sun = CONSTANTS.G * required_sun_mass / (CONSTANTS.R_EARTH**2)
         
         # Cold sun properties (minimal heat/light)
         sun_temperature = 2500  # K - Very cool red dwarf
@@ -521,7 +1022,8 @@ class HollowEarthModel:
         logger.info(f"   Luminosity: {sun_luminosity_fraction:.1%} of normal sun")
         logger.info(f"")
         logger.info(f"🎯 GRAVITY EFFECTS:")
-        logger.info(f"   Exterior gravity: {g_surface_original:.3f} m/s² (UNCHANGED - sun is inside)")
+        logger.info(f"   Exterior gravity (shells): {g_surface_original:.3f} m/s²")
+        logger.info(f"   Exterior gravity (with sun): {g_surface_original + g_surface_from_sun:.3f} m/s²")
         logger.info(f"   Interior gravity (shells): {g_interior_from_shells:.3f} m/s² (nearly zero)")
         logger.info(f"   Interior gravity (sun): {g_interior_from_sun:.3f} m/s² (provides walking gravity)")
         logger.info(f"   Interior gravity (TOTAL): {g_interior_total:.3f} m/s² (PERFECT!)")
@@ -542,8 +1044,10 @@ class HollowEarthModel:
             'distance_to_surface': safe_distance,
             'estimated_surface_temperature': estimated_surface_temp,
             'gravity_contribution_interior': g_interior_from_sun,
-            'gravity_contribution_surface': 0.0  # Sun doesn't affect exterior
+            'gravity_contribution_surface': g_surface_from_sun
         }
+        # The sun now counts towards total_mass and surface_gravity
+        config.invalidate_cache()
         
         return config
     
@@ -551,6 +1055,9 @@ class HollowEarthModel:
         """
         Calculate gravitational acceleration at given radius.
         
+        This is the field of the shells; a central sun adds G·M_sun/r²
+        outside its radius (see ModelConfiguration).
+        
         Args:
             radius: Distance from center (m)
             config: Model configuration
@@ -558,44 +1065,98 @@ class HollowEarthModel:
         Returns:
             Gravitational acceleration (m/s²)
         """
+        return self._cached(('gravity_at_radius', self._config_key(config), float(radius)),
+                            lambda: self._compute_gravity_at_radius(radius, config))
+    
+    def _compute_gravity_at_radius(self, radius: float, config: ModelConfiguration) -> float:
+        """Uncached body of calculate_gravity_at_radius."""
         if radius <= 0:
             return 0.0
         
         # Calculate enclosed mass
-        enclosed_mass = 0.0
-        
-        for shell in config.shells:
-            if radius >= shell.outer_radius:
-                # Outside shell - all mass contributes
-                enclosed_mass += shell.mass
-            elif radius > shell.inner_radius:
-                # Inside shell - partial mass contributes
-                r_out = shell.outer_radius
-                r_in = shell.inner_radius
-                
-                # Fraction of shell mass within radius
-                volume_fraction = (radius**3 - r_in**3) / (r_out**3 - r_in**3)
-                enclosed_mass += shell.mass * volume_fraction
-            # else: radius < inner_radius, no contribution
+        enclosed_mass = float(config.enclosed_mass(radius))
         
         return CONSTANTS.G * enclosed_mass / (radius**2)
-    
-    def calculate_gravity_profile(self, config: ModelConfiguration, 
+
+    def calculate_gravity_at_radii(self, radii: np.ndarray,
+                                   config: ModelConfiguration) -> np.ndarray:
+        """
+        Calculate gravitational acceleration at many radii in one pass.
+
+        Array equivalent of calculate_gravity_at_radius. Enclosed masses come
+        from the configuration's ShellTable (or its RadialDensityProfile),
+        which accumulates shell masses once and locates every radius with a
+        binary search over the sorted boundaries, so the cost is
+        O(points·log(shells)) instead of O(points·shells).
+
+        Args:
+            radii: Distances from center (m), any shape
+            config: Model configuration
+
+        Returns:
+            Gravitational acceleration (m/s²) with the same shape as radii
+        """
+        radii = np.asarray(radii, dtype=np.float64)
+        enclosed_mass = config.enclosed_mass(radii)
+
+        gravity = np.zeros_like(radii)
+        positive = radii > 0
+        gravity[positive] = CONSTANTS.G * enclosed_mass[positive] / radii[positive]**2
+
+        return gravity
+
+    def calculate_gravity_profile(self, config: ModelConfiguration,
                                   n_points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate gravity profile from center to surface.
-        
+        Calculate gravity profile of the shells from center to surface.
+
         Args:
             config: Model configuration
             n_points: Number of calculation points
-            
+
         Returns:
             Tuple of (radii, gravity_values) arrays
         """
+        return self._cached(('gravity_profile', self._config_key(config), int(n_points)),
+                            lambda: self._compute_gravity_profile(config, n_points))
+
+    def _compute_gravity_profile(self, config: ModelConfiguration,
+                                 n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Uncached body of calculate_gravity_profile."""
         radii = np.linspace(config.central_hollow_radius, CONSTANTS.R_EARTH, n_points)
-        gravity = np.array([self.calculate_gravity_at_radius(r, config) for r in radii])
-        
+        gravity = self.calculate_gravity_at_radii(radii, config)
+
         return radii, gravity
+
+    def calculate_pressure_profile(self, config: ModelConfiguration,
+                                   n_points: int = 1000) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate hydrostatic pressure from the cavity wall to the surface.
+
+        Pressure is the integral of ρ·g from the surface down, evaluated in
+        closed form on the shell table (or the continuous density profile),
+        with the central sun's mass adding to g when present.
+
+        Args:
+            config: Model configuration
+            n_points: Number of calculation points
+
+        Returns:
+            Tuple of (radii, pressure_values) arrays, pressure in Pa
+        """
+        return self._cached(('pressure_profile', self._config_key(config), int(n_points)),
+                            lambda: self._compute_pressure_profile(config, n_points))
+
+    def _compute_pressure_profile(self, config: ModelConfiguration,
+                                  n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Uncached body of calculate_pressure_profile."""
+        radii = np.linspace(config.central_hollow_radius, config.shell_table.outer_radii[-1], n_points)
+        central_mass = config.central_sun['mass'] if config.central_sun else 0.0
+
+        source = config.density_profile if config.density_profile is not None else config.shell_table
+        pressure = source.pressure(radii, central_mass=central_mass)
+
+        return radii, pressure
     
     def optimize_for_mass_conservation(self, 
                                        target_mass: float = None,
@@ -603,76 +1164,477 @@ class HollowEarthModel:
         """
         Optimize shell parameters to match target mass.
         
+        Total mass is closed-form in the free parameters (dense shell density
+        and inner shell thickness), and linear in the density, so the target
+        is first solved directly: density at the initial thickness, then
+        thickness at a clamped density. Only if neither root lies inside the
+        bounds does L-BFGS-B run, on a pure-numeric objective with an exact
+        analytic gradient. No configurations are built during the search.
+        When a result_store is configured it is consulted first. Evaluation
+        count and wall time are logged and stored in self.last_optimization.
+        
         Args:
             target_mass: Target total mass (default: Earth's mass)
-            initial_config: Initial configuration to optimize
+            initial_config: Configuration returned if the search fails
+                (default: create_hollow_earth_model(), built only then)
             
         Returns:
             Optimized configuration
         """
+        start_time = time.perf_counter()
+        
         if target_mass is None:
             target_mass = CONSTANTS.M_EARTH
         
-        if initial_config is None:
-            initial_config = self.create_hollow_earth_model()
+        # Consult the persistent store before searching
+        store_params = {'target_mass': float(target_mass)}
+        solution = None
+        if self.result_store is not None:
+            solution = self.result_store.get('optimize_for_mass_conservation', store_params)
+        if solution is None:
+            solution = self._search_mass_parameters(target_mass)
+            if self.result_store is not None:
+                self.result_store.put('optimize_for_mass_conservation', store_params, solution)
+        else:
+            solution = dict(solution, method='result-store', evaluations=0)
+        
+        method = solution['method']
+        evaluations = solution['evaluations']
+        optimal_density = solution['dense_shell_density']
+        optimal_thickness = solution['inner_shell_thickness']
+        
+        wall_time = time.perf_counter() - start_time
+        self.last_optimization = {
+            'method': method,
+            'success': solution['success'],
+            'evaluations': evaluations,
+            'wall_time_s': wall_time
+        }
+        
+        if solution['success']:
+            optimized_config = self.create_hollow_earth_model(
+                dense_shell_density=optimal_density,
+                inner_shell_thickness=optimal_thickness
+            )
+            
+            logger.info(f"Mass optimization successful:")
+            logger.info(f"  Target mass: {target_mass:.3e} kg")
+            logger.info(f"  Achieved mass: {optimized_config.total_mass:.3e} kg")
+            logger.info(f"  Error: {abs(optimized_config.total_mass - target_mass)/target_mass*100:.2f}%")
+            logger.info(f"  Method: {method} ({evaluations} evaluations, {wall_time*1e3:.2f} ms)")
+            
+            return optimized_config
+        else:
+            logger.error(f"Mass optimization failed: {solution['message']}")
+            return initial_config if initial_config is not None else self.create_hollow_earth_model()
+    
+    def _search_mass_parameters(self, target_mass: float) -> Dict:
+        """
+        Search (dense density, inner thickness) for a target mass without building configurations.
+        
+        Args:
+            target_mass: Target total mass (kg)
+            
+        Returns:
+            Dictionary with the solution, success flag, message, method and evaluation count
+        """
+        # Fixed geometry (create_hollow_earth_model defaults)
+        outer_crust_mass, dense_volume, inner_crust_mass, r_dense_inner = self._shell_mass_terms()
+        evaluations = 0
+        
+        def total_mass(dense_density, inner_thickness):
+            """Closed-form total mass (kg)."""
+            nonlocal evaluations
+            evaluations += 1
+            return outer_crust_mass + dense_density * dense_volume + inner_crust_mass(inner_thickness)
         
         def objective_function(params):
             """
-            Objective function for optimization.
+            Squared relative mass error and its analytic gradient.
             
-            params: [dense_shell_density, inner_shell_thickness]
+            params: [dense_shell_density, inner_shell_thickness] / param_scale
             """
-            try:
-                dense_density, inner_thickness = params
-                
-                # Create configuration with new parameters
-                config = self.create_hollow_earth_model(
-                    dense_shell_density=dense_density,
-                    inner_shell_thickness=inner_thickness
-                )
-                
-                # Calculate mass error
-                mass_error = abs(config.total_mass - target_mass) / target_mass
-                
-                return mass_error
+            dense_density, inner_thickness = params * param_scale
+            r_hollow = r_dense_inner - inner_thickness
+            
+            mass_error = (total_mass(dense_density, inner_thickness) - target_mass) / target_mass
             
-            except Exception as e:
-                logger.warning(f"Optimization step failed: {e}")
-                return 1e6  # Large penalty for invalid configurations
+            # dM/dρ = dense_volume, dM/dt = RHO_CRUST·4π·r_hollow²
+            dmass = np.array([dense_volume, CONSTANTS.RHO_CRUST * 4.0 * np.pi * r_hollow**2])
+            
+            return mass_error**2, 2.0 * mass_error * dmass * param_scale / target_mass
         
         # Initial parameters
         initial_params = [11000.0, 150e3]  # density, thickness
         
         # Bounds
-        bounds = [
-            (7000.0, 20000.0),  # Dense shell density (kg/m³)
-            (50e3, 500e3)       # Inner shell thickness (m)
-        ]
+        bounds = self.MASS_OPTIMIZATION_BOUNDS
+        
+        # Optimizer works on O(1) variables
+        param_scale = np.array(initial_params)
         
-        # Optimize
-        result = scipy.optimize.minimize(
-            objective_function,
-            initial_params,
-            bounds=bounds,
-            method='L-BFGS-B'
+        # Direct root solve: density at the initial thickness, else thickness at clamped density
+        dense_density, inner_thickness, feasible = (
+            float(value) for value in self._solve_mass_parameters(target_mass, initial_params[1], bounds)
         )
+        evaluations += 1
+        method = 'root-density' if inner_thickness == initial_params[1] else 'root-thickness'
         
-        if result.success:
-            optimal_density, optimal_thickness = result.x
-            optimized_config = self.create_hollow_earth_model(
-                dense_shell_density=optimal_density,
-                inner_shell_thickness=optimal_thickness
+        if feasible:
+            success = True
+            message = 'Direct root solve'
+            optimal_density, optimal_thickness = dense_density, inner_thickness
+        else:
+            # Target unreachable by a root inside the bounds: closest feasible point
+            result = scipy.optimize.minimize(
+                objective_function,
+                np.ones(2),
+                jac=True,
+                bounds=[(low / scale, high / scale) for (low, high), scale in zip(bounds, param_scale)],
+                method='L-BFGS-B'
             )
+            method = 'L-BFGS-B'
+            success = result.success
+            message = result.message
+            optimal_density, optimal_thickness = result.x * param_scale
+        
+        return {
+            'dense_shell_density': float(optimal_density),
+            'inner_shell_thickness': float(optimal_thickness),
+            'success': bool(success),
+            'message': str(message),
+            'method': method,
+            'evaluations': evaluations
+        }
+    
+    @staticmethod
+    def _shell_mass_terms(outer_shell_thickness=100e3, dense_shell_thickness=1800e3):
+        """
+        Closed-form shell mass of create_hollow_earth_model.
+        
+        M(ρ, t) = outer_crust_mass + ρ·dense_volume + inner_crust_mass(t) for
+        dense shell density ρ and inner shell thickness t. Shared by the mass
+        and gravity balance solvers; vectorized over all arguments.
+        
+        Args:
+            outer_shell_thickness: Outer crust thickness (m)
+            dense_shell_thickness: Dense layer thickness (m)
             
-            logger.info(f"Mass optimization successful:")
-            logger.info(f"  Target mass: {target_mass:.3e} kg")
-            logger.info(f"  Achieved mass: {optimized_config.total_mass:.3e} kg")
-            logger.info(f"  Error: {abs(optimized_config.total_mass - target_mass)/target_mass*100:.2f}%")
+        Returns:
+            Tuple of (outer_crust_mass, dense_volume, inner_crust_mass,
+            r_dense_inner), where inner_crust_mass maps an inner shell
+            thickness to its mass (kg)
+        """
+        four_thirds_pi = (4.0/3.0) * np.pi
+        r_surface = CONSTANTS.R_EARTH
+        r_dense_outer = r_surface - outer_shell_thickness
+        r_dense_inner = r_dense_outer - dense_shell_thickness
+        outer_crust_mass = CONSTANTS.RHO_CRUST * four_thirds_pi * (r_surface**3 - r_dense_outer**3)
+        dense_volume = four_thirds_pi * (r_dense_outer**3 - r_dense_inner**3)
+        
+        def inner_crust_mass(thickness):
+            """Inner crust mass (kg) for an inner shell thickness."""
+            return CONSTANTS.RHO_CRUST * four_thirds_pi * (r_dense_inner**3 - (r_dense_inner - thickness)**3)
+        
+        return outer_crust_mass, dense_volume, inner_crust_mass, r_dense_inner
+    
+    def _solve_mass_parameters(self, target_mass, inner_shell_thickness, bounds,
+                               outer_shell_thickness: float = 100e3,
+                               dense_shell_thickness: float = 1800e3,
+                               sun_mass_coefficient=0.0):
+        """
+        Closed-form shell parameters reaching a target mass.
+        
+        Total mass is linear in the dense shell density, so the density is
+        solved at the given inner shell thickness. Where it falls outside its
+        bounds it is clamped and the inner-crust cubic is solved for the
+        thickness instead. With a central sun of mass
+        sun_mass_coefficient·cavity_radius² counted in the total, that cubic
+        gains a quadratic term and is solved by bisection between the
+        thickness bounds. Vectorized over all array arguments.
+        
+        Args:
+            target_mass: Target total mass (kg), scalar or array
+            inner_shell_thickness: Preferred inner shell thickness (m)
+            bounds: [(density_min, density_max), (thickness_min, thickness_max)]
+            outer_shell_thickness: Outer crust thickness (m), scalar or array
+            dense_shell_thickness: Dense layer thickness (m), scalar or array
+            sun_mass_coefficient: Central sun mass per squared cavity radius
+                (kg/m²), scalar or array; 0 for no sun
             
-            return optimized_config
+        Returns:
+            Tuple of (dense_density, inner_thickness, feasible) arrays; infeasible
+            entries are clipped to the bounds
+        """
+        (density_min, density_max), (thickness_min, thickness_max) = bounds
+        target_mass, inner_thickness, outer_shell_thickness, dense_shell_thickness, sun_mass_coefficient = (
+            np.broadcast_arrays(*(np.asarray(value, dtype=np.float64)
+                                  for value in (target_mass, inner_shell_thickness, outer_shell_thickness,
+                                                dense_shell_thickness, sun_mass_coefficient)))
+        )
+        
+        outer_crust_mass, dense_volume, inner_crust_mass, r_dense_inner = self._shell_mass_terms(
+            outer_shell_thickness, dense_shell_thickness)
+        
+        def cavity_mass(thickness):
+            """Inner crust plus central sun mass (kg) for an inner shell thickness."""
+            return inner_crust_mass(thickness) + sun_mass_coefficient * (r_dense_inner - thickness)**2
+        
+        dense_density = (target_mass - outer_crust_mass - cavity_mass(inner_thickness)) / dense_volume
+        
+        # Clamp density and solve the inner crust cubic for thickness
+        clamped = (dense_density < density_min) | (dense_density > density_max)
+        dense_density = np.clip(dense_density, density_min, density_max)
+        remaining_mass = target_mass - outer_crust_mass - dense_density * dense_volume
+        r_hollow_cubed = r_dense_inner**3 - remaining_mass / (CONSTANTS.RHO_CRUST * (4.0/3.0) * np.pi)
+        solved_thickness = r_dense_inner - np.cbrt(r_hollow_cubed)
+        
+        with_sun = clamped & (sun_mass_coefficient > 0)
+        bracketed = np.ones_like(clamped)
+        if np.any(with_sun):
+            low = np.full(target_mass.shape, float(thickness_min))
+            high = np.full(target_mass.shape, float(thickness_max))
+            residual_low = cavity_mass(low) - remaining_mass
+            residual_high = cavity_mass(high) - remaining_mass
+            bracketed = np.sign(residual_low) != np.sign(residual_high)
+            # No root between the bounds: keep the bound closest to the target
+            closest = np.where(np.abs(residual_low) <= np.abs(residual_high), low, high)
+            for _ in range(64):
+                mid = 0.5 * (low + high)
+                residual_mid = cavity_mass(mid) - remaining_mass
+                same_side = np.sign(residual_mid) == np.sign(residual_low)
+                low = np.where(same_side, mid, low)
+                residual_low = np.where(same_side, residual_mid, residual_low)
+                high = np.where(same_side, high, mid)
+            solved_thickness = np.where(with_sun, np.where(bracketed, 0.5 * (low + high), closest),
+                                        solved_thickness)
+            bracketed = bracketed | ~with_sun
+        inner_thickness = np.where(clamped, solved_thickness, inner_thickness)
+        
+        feasible = (inner_thickness >= thickness_min) & (inner_thickness <= thickness_max) & bracketed
+        inner_thickness = np.clip(inner_thickness, thickness_min, thickness_max)
+        
+        return dense_density, inner_thickness, feasible
+    
+    def optimize_gravity_balance_batch(self,
+                                       target_mass=None,
+                                       gravity_ratio=1.0,
+                                       sun_radius=150e3,
+                                       inner_shell_thickness=200e3,
+                                       outer_shell_thickness=100e3,
+                                       dense_shell_thickness=1800e3,
+                                       grid_size: int = 33) -> Dict[str, np.ndarray]:
+        """
+        Solve gravity-balanced configurations for a batch of targets at once.
+        
+        The central sun is part of the planet's mass: exterior gravity is
+        G·target_mass/R², and the shells contribute nothing at the cavity
+        wall, so interior = gravity_ratio × exterior gravity requires
+        M_sun = gravity_ratio·target_mass·(cavity_radius/R)². The cavity
+        radius therefore decides how much mass the shells must carry, and
+        dense shell density and inner thickness alone only reach ratios up to
+        about 0.4 at Earth's mass. Outer and dense shell thicknesses are
+        searched on a grid_size × grid_size grid over GRAVITY_BALANCE_BOUNDS
+        (plus the preferred geometry), with density and inner thickness solved
+        in closed form for each (see _solve_mass_parameters). Of the
+        geometries that reach the target within the bounds and pass the
+        structural limits (MIN_CAVITY_RADIUS, MIN_DENSE_SHELL_DENSITY,
+        MIN_DENSE_MASS_FRACTION), the one closest to the preferred
+        thicknesses is returned. No configurations are built.
+        
+        The sun radius does not enter the balance (outside the sun its
+        gravity is that of a point mass); it is the preferred radius clipped
+        to its bounds and to SUN_SAFETY_MARGIN inside the cavity wall.
+        
+        Args:
+            target_mass: Target total mass including the sun (kg), scalar or array
+                (default: Earth's mass)
+            gravity_ratio: Desired interior/exterior gravity ratio, scalar or array
+            sun_radius: Preferred radius of central sun (m), scalar or array
+            inner_shell_thickness: Preferred inner shell thickness (m)
+            outer_shell_thickness: Preferred outer crust thickness (m)
+            dense_shell_thickness: Preferred dense layer thickness (m)
+            grid_size: Grid points per searched thickness
+            
+        Returns:
+            Dictionary of arrays broadcast over the inputs, including a
+            'feasible' mask. Where no geometry is feasible the preferred one
+            is returned with the closest in-bounds shells, so total_mass may
+            differ from the target.
+        """
+        if target_mass is None:
+            target_mass = CONSTANTS.M_EARTH
+        
+        inputs = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64)
+              for value in (target_mass, gravity_ratio, sun_radius, inner_shell_thickness,
+                            outer_shell_thickness, dense_shell_thickness))
+        )
+        shape = inputs[0].shape
+        # One row per target, one column per candidate geometry
+        target_mass, gravity_ratio, preferred_sun_radius, preferred_inner, preferred_outer, preferred_dense = (
+            value.reshape(-1, 1) for value in inputs
+        )
+        
+        # Candidate geometries: the grid, then the preferred one (last column)
+        outer_bounds = self.GRAVITY_BALANCE_BOUNDS['outer_shell_thickness']
+        dense_bounds = self.GRAVITY_BALANCE_BOUNDS['dense_shell_thickness']
+        sun_min, sun_max = self.GRAVITY_BALANCE_BOUNDS['sun_radius']
+        grid = np.meshgrid(np.linspace(*outer_bounds, grid_size), np.linspace(*dense_bounds, grid_size))
+        n_rows = len(target_mass)
+        outer, dense = (np.hstack((np.broadcast_to(values.ravel(), (n_rows, values.size)), preferred))
+                        for values, preferred in zip(grid, (preferred_outer, preferred_dense)))
+        
+        r_surface = CONSTANTS.R_EARTH
+        sun_mass_coefficient = gravity_ratio * target_mass / r_surface**2
+        dense_density, inner_thickness, mass_feasible = self._solve_mass_parameters(
+            target_mass, preferred_inner, self.MASS_OPTIMIZATION_BOUNDS, outer, dense,
+            sun_mass_coefficient=sun_mass_coefficient
+        )
+        
+        # Geometry and mass of the solved shells
+        outer_crust_mass, dense_volume, inner_crust_mass, r_dense_inner = self._shell_mass_terms(outer, dense)
+        cavity_radius = r_dense_inner - inner_thickness
+        dense_mass = dense_density * dense_volume
+        shell_mass = outer_crust_mass + dense_mass + inner_crust_mass(inner_thickness)
+        sun_radius = np.clip(preferred_sun_radius, sun_min,
+                             np.minimum(sun_max, cavity_radius - self.SUN_SAFETY_MARGIN))
+        
+        feasible = (mass_feasible & (sun_radius >= sun_min) &
+                    (cavity_radius > self.MIN_CAVITY_RADIUS) &
+                    (dense_density > self.MIN_DENSE_SHELL_DENSITY) &
+                    (dense_mass > self.MIN_DENSE_MASS_FRACTION * shell_mass))
+        
+        # Closest feasible geometry to the preferred thicknesses, else the preferred geometry
+        inner_bounds = self.MASS_OPTIMIZATION_BOUNDS[1]
+        distance = sum(((value - preferred) / (high - low))**2 for value, preferred, (low, high) in (
+            (outer, preferred_outer, outer_bounds),
+            (dense, preferred_dense, dense_bounds),
+            (inner_thickness, preferred_inner, inner_bounds)
+        ))
+        choice = np.where(feasible.any(axis=1), np.where(feasible, distance, np.inf).argmin(axis=1),
+                          outer.shape[1] - 1)[:, np.newaxis]
+        
+        def chosen(values):
+            """Value of the chosen candidate for every target, in the input shape."""
+            values = np.broadcast_to(values, outer.shape)
+            return np.take_along_axis(values, choice, axis=1).reshape(shape)
+        
+        cavity_radius = chosen(cavity_radius)
+        shell_mass = chosen(shell_mass)
+        sun_radius = chosen(sun_radius)
+        sun_mass = chosen(sun_mass_coefficient) * cavity_radius**2
+        total_mass = shell_mass + sun_mass
+        
+        # Exterior gravity from shells and sun; interior gravity from the sun only
+        exterior_gravity = CONSTANTS.G * total_mass / r_surface**2
+        interior_gravity = CONSTANTS.G * sun_mass / cavity_radius**2
+        sun_density = sun_mass / ((4.0/3.0) * np.pi * sun_radius**3)
+        
+        return {
+            'dense_shell_density': chosen(dense_density),
+            'outer_shell_thickness': chosen(outer),
+            'dense_shell_thickness': chosen(dense),
+            'inner_shell_thickness': chosen(inner_thickness),
+            'cavity_radius': cavity_radius,
+            'shell_mass': shell_mass,
+            'dense_mass_fraction': chosen(dense_mass) / shell_mass,
+            'total_mass': total_mass,
+            'exterior_gravity': exterior_gravity,
+            'interior_gravity': interior_gravity,
+            'sun_mass': sun_mass,
+            'sun_radius': sun_radius,
+            'sun_density': sun_density,
+            'feasible': chosen(feasible)
+        }
+    
+    def optimize_for_gravity_balance(self,
+                                     target_mass: float = None,
+                                     gravity_ratio: float = 1.0,
+                                     sun_radius: float = 150e3,
+                                     inner_shell_thickness: float = 200e3,
+                                     outer_shell_thickness: float = 100e3,
+                                     dense_shell_thickness: float = 1800e3) -> ModelConfiguration:
+        """
+        Optimize shells and central sun so interior and exterior gravity match.
+        
+        The sun counts towards the total mass and the exterior gravity; its
+        mass is set so that interior gravity equals gravity_ratio times the
+        exterior gravity, and the shell geometry and sun radius are solved
+        for the remaining mass (see optimize_gravity_balance_batch). The
+        result is checked with validate_physical_constraints. When a
+        result_store is configured it is consulted first.
+        
+        Args:
+            target_mass: Target total mass including the sun (default: Earth's mass)
+            gravity_ratio: Desired interior/exterior gravity ratio
+            sun_radius: Preferred radius of central sun (m)
+            inner_shell_thickness: Preferred inner shell thickness (m)
+            outer_shell_thickness: Preferred outer crust thickness (m)
+            dense_shell_thickness: Preferred dense layer thickness (m)
+            
+        Returns:
+            Configuration with central sun
+        """
+        start_time = time.perf_counter()
+        
+        store_params = {
+            'target_mass': float(target_mass if target_mass is not None else CONSTANTS.M_EARTH),
+            'gravity_ratio': float(gravity_ratio),
+            'sun_radius': float(sun_radius),
+            'inner_shell_thickness': float(inner_shell_thickness),
+            'outer_shell_thickness': float(outer_shell_thickness),
+            'dense_shell_thickness': float(dense_shell_thickness)
+        }
+        solution = None
+        if self.result_store is not None:
+            solution = self.result_store.get('optimize_for_gravity_balance', store_params)
+        if solution is None:
+            method = 'closed-form'
+            solution = {key: value.item() for key, value in
+                        self.optimize_gravity_balance_batch(**store_params).items()}
+            if self.result_store is not None:
+                self.result_store.put('optimize_for_gravity_balance', store_params, solution)
+        else:
+            method = 'result-store'
+        
+        config = self.create_hollow_earth_with_central_sun(
+            outer_shell_thickness=solution['outer_shell_thickness'],
+            dense_shell_thickness=solution['dense_shell_thickness'],
+            inner_shell_thickness=solution['inner_shell_thickness'],
+            dense_shell_density=solution['dense_shell_density'],
+            target_interior_gravity=solution['interior_gravity'],
+            sun_radius=solution['sun_radius']
+        )
+        constraints = self.validate_physical_constraints(config)
+        
+        wall_time = time.perf_counter() - start_time
+        self.last_optimization = {
+            'method': method,
+            'success': bool(solution['feasible']),
+            'evaluations': 1 if method == 'closed-form' else 0,
+            'wall_time_s': wall_time
+        }
+        
+        if solution['feasible']:
+            logger.info(f"Gravity balance optimization successful:")
         else:
-            logger.error(f"Mass optimization failed: {result.message}")
-            return initial_config
+            logger.error(f"Gravity balance optimization infeasible: target not reachable within bounds")
+        logger.info(f"  Total mass (shells + sun): {solution['total_mass']:.3e} kg")
+        logger.info(f"  Exterior gravity: {solution['exterior_gravity']:.3f} m/s²")
+        logger.info(f"  Interior gravity: {solution['interior_gravity']:.3f} m/s²")
+        logger.info(f"  Shells: {solution['outer_shell_thickness']/1000:.0f} / "
+                    f"{solution['dense_shell_thickness']/1000:.0f} / "
+                    f"{solution['inner_shell_thickness']/1000:.0f} km, "
+                    f"dense {solution['dense_shell_density']:.0f} kg/m³")
+        logger.info(f"  Sun mass: {solution['sun_mass']:.3e} kg, radius {solution['sun_radius']/1000:.0f} km")
+        logger.info(f"  Time: {wall_time*1e3:.2f} ms")
+        
+        failed = [name for name, passed in constraints.items() if not passed]
+        if failed:
+            logger.warning(f"⚠️  Constraints not satisfied: {', '.join(failed)}")
+        
+        return config
     
     def compare_models(self, model1: ModelConfiguration, model2: ModelConfiguration) -> Dict:
         """
@@ -685,14 +1647,19 @@ class HollowEarthModel:
         Returns:
             Dictionary containing comparison metrics
         """
+        return self._cached(('compare_models', self._config_key(model1), self._config_key(model2)),
+                            lambda: self._compute_compare_models(model1, model2))
+    
+    def _compute_compare_models(self, model1: ModelConfiguration, model2: ModelConfiguration) -> Dict:
+        """Uncached body of compare_models."""
         
         # Calculate key metrics for both models
         g1_surface = self.calculate_gravity_at_radius(CONSTANTS.R_EARTH, model1)
-        cavity1_surface = model1.shells[-1].inner_radius if model1.shells else model1.central_hollow_radius
+        cavity1_surface = float(model1.shell_table.inner_radii[0])
         g1_interior = self.calculate_gravity_at_radius(cavity1_surface, model1)
         
         g2_surface = self.calculate_gravity_at_radius(CONSTANTS.R_EARTH, model2)
-        cavity2_surface = model2.shells[-1].inner_radius if model2.shells else model2.central_hollow_radius
+        cavity2_surface = float(model2.shell_table.inner_radii[0])
         g2_interior = self.calculate_gravity_at_radius(cavity2_surface, model2)
         
         comparison = {
@@ -714,8 +1681,8 @@ class HollowEarthModel:
             'structural_comparison': {
                 'model1_hollow_diameter': model1.central_hollow_radius * 2,
                 'model2_hollow_diameter': model2.central_hollow_radius * 2,
-                'model1_shell_count': len(model1.shells),
-                'model2_shell_count': len(model2.shells)
+                'model1_shell_count': len(model1.shell_table),
+                'model2_shell_count': len(model2.shell_table)
             }
         }
         
@@ -731,14 +1698,20 @@ class HollowEarthModel:
         Returns:
             Dictionary of constraint validation results
         """
+        return self._cached(('physical_constraints', self._config_key(config)),
+                            lambda: self._compute_physical_constraints(config))
+    
+    def _compute_physical_constraints(self, config: ModelConfiguration) -> Dict[str, bool]:
+        """Uncached body of validate_physical_constraints."""
         constraints = {}
+        table = config.shell_table
         
-        # CRITICAL: Mass conservation (within 1%)
+        # CRITICAL: Mass conservation (within 1%); total_mass includes a central sun
         mass_error = abs(config.total_mass - CONSTANTS.M_EARTH) / CONSTANTS.M_EARTH
         constraints['mass_conservation'] = mass_error < 0.01
         
-        # CRITICAL: Surface gravity within Earth range (9.5-10.5 m/s²)
-        surface_g = self.calculate_gravity_at_radius(CONSTANTS.R_EARTH, config)
+        # CRITICAL: Surface gravity within Earth range (9.5-10.5 m/s²), shells plus sun
+        surface_g = config.surface_gravity
         constraints['earth_surface_gravity'] = 9.5 <= surface_g <= 10.5
         
         # Interior gravity - check if central sun exists
@@ -749,7 +1722,7 @@ class HollowEarthModel:
             interior_g = shell_gravity + sun_gravity
         else:
             # Without central sun - only shell gravity
-            cavity_surface_radius = config.shells[-1].inner_radius if config.shells else config.central_hollow_radius
+            cavity_surface_radius = float(table.inner_radii[0]) if len(table) else config.central_hollow_radius
             interior_g = self.calculate_gravity_at_radius(cavity_surface_radius, config)
         
         constraints['reasonable_interior_gravity'] = 8.0 <= interior_g <= 12.0
@@ -758,22 +1731,17 @@ class HollowEarthModel:
         constraints['cavity_inside_earth'] = config.central_hollow_radius < CONSTANTS.R_EARTH
         
         # CRITICAL: Cavity must be substantial (> 1000 km radius for theory viability)
-        constraints['substantial_cavity'] = config.central_hollow_radius > 1000e3
+        constraints['substantial_cavity'] = config.central_hollow_radius > self.MIN_CAVITY_RADIUS
         
         # Basic validations
-        constraints['positive_densities'] = all(shell.density > 0 for shell in config.shells)
+        densities = table.densities
+        constraints['positive_densities'] = bool(np.all(densities > 0))
         
         # Realistic density ranges (1000-20000 kg/m³)
-        constraints['realistic_densities'] = all(
-            1000 <= shell.density <= 20000 for shell in config.shells
-        )
+        constraints['realistic_densities'] = bool(np.all((densities >= 1000) & (densities <= 20000)))
         
-        # Non-overlapping shells
-        constraints['non_overlapping_shells'] = True
-        for i in range(len(config.shells) - 1):
-            if config.shells[i].inner_radius < config.shells[i+1].outer_radius:
-                constraints['non_overlapping_shells'] = False
-                break
+        # Non-overlapping shells (table is ordered innermost first)
+        constraints['non_overlapping_shells'] = bool(np.all(table.inner_radii[1:] >= table.outer_radii[:-1]))
         
         # Gravity balance check (interior vs exterior within 20%)
         if surface_g > 0 and interior_g > 0:
@@ -783,11 +1751,10 @@ class HollowEarthModel:
             constraints['gravity_balance'] = False
         
         # Structural integrity (dense shell must be substantial)
-        dense_shells = [s for s in config.shells if s.density > 8000]
-        if dense_shells:
-            dense_shell = max(dense_shells, key=lambda s: s.mass)
-            mass_fraction = dense_shell.mass / config.total_mass
-            constraints['substantial_dense_shell'] = mass_fraction > 0.7  # 70%+ of mass
+        dense = densities > self.MIN_DENSE_SHELL_DENSITY
+        if np.any(dense):
+            mass_fraction = table.masses[dense].max() / config.shell_mass
+            constraints['substantial_dense_shell'] = bool(mass_fraction > self.MIN_DENSE_MASS_FRACTION)
         else:
             constraints['substantial_dense_shell'] = False
         
@@ -795,30 +1762,32 @@ class HollowEarthModel:
     
     def export_configuration(self, config: ModelConfiguration, filename: str):
         """Export configuration to JSON file."""
+        table = config.shell_table
         
         export_data = {
             'metadata': {
-                'framework_version': '1.0.0',
+                'framework_version': FRAMEWORK_VERSION,
                 'creation_timestamp': str(np.datetime64('now')),
                 'earth_mass': CONSTANTS.M_EARTH,
                 'earth_radius': CONSTANTS.R_EARTH
             },
             'configuration': {
                 'central_hollow_radius': config.central_hollow_radius,
+                'shell_mass': config.shell_mass,
                 'total_mass': config.total_mass,
                 'surface_gravity': config.surface_gravity,
                 'central_sun': config.central_sun,
                 'shells': [
                     {
-                        'outer_radius': shell.outer_radius,
-                        'inner_radius': shell.inner_radius,
-                        'density': shell.density,
-                        'name': shell.name,
-                        'material_type': shell.material_type,
-                        'mass': shell.mass,
-                        'volume': shell.volume
+                        'outer_radius': float(table.outer_radii[i]),
+                        'inner_radius': float(table.inner_radii[i]),
+                        'density': float(table.densities[i]),
+                        'name': table.names[i],
+                        'material_type': table.material_types[i],
+                        'mass': float(table.masses[i]),
+                        'volume': float(table.volumes[i])
                     }
-                    for shell in config.shells
+                    for i in reversed(range(len(table)))
                 ]
             },
             'validation': self.validate_physical_constraints(config)
@@ -0,0 +1,287 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Radial Density Profiles - tabulated and piecewise-polynomial ρ(r)
+
+Continuous density models with thousands of layers (PREM-style tables).
+Each layer holds a polynomial in the local coordinate x = r - r_layer_bottom,
+so layer masses integrate exactly without cancellation for thin layers.
+Cumulative masses and pressure integrals are computed once at construction;
+density, mass, gravity and pressure queries cost O(log layers) per point.
+
+License: MIT
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .core_equations import CONSTANTS, ShellTable
+
+# Gauss-Legendre order used for the pressure integrals
+PRESSURE_QUADRATURE_ORDER = 8
+
+@dataclass(frozen=True, eq=False)
+class RadialDensityProfile:
+    """
+    Piecewise-polynomial radial density profile.
+
+    Layer i spans [boundaries[i], boundaries[i+1]] with density
+    ρ(r) = Σ_k coefficients[i, k] · (r - boundaries[i])^k. Layers with zero
+    density are allowed (gaps, cavities). Below the innermost boundary
+    there is no material.
+
+    Attributes:
+        boundaries: Ascending layer boundaries (m), length n_layers + 1
+        coefficients: Polynomial coefficients, shape (n_layers, degree + 1),
+            ascending powers of the local coordinate
+        name: Descriptive name of the profile
+        layer_masses: Mass of each layer (kg)
+        cumulative_masses: cumulative_masses[i] is the mass below boundaries[i] (kg)
+    """
+    boundaries: np.ndarray
+    coefficients: np.ndarray
+    name: str = ""
+    layer_masses: np.ndarray = field(init=False, repr=False)
+    cumulative_masses: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Validate the layers and integrate cumulative mass and pressure tables."""
+        boundaries = np.ascontiguousarray(self.boundaries, dtype=np.float64)
+        coefficients = np.ascontiguousarray(self.coefficients, dtype=np.float64)
+        if coefficients.ndim == 1:
+            coefficients = coefficients[:, np.newaxis]
+
+        if boundaries.ndim != 1 or len(boundaries) < 2:
+            raise ValueError("Profile needs at least two boundaries")
+        if coefficients.ndim != 2 or len(coefficients) != len(boundaries) - 1:
+            raise ValueError("coefficients must have shape (n_layers, degree + 1)")
+        if np.any(np.diff(boundaries) <= 0):
+            raise ValueError("Boundaries must be strictly increasing")
+        if boundaries[0] < 0:
+            raise ValueError("Radii must be positive")
+
+        object.__setattr__(self, 'boundaries', boundaries)
+        object.__setattr__(self, 'coefficients', coefficients)
+
+        layer = np.arange(len(coefficients))
+        layer_masses = self._mass_within_layer(layer, boundaries[1:] - boundaries[:-1])
+        cumulative_masses = np.concatenate(([0.0], np.cumsum(layer_masses)))
+        object.__setattr__(self, 'layer_masses', layer_masses)
+        object.__setattr__(self, 'cumulative_masses', cumulative_masses)
+
+        # Pressure = ∫ρ·G·M(s)/s² ds + central_mass·∫ρ·G/s² ds, so both parts are tabulated
+        self_part, point_part = self._pressure_integrals(layer, boundaries[:-1], boundaries[1:])
+        object.__setattr__(self, '_pressure_top_self', np.concatenate((np.cumsum(self_part[::-1])[::-1][1:], [0.0])))
+        object.__setattr__(self, '_pressure_top_point', np.concatenate((np.cumsum(point_part[::-1])[::-1][1:], [0.0])))
+
+        for array in (boundaries, coefficients, layer_masses, cumulative_masses,
+                      self._pressure_top_self, self._pressure_top_point):
+            array.flags.writeable = False
+
+    # ------------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def from_table(cls, radii: Sequence[float], densities: Sequence[float],
+                   kind: str = 'linear', name: str = "") -> 'RadialDensityProfile':
+        """
+        Build a profile from tabulated densities.
+
+        Args:
+            radii: Ascending radii (m)
+            densities: Density at each radius (kind='linear', same length as
+                radii) or of each layer between consecutive radii (kind='constant')
+            kind: 'linear' interpolation between samples or 'constant' layers
+            name: Descriptive name
+
+        Returns:
+            RadialDensityProfile
+        """
+        radii = np.asarray(radii, dtype=np.float64)
+        densities = np.asarray(densities, dtype=np.float64)
+
+        if kind == 'constant':
+            if len(densities) != len(radii) - 1:
+                raise ValueError("Constant layers need len(densities) == len(radii) - 1")
+            return cls(radii, densities[:, np.newaxis], name)
+        if kind == 'linear':
+            if len(densities) != len(radii):
+                raise ValueError("Linear tables need len(densities) == len(radii)")
+            slopes = np.diff(densities) / np.diff(radii)
+            return cls(radii, np.column_stack((densities[:-1], slopes)), name)
+        raise ValueError(f"Unknown table kind '{kind}' (use 'linear' or 'constant')")
+
+    @classmethod
+    def from_ppoly(cls, ppoly, name: str = "") -> 'RadialDensityProfile':
+        """Build a profile from a scipy.interpolate.PPoly in radius (m)."""
+        # PPoly stores descending powers of (r - x[i]) with shape (degree + 1, n_layers)
+        return cls(ppoly.x, ppoly.c[::-1].T, name)
+
+    @classmethod
+    def from_shell_table(cls, table: ShellTable, name: str = "") -> 'RadialDensityProfile':
+        """Build a piecewise-constant profile from a ShellTable, filling gaps with zero density."""
+        boundaries = [table.inner_radii[0]]
+        densities = []
+        for inner, outer, density in zip(table.inner_radii, table.outer_radii, table.densities):
+            if inner > boundaries[-1]:
+                boundaries.append(inner)
+                densities.append(0.0)
+            boundaries.append(outer)
+            densities.append(density)
+        return cls.from_table(boundaries, densities, kind='constant', name=name)
+
+    def to_shell_table(self) -> ShellTable:
+        """
+        Mass-preserving ShellTable approximation (mean density per layer).
+
+        Zero-mass layers are dropped.
+        """
+        volumes = (4.0/3.0) * np.pi * (self.boundaries[1:]**3 - self.boundaries[:-1]**3)
+        solid = self.layer_masses > 0
+        return ShellTable(
+            outer_radii=self.boundaries[1:][solid],
+            inner_radii=self.boundaries[:-1][solid],
+            densities=self.layer_masses[solid] / volumes[solid],
+            names=tuple(f"{self.name or 'Layer'} {i}" for i in np.flatnonzero(solid)),
+            material_types=("profile",) * int(np.count_nonzero(solid))
+        )
+
+    # ------------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
+
+    @property
+    def inner_radius(self) -> float:
+        """Innermost boundary (m)."""
+        return float(self.boundaries[0])
+
+    @property
+    def outer_radius(self) -> float:
+        """Outermost boundary (m)."""
+        return float(self.boundaries[-1])
+
+    @property
+    def total_mass(self) -> float:
+        """Total mass (kg)."""
+        return float(self.cumulative_masses[-1])
+
+    @property
+    def content_hash(self) -> str:
+        """Digest of boundaries and coefficients, computed once."""
+        digest = self.__dict__.get('_content_hash')
+        if digest is None:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(self.boundaries.tobytes())
+            h.update(self.coefficients.tobytes())
+            digest = h.hexdigest()
+            object.__setattr__(self, '_content_hash', digest)
+        return digest
+
+    # ------------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------------
+
+    def _locate(self, radii: np.ndarray):
+        """Layer index and local coordinate of each radius (clipped to the profile)."""
+        r = np.clip(radii, self.boundaries[0], self.boundaries[-1])
+        layer = np.clip(np.searchsorted(self.boundaries, r, side='right') - 1, 0, len(self) - 1)
+        return layer, r - self.boundaries[layer]
+
+    def _density_within_layer(self, layer: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Density at local coordinate x of the given layers (Horner scheme)."""
+        coefficients = self.coefficients[layer]
+        density = np.zeros(np.broadcast_shapes(np.shape(x), coefficients.shape[:-1]))
+        for k in range(coefficients.shape[-1] - 1, -1, -1):
+            density = density * x + coefficients[..., k]
+        return density
+
+    def _mass_within_layer(self, layer: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Mass between the bottom of the given layers and local coordinate x."""
+        a = self.boundaries[layer]
+        coefficients = self.coefficients[layer]
+        # 4π ∫0^x (a + t)² t^k dt = 4π [a² x^(k+1)/(k+1) + 2a x^(k+2)/(k+2) + x^(k+3)/(k+3)]
+        mass = np.zeros(np.broadcast_shapes(np.shape(x), np.shape(a)))
+        x_power = np.array(x, dtype=np.float64)
+        for k in range(coefficients.shape[-1]):
+            mass += coefficients[..., k] * (a**2 * x_power / (k + 1) +
+                                            2 * a * x_power * x / (k + 2) +
+                                            x_power * x**2 / (k + 3))
+            x_power = x_power * x
+        return 4.0 * np.pi * mass
+
+    def _pressure_integrals(self, layer: np.ndarray, lower: np.ndarray, upper: np.ndarray):
+        """∫ρ·G·M/s² ds and ∫ρ·G/s² ds over [lower, upper] within the given layers."""
+        nodes, weights = np.polynomial.legendre.leggauss(PRESSURE_QUADRATURE_ORDER)
+        half_width = (upper - lower) / 2.0
+        s = (lower + half_width)[..., np.newaxis] + half_width[..., np.newaxis] * nodes
+        # Gather per layer once; the node axis broadcasts
+        layer_nodes = np.asarray(layer)[..., np.newaxis]
+        x = s - self.boundaries[layer_nodes]
+
+        density = self._density_within_layer(layer_nodes, x)
+        enclosed = self.cumulative_masses[layer_nodes] + self._mass_within_layer(layer_nodes, x)
+        point_integrand = CONSTANTS.G * density / s**2
+
+        self_part = half_width * np.sum(weights * point_integrand * enclosed, axis=-1)
+        point_part = half_width * np.sum(weights * point_integrand, axis=-1)
+        return self_part, point_part
+
+    def density(self, radii: np.ndarray) -> np.ndarray:
+        """Density (kg/m³) at each radius; zero outside the profile."""
+        radii = np.asarray(radii, dtype=np.float64)
+        layer, x = self._locate(radii)
+        inside = (radii >= self.boundaries[0]) & (radii <= self.boundaries[-1])
+        return np.where(inside, self._density_within_layer(layer, x), 0.0)
+
+    def enclosed_mass(self, radii: np.ndarray) -> np.ndarray:
+        """Mass (kg) enclosed within each radius."""
+        radii = np.asarray(radii, dtype=np.float64)
+        layer, x = self._locate(radii)
+        enclosed = self.cumulative_masses[layer] + self._mass_within_layer(layer, x)
+        return np.where(radii <= self.boundaries[0], 0.0, enclosed)
+
+    def gravity(self, radii: np.ndarray, central_mass: float = 0.0) -> np.ndarray:
+        """
+        Gravitational acceleration (m/s²) at each radius.
+
+        Args:
+            radii: Distances from center (m)
+            central_mass: Optional point mass at the center (kg), e.g. a central sun
+
+        Returns:
+            Inward gravitational acceleration, zero at r = 0
+        """
+        radii = np.asarray(radii, dtype=np.float64)
+        safe_radii = np.where(radii > 0, radii, 1.0)
+        gravity = CONSTANTS.G * (self.enclosed_mass(radii) + central_mass) / safe_radii**2
+        return np.where(radii > 0, gravity, 0.0)
+
+    def pressure(self, radii: np.ndarray, central_mass: float = 0.0) -> np.ndarray:
+        """
+        Hydrostatic pressure (Pa) at each radius, zero at the outer surface.
+
+        P(r) = ∫_r^R ρ(s)·g(s) ds, from the tabulated layer integrals plus one
+        quadrature inside the containing layer. There is no material (and no
+        pressure) below the innermost boundary or above the surface.
+
+        Args:
+            radii: Distances from center (m)
+            central_mass: Optional point mass at the center (kg)
+
+        Returns:
+            Pressure with the same shape as radii
+        """
+        radii = np.asarray(radii, dtype=np.float64)
+        layer, x = self._locate(radii)
+        r = self.boundaries[layer] + x
+        self_part, point_part = self._pressure_integrals(layer, r, self.boundaries[layer + 1])
+        pressure = (self._pressure_top_self[layer] + self_part +
+                    central_mass * (self._pressure_top_point[layer] + point_part))
+        inside = (radii >= self.boundaries[0]) & (radii <= self.boundaries[-1])
+        return np.where(inside, pressure, 0.0)
@@ -0,0 +1,119 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Ensemble Evaluation - vectorized screening of many configurations
+
+Evaluates the closed-form quantities of create_hollow_earth_model and
+create_hollow_earth_with_central_sun for N parameter sets at once,
+without building ModelConfiguration objects or emitting log lines.
+
+License: MIT
+"""
+
+import numpy as np
+from typing import Dict, Union
+
+from .core_equations import CONSTANTS, HollowEarthModel
+from .rotation import moment_of_inertia_batch
+
+# Column order of the (N, 4) parameter array
+ENSEMBLE_PARAMETERS = (
+    'outer_shell_thickness',   # m
+    'dense_shell_thickness',   # m
+    'inner_shell_thickness',   # m
+    'dense_shell_density',     # kg/m³
+)
+
+# Safety margin between central sun and cavity wall (m), as in the single model
+SUN_SAFETY_MARGIN = HollowEarthModel.SUN_SAFETY_MARGIN
+
+def evaluate_hollow_earth_ensemble(params: np.ndarray,
+                                   target_interior_gravity: Union[float, np.ndarray] = 9.8,
+                                   sun_radius: Union[float, np.ndarray] = 150e3) -> Dict[str, np.ndarray]:
+    """
+    Evaluate many three-shell hollow Earth configurations in one pass.
+
+    Uses the same sandwich geometry as HollowEarthModel.create_hollow_earth_model
+    (fixed Earth radius, crustal density for the outer and inner crust) and
+    the central-sun formulas of create_hollow_earth_with_central_sun. As in
+    ModelConfiguration, total_mass, mass_ratio and surface_gravity include
+    the central sun; shell_mass does not.
+    Rows with a non-positive cavity radius are flagged invalid and their
+    outputs are NaN instead of raising.
+
+    Args:
+        params: Array of shape (N, 4) with columns ENSEMBLE_PARAMETERS
+        target_interior_gravity: Desired gravity on interior surface (m/s²),
+            scalar or length-N array
+        sun_radius: Radius of central sun (m), scalar or length-N array
+
+    Returns:
+        Dictionary of length-N float64 arrays (plus a boolean 'valid' mask)
+    """
+    params = np.asarray(params, dtype=np.float64)
+    if params.ndim != 2 or params.shape[1] != len(ENSEMBLE_PARAMETERS):
+        raise ValueError(f"params must have shape (N, {len(ENSEMBLE_PARAMETERS)}), got {params.shape}")
+
+    outer_thickness, dense_thickness, inner_thickness, dense_density = params.T
+
+    # FIXED Earth radius - radii from OUTSIDE to INSIDE
+    r_surface = CONSTANTS.R_EARTH
+    r_dense_outer = r_surface - outer_thickness
+    r_dense_inner = r_dense_outer - dense_thickness
+    r_hollow = r_dense_inner - inner_thickness
+
+    valid = (r_hollow > 0) & (r_hollow < r_surface) & (dense_density > 0)
+
+    # Shell masses: crust - dense - crust
+    four_thirds_pi = (4.0/3.0) * np.pi
+    r_dense_outer3 = r_dense_outer**3
+    r_dense_inner3 = r_dense_inner**3
+    shell_mass = CONSTANTS.RHO_CRUST * (r_surface**3 - r_dense_outer3)
+    shell_mass += dense_density * (r_dense_outer3 - r_dense_inner3)
+    shell_mass += CONSTANTS.RHO_CRUST * (r_dense_inner3 - r_hollow**3)
+    shell_mass *= four_thirds_pi
+
+    # Moment of inertia factor and hydrostatic J2 of the three shells
+    rotation = moment_of_inertia_batch(
+        np.column_stack(np.broadcast_arrays(r_surface, r_dense_outer, r_dense_inner)),
+        np.column_stack((r_dense_outer, r_dense_inner, r_hollow)),
+        np.column_stack(np.broadcast_arrays(CONSTANTS.RHO_CRUST, dense_density, CONSTANTS.RHO_CRUST)),
+        radius=r_surface
+    )
+
+    # No shell mass is enclosed at the cavity wall
+    interior_gravity_shells = np.zeros_like(shell_mass)
+
+    # Central sun sized for the target interior gravity
+    required_sun_mass = target_interior_gravity * r_hollow**2 / CONSTANTS.G
+    sun_density = required_sun_mass / (four_thirds_pi * np.asarray(sun_radius, dtype=np.float64)**3)
+    sun_distance_to_surface = r_hollow - sun_radius - SUN_SAFETY_MARGIN
+    interior_gravity_total = interior_gravity_shells + CONSTANTS.G * required_sun_mass / r_hollow**2
+
+    # The sun is part of the planet's mass and exterior gravity
+    total_mass = shell_mass + required_sun_mass
+    surface_gravity = CONSTANTS.G * total_mass / r_surface**2
+
+    results = {
+        'shell_mass': shell_mass,
+        'total_mass': total_mass,
+        'mass_ratio': total_mass / CONSTANTS.M_EARTH,
+        'surface_gravity': surface_gravity,
+        'moi_factor': rotation['moi_factor'],
+        'j2': rotation['j2'],
+        'cavity_radius': r_hollow,
+        'interior_gravity_shells': interior_gravity_shells,
+        'interior_gravity_total': interior_gravity_total,
+        'sun_mass': required_sun_mass,
+        'sun_density': sun_density,
+        'sun_distance_to_surface': sun_distance_to_surface,
+    }
+
+    n = len(params)
+    for key, value in results.items():
+        value = np.broadcast_to(value, (n,)).astype(np.float64, copy=False)
+        if not np.all(valid):
+            value = np.where(valid, value, np.nan)
+        results[key] = value
+    results['valid'] = valid
+
+    return results
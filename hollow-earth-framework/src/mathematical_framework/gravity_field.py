@@ -0,0 +1,136 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Gravity Field - 3D vector field with a displaced central sun
+
+Evaluates the full gravity vector on a latitude/longitude/altitude grid
+inside and around the cavity. The shell term is radial (and zero inside the
+cavity); the sun is a point mass or a uniform sphere at an arbitrary
+position. The grid is processed in latitude blocks so memory stays bounded,
+and the result can be written straight into a memory-mapped .npy file.
+
+License: MIT
+"""
+
+import numpy as np
+from typing import Optional, Sequence
+
+from .core_equations import CONSTANTS, ModelConfiguration
+
+# Output component order for each frame
+FIELD_FRAMES = {
+    'cartesian': ('g_x', 'g_y', 'g_z'),
+    'local': ('g_east', 'g_north', 'g_up'),
+}
+
+def _unit_vectors(lat: np.ndarray, lon: np.ndarray):
+    """Radial, east and north unit vectors for latitude/longitude in radians."""
+    lat, lon = np.broadcast_arrays(lat, lon)
+    cos_lat, sin_lat = np.cos(lat), np.sin(lat)
+    cos_lon, sin_lon = np.cos(lon), np.sin(lon)
+    up = np.stack((cos_lat * cos_lon, cos_lat * sin_lon, sin_lat), axis=-1)
+    east = np.stack((-sin_lon, cos_lon, np.zeros_like(lon)), axis=-1)
+    north = np.stack((-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat), axis=-1)
+    return up, east, north
+
+def sun_gravity(points: np.ndarray, sun_position: Sequence[float], sun_mass: float,
+                sun_radius: float = 0.0) -> np.ndarray:
+    """
+    Gravity vector of the central sun at each point.
+
+    Args:
+        points: Positions (m), shape (..., 3)
+        sun_position: Sun center (m), length 3
+        sun_mass: Sun mass (kg)
+        sun_radius: Radius of a uniform-density sun (m); 0 treats it as a point mass
+
+    Returns:
+        Acceleration vectors (m/s²), shape (..., 3)
+    """
+    offset = points - np.asarray(sun_position, dtype=np.float64)
+    distance = np.sqrt(np.einsum('...i,...i->...', offset, offset))
+    # Outside: G·M/d³; inside a uniform sphere: G·M/R³ (linear in d)
+    scale = np.maximum(distance, sun_radius)
+    scale = np.where(scale > 0, scale, np.inf)
+    return -(CONSTANTS.G * sun_mass / scale**3)[..., np.newaxis] * offset
+
+def compute_gravity_field(config: ModelConfiguration,
+                          latitudes: Sequence[float],
+                          longitudes: Sequence[float],
+                          altitudes: Sequence[float],
+                          sun_position: Sequence[float] = (0.0, 0.0, 0.0),
+                          sun_mass: Optional[float] = None,
+                          sun_radius: Optional[float] = None,
+                          extended_sun: bool = True,
+                          frame: str = 'cartesian',
+                          chunk_points: int = 1_000_000,
+                          memmap_path: Optional[str] = None) -> np.ndarray:
+    """
+    Gravity vector field on a latitude/longitude/altitude grid.
+
+    Altitudes are measured inwards from the cavity wall (0 is the wall,
+    positive values lie inside the cavity, negative values inside the
+    shells), so r = central_hollow_radius - altitude.
+
+    Args:
+        config: Model configuration (sun mass and radius default to config.central_sun)
+        latitudes: Latitudes (degrees)
+        longitudes: Longitudes (degrees)
+        altitudes: Heights above the cavity wall, towards the center (m)
+        sun_position: Sun center relative to Earth's center (m), length 3
+        sun_mass: Sun mass (kg), overrides config.central_sun
+        sun_radius: Sun radius (m), overrides config.central_sun
+        extended_sun: Treat the sun as a uniform sphere instead of a point mass
+        frame: 'cartesian' (x, y, z) or 'local' (east, north, up) components
+        chunk_points: Maximum grid points evaluated at once
+        memmap_path: Optional .npy file to write the field into (memory-mapped)
+
+    Returns:
+        Array of shape (n_lat, n_lon, n_alt, 3) in m/s² (a memmap if memmap_path is set)
+    """
+    if frame not in FIELD_FRAMES:
+        raise ValueError(f"Unknown frame '{frame}' (use one of {sorted(FIELD_FRAMES)})")
+
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    radii = config.central_hollow_radius - np.asarray(altitudes, dtype=np.float64)
+    if np.any(radii < 0):
+        raise ValueError("Altitudes cannot exceed the cavity radius")
+
+    sun = config.central_sun or {}
+    if sun_mass is None:
+        sun_mass = sun.get('mass', 0.0)
+    if sun_radius is None:
+        sun_radius = sun.get('radius', 0.0)
+    if not extended_sun:
+        sun_radius = 0.0
+
+    shape = (len(lat), len(lon), len(radii), 3)
+    if memmap_path is not None:
+        field = np.lib.format.open_memmap(memmap_path, mode='w+', dtype=np.float64, shape=shape)
+    else:
+        field = np.empty(shape)
+
+    # Shell term depends on radius only: zero inside the cavity, radial elsewhere
+    safe_radii = np.where(radii > 0, radii, 1.0)
+    shell_gravity = np.where(radii > 0, CONSTANTS.G * config.enclosed_mass(radii) / safe_radii**2, 0.0)
+
+    rows_per_chunk = max(1, chunk_points // max(1, len(lon) * len(radii)))
+    for start in range(0, len(lat), rows_per_chunk):
+        stop = min(start + rows_per_chunk, len(lat))
+        up, east, north = _unit_vectors(lat[start:stop, np.newaxis], lon[np.newaxis, :])
+
+        # (rows, n_lon, n_alt, 3)
+        points = up[:, :, np.newaxis, :] * radii[:, np.newaxis]
+        block = -shell_gravity[:, np.newaxis] * up[:, :, np.newaxis, :]
+        if sun_mass:
+            block += sun_gravity(points, sun_position, sun_mass, sun_radius)
+
+        if frame == 'local':
+            block = np.stack([np.einsum('abki,abi->abk', block, basis)
+                              for basis in (east, north, up)], axis=-1)
+
+        field[start:stop] = block
+
+    if memmap_path is not None:
+        field.flush()
+    return field
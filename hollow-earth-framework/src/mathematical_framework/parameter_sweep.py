@@ -0,0 +1,360 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Parameter Sweeps - chunked, parallel and resumable
+
+Runs create_hollow_earth_with_central_sun and validate_physical_constraints
+over a grid or Latin-hypercube design. The design is split into chunks that
+are generated, evaluated and written to disk by worker processes, so memory
+stays flat regardless of sweep size and interrupted runs can resume by
+chunk ID.
+
+License: MIT
+"""
+
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .core_equations import HollowEarthModel, logger as core_logger
+from .result_store import ResultStore
+
+logger = logging.getLogger(__name__)
+
+# Sweepable parameters and their defaults (create_hollow_earth_with_central_sun)
+SWEEP_PARAMETERS = {
+    'outer_shell_thickness': 100e3,
+    'dense_shell_thickness': 1800e3,
+    'inner_shell_thickness': 200e3,
+    'dense_shell_density': 8649.0,
+    'target_interior_gravity': 9.8,
+    'sun_radius': 150e3,
+}
+
+SWEEP_FORMATS = ('npz', 'jsonl')
+
+@dataclass
+class SweepSpec:
+    """
+    Description of a parameter sweep.
+
+    Attributes:
+        ranges: Parameter name -> (low, high); unlisted parameters keep
+            their SWEEP_PARAMETERS default
+        method: 'grid' (full factorial) or 'lhs' (Latin hypercube)
+        points_per_axis: Grid points per swept parameter
+        n_samples: Number of Latin-hypercube samples
+        seed: Seed for the Latin-hypercube design
+        chunk_size: Samples per chunk (unit of work and of output files)
+    """
+    ranges: Dict[str, Tuple[float, float]]
+    method: str = 'grid'
+    points_per_axis: int = 10
+    n_samples: int = 1000
+    seed: int = 0
+    chunk_size: int = 1000
+    _lhs_permutations: List[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Validate the sweep description."""
+        unknown = set(self.ranges) - set(SWEEP_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+        if self.method not in ('grid', 'lhs'):
+            raise ValueError(f"Unknown sweep method '{self.method}' (use 'grid' or 'lhs')")
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.ranges = {name: (float(low), float(high)) for name, (low, high) in self.ranges.items()}
+
+    @property
+    def swept_parameters(self) -> List[str]:
+        """Swept parameter names in canonical order."""
+        return [name for name in SWEEP_PARAMETERS if name in self.ranges]
+
+    @property
+    def n_total(self) -> int:
+        """Total number of samples in the sweep."""
+        if self.method == 'grid':
+            return self.points_per_axis ** len(self.swept_parameters)
+        return self.n_samples
+
+    @property
+    def n_chunks(self) -> int:
+        """Number of chunks the sweep is split into."""
+        return math.ceil(self.n_total / self.chunk_size)
+
+    def to_dict(self) -> Dict:
+        """Serializable description (used for the sweep manifest)."""
+        data = asdict(self)
+        data.pop('_lhs_permutations')
+        data['ranges'] = {name: list(bounds) for name, bounds in self.ranges.items()}
+        return data
+
+    def chunk_samples(self, chunk_id: int) -> Dict[str, np.ndarray]:
+        """
+        Generate the samples of one chunk without materializing the sweep.
+
+        Grid chunks are decoded from flat indices. Latin-hypercube strata are
+        assigned by a seeded affine permutation per parameter, so any chunk
+        can be rebuilt from (spec, chunk_id) alone.
+
+        Args:
+            chunk_id: Chunk index in [0, n_chunks)
+
+        Returns:
+            Dictionary mapping every SWEEP_PARAMETERS name to a sample array
+        """
+        if not 0 <= chunk_id < self.n_chunks:
+            raise ValueError(f"chunk_id {chunk_id} out of range [0, {self.n_chunks})")
+
+        start = chunk_id * self.chunk_size
+        index = np.arange(start, min(start + self.chunk_size, self.n_total), dtype=np.int64)
+        swept = self.swept_parameters
+
+        samples = {name: np.full(len(index), default) for name, default in SWEEP_PARAMETERS.items()}
+
+        if self.method == 'grid':
+            shape = (self.points_per_axis,) * len(swept)
+            for name, axis_index in zip(swept, np.unravel_index(index, shape)):
+                low, high = self.ranges[name]
+                samples[name] = np.linspace(low, high, self.points_per_axis)[axis_index]
+        else:
+            n = self.n_total
+            jitter = np.random.default_rng([self.seed, chunk_id]).random((len(swept), len(index)))
+            for d, name in enumerate(swept):
+                a, b = self._lhs_permutation(d)
+                stratum = (a * index + b) % n
+                low, high = self.ranges[name]
+                samples[name] = low + (stratum + jitter[d]) / n * (high - low)
+
+        return samples
+
+    def _lhs_permutation(self, dimension: int) -> Tuple[int, int]:
+        """Affine permutation coefficients (a, b) of one LHS dimension."""
+        if self._lhs_permutations is None:
+            rng = np.random.default_rng(self.seed)
+            n = self.n_total
+            permutations = []
+            for _ in self.swept_parameters:
+                a = int(rng.integers(1, n)) if n > 1 else 1
+                while math.gcd(a, n) != 1:
+                    a = a % (n - 1) + 1
+                permutations.append((a, int(rng.integers(0, n))))
+            self._lhs_permutations = permutations
+        return self._lhs_permutations[dimension]
+
+# ============================================================================
+# CHUNK EVALUATION
+# ============================================================================
+
+def _quiet_core_logging():
+    """Silence per-model INFO/WARNING logging in sweep workers."""
+    core_logger.setLevel(logging.ERROR)
+
+def evaluate_sweep_chunk(spec: SweepSpec, chunk_id: int) -> Dict[str, np.ndarray]:
+    """
+    Evaluate one chunk of a sweep.
+
+    Each sample is built with create_hollow_earth_with_central_sun and
+    checked with validate_physical_constraints. Samples whose geometry is
+    invalid are kept with NaN outputs and all constraints False.
+
+    Args:
+        spec: Sweep description
+        chunk_id: Chunk index
+
+    Returns:
+        Columnar results: sample parameters, derived quantities and one
+        boolean column per constraint
+    """
+    # Every sample is unique: a result cache would only add hashing and copies
+    model = HollowEarthModel(cache_size=0)
+    samples = spec.chunk_samples(chunk_id)
+    n = len(samples['sun_radius'])
+
+    start = chunk_id * spec.chunk_size
+    columns = {'sample_id': np.arange(start, start + n, dtype=np.int64)}
+    columns.update(samples)
+    for name in ('shell_mass', 'total_mass', 'surface_gravity', 'cavity_radius',
+                 'sun_mass', 'sun_density'):
+        columns[name] = np.full(n, np.nan)
+    constraints = {}
+
+    for i in range(n):
+        kwargs = {name: float(samples[name][i]) for name in SWEEP_PARAMETERS}
+        try:
+            config = model.create_hollow_earth_with_central_sun(**kwargs)
+        except ValueError:
+            continue
+
+        columns['shell_mass'][i] = config.shell_mass
+        columns['total_mass'][i] = config.total_mass
+        columns['surface_gravity'][i] = config.surface_gravity
+        columns['cavity_radius'][i] = config.central_hollow_radius
+        columns['sun_mass'][i] = config.central_sun['mass']
+        columns['sun_density'][i] = config.central_sun['density']
+
+        for constraint, passed in model.validate_physical_constraints(config).items():
+            constraints.setdefault(constraint, np.zeros(n, dtype=bool))[i] = passed
+
+    for constraint, passed in constraints.items():
+        columns[f'constraint_{constraint}'] = passed
+    columns['all_constraints'] = (np.logical_and.reduce(list(constraints.values()))
+                                  if constraints else np.zeros(n, dtype=bool))
+
+    return columns
+
+def _chunk_path(output_dir: Path, chunk_id: int, fmt: str) -> Path:
+    """Output file of one chunk."""
+    return output_dir / f"chunk_{chunk_id:06d}.{fmt}"
+
+def _write_chunk(columns: Dict[str, np.ndarray], path: Path, fmt: str):
+    """Write one chunk atomically (temporary file + rename)."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    if fmt == 'npz':
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **columns)
+    else:
+        names = list(columns)
+        with open(tmp_path, 'w') as f:
+            for i in range(len(columns['sample_id'])):
+                f.write(json.dumps({name: columns[name][i].item() for name in names}) + '\n')
+    os.replace(tmp_path, path)
+
+def _run_chunk(spec: SweepSpec, chunk_id: int, output_dir: str, fmt: str,
+               store: Optional[ResultStore] = None) -> Dict:
+    """Worker entry point: evaluate a chunk (or fetch it from the store), write it and return a summary."""
+    _quiet_core_logging()
+    if store is not None:
+        columns = store.get_or_compute('sweep_chunk', {'spec': spec.to_dict(), 'chunk_id': chunk_id},
+                                       lambda: evaluate_sweep_chunk(spec, chunk_id))
+    else:
+        columns = evaluate_sweep_chunk(spec, chunk_id)
+    _write_chunk(columns, _chunk_path(Path(output_dir), chunk_id, fmt), fmt)
+    return {
+        'chunk_id': chunk_id,
+        'n_samples': len(columns['sample_id']),
+        'n_valid': int(np.count_nonzero(columns['all_constraints']))
+    }
+
+# ============================================================================
+# SWEEP RUNNER
+# ============================================================================
+
+def run_parameter_sweep(spec: SweepSpec,
+                        output_dir: str,
+                        fmt: str = 'npz',
+                        max_workers: Optional[int] = None,
+                        resume: bool = True,
+                        store: Optional[ResultStore] = None) -> Dict:
+    """
+    Run a parameter sweep across a process pool, streaming chunks to disk.
+
+    Each chunk is written to its own file as soon as it finishes, so the
+    parent process only keeps per-chunk summaries. With resume=True,
+    chunks whose output file already exists are skipped. With a store,
+    chunks evaluated by any earlier sweep of the same spec are reused.
+
+    Args:
+        spec: Sweep description
+        output_dir: Directory receiving manifest.json and chunk files
+        fmt: 'npz' or 'jsonl'
+        max_workers: Worker processes (None: os.cpu_count(), 0: run inline)
+        resume: Skip chunks already present in output_dir
+        store: Optional ResultStore shared by the workers
+
+    Returns:
+        Summary dictionary with chunk and sample counts
+    """
+    if fmt not in SWEEP_FORMATS:
+        raise ValueError(f"Unknown sweep format '{fmt}' (use one of {SWEEP_FORMATS})")
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    manifest = {'spec': spec.to_dict(), 'format': fmt, 'n_chunks': spec.n_chunks, 'n_total': spec.n_total}
+    manifest_path = output_path / 'manifest.json'
+    if manifest_path.exists() and resume:
+        with open(manifest_path) as f:
+            existing = json.load(f)
+        if existing != manifest:
+            raise ValueError(f"{output_dir} holds a different sweep; use another directory or resume=False")
+    else:
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    pending = [chunk_id for chunk_id in range(spec.n_chunks)
+               if not (resume and _chunk_path(output_path, chunk_id, fmt).exists())]
+    skipped = spec.n_chunks - len(pending)
+    if skipped:
+        logger.info(f"Resuming sweep: {skipped} of {spec.n_chunks} chunks already done")
+
+    summaries = []
+    if max_workers == 0:
+        level = core_logger.level
+        try:
+            for chunk_id in pending:
+                summaries.append(_run_chunk(spec, chunk_id, str(output_path), fmt, store))
+        finally:
+            core_logger.setLevel(level)
+    else:
+        max_workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_quiet_core_logging) as executor:
+            # Bounded submission window keeps the parent's memory flat
+            queue = iter(pending)
+            in_flight = set()
+            while True:
+                while len(in_flight) < 2 * max_workers:
+                    chunk_id = next(queue, None)
+                    if chunk_id is None:
+                        break
+                    in_flight.add(executor.submit(_run_chunk, spec, chunk_id,
+                                                  str(output_path), fmt, store))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                summaries.extend(future.result() for future in done)
+
+    logger.info(f"Sweep finished: {len(summaries)} chunks run, {skipped} skipped")
+
+    return {
+        'output_dir': str(output_path),
+        'n_chunks': spec.n_chunks,
+        'chunks_run': len(summaries),
+        'chunks_skipped': skipped,
+        'samples_run': sum(s['n_samples'] for s in summaries),
+        'valid_run': sum(s['n_valid'] for s in summaries)
+    }
+
+def iter_sweep_results(output_dir: str) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Iterate over the chunks of a finished (or partial) sweep in chunk order.
+
+    Args:
+        output_dir: Directory written by run_parameter_sweep
+
+    Yields:
+        Columnar results of one chunk
+    """
+    output_path = Path(output_dir)
+    with open(output_path / 'manifest.json') as f:
+        manifest = json.load(f)
+    fmt = manifest['format']
+
+    for chunk_id in range(manifest['n_chunks']):
+        path = _chunk_path(output_path, chunk_id, fmt)
+        if not path.exists():
+            continue
+        if fmt == 'npz':
+            with np.load(path) as data:
+                yield {name: data[name] for name in data.files}
+        else:
+            with open(path) as f:
+                rows = [json.loads(line) for line in f]
+            yield {name: np.array([row[name] for row in rows]) for name in rows[0]} if rows else {}
@@ -0,0 +1,193 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Ray Tracing - vectorized seismic rays through the shell stack
+
+Traces thousands of take-off angles at once through the shells of a
+ModelConfiguration and its cavity. Each shell has constant P/S velocity, so
+a ray is a straight chord inside every shell and the spherical ray
+parameter p = r·sin(i)/v is conserved across boundaries (Snell's law).
+Segment lengths and angular distances then have closed forms, and a whole
+fan of rays is one (rays × layers) array computation.
+
+At solid-solid boundaries a ray is transmitted if r·sin(i') ≤ r, i.e.
+p·v_below ≤ r, and totally reflected otherwise. At the crust/air interface
+the cavity follows SeismicWaveguideModel's critical-angle convention,
+sin(θc) = v_air / v_solid: rays steeper than θc cross the cavity, all others
+are totally reflected. S waves cannot enter the cavity.
+
+License: MIT
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+
+from .core_equations import CONSTANTS, ModelConfiguration, SeismicWaveguideModel
+
+# Ray type codes
+RAY_TYPES = {
+    'direct': 0,      # upgoing from the source straight to the surface
+    'turning': 1,     # diving ray turning inside a solid shell
+    'reflected': 2,   # totally reflected at a boundary (including crust/air)
+    'cavity': 3,      # transmitted through the cavity to the far side
+    'blocked': 4,     # hits the central sun inside the cavity
+}
+
+def shell_velocities(config: ModelConfiguration,
+                     waveguide: Optional[SeismicWaveguideModel] = None
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Layer radii and velocities of a configuration, outermost layer first.
+
+    Crustal shells take the waveguide's crust velocities, all other shells
+    its mantle velocities; the cavity (if any) is a fluid layer with the
+    sound speed of air and no S waves.
+
+    Args:
+        config: Model configuration
+        waveguide: Velocity source (default: SeismicWaveguideModel())
+
+    Returns:
+        Tuple of (outer_radii, inner_radii, v_p, v_s) arrays; v_s is 0 in the cavity
+    """
+    waveguide = waveguide or SeismicWaveguideModel()
+    table = config.shell_table
+    crustal = np.array([material == 'crustal' for material in table.material_types[::-1]], dtype=bool)
+
+    outer = table.outer_radii[::-1].copy()
+    inner = table.inner_radii[::-1].copy()
+    v_p = np.where(crustal, waveguide.v_p_crust, waveguide.v_p_mantle).astype(np.float64)
+    v_s = np.where(crustal, waveguide.v_s_crust, waveguide.v_s_mantle).astype(np.float64)
+
+    if inner[-1] > 0:
+        outer, inner = np.append(outer, inner[-1]), np.append(inner, 0.0)
+        v_p, v_s = np.append(v_p, waveguide.v_air), np.append(v_s, 0.0)
+
+    return outer, inner, v_p, v_s
+
+def _legs(p: np.ndarray, bottom: np.ndarray, top, outer: np.ndarray,
+          inner: np.ndarray, velocity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Travel time and angular distance of each ray between radius bottom and top."""
+    lo = np.maximum(inner, bottom[:, np.newaxis])
+    hi = np.minimum(outer, np.asarray(top, dtype=np.float64)[..., np.newaxis])
+    active = hi > lo
+    lo = np.where(active, lo, hi)
+
+    # Closest approach of the straight chord in each layer
+    d = np.minimum(p[:, np.newaxis] * velocity, lo)
+    length = np.sqrt(np.maximum(hi**2 - d**2, 0.0)) - np.sqrt(np.maximum(lo**2 - d**2, 0.0))
+    # lo == 0 only at the center, where the chord turns (d == lo)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_hi = np.where(hi > 0, d / hi, 1.0)
+        cos_lo = np.where(lo > 0, d / lo, 1.0)
+    angle = np.arccos(np.clip(cos_hi, -1.0, 1.0)) - np.arccos(np.clip(cos_lo, -1.0, 1.0))
+
+    safe_velocity = np.where(velocity > 0, velocity, np.inf)
+    time = np.sum(np.where(active, length / safe_velocity, 0.0), axis=1)
+    distance = np.sum(np.where(active, angle, 0.0), axis=1)
+    return time, distance
+
+def trace_rays(config: ModelConfiguration,
+               takeoff_angles: Sequence[float],
+               phase: str = 'P',
+               source_depth: float = 0.0,
+               waveguide: Optional[SeismicWaveguideModel] = None) -> Dict[str, np.ndarray]:
+    """
+    Trace a fan of rays from one source through the shell stack.
+
+    Args:
+        config: Model configuration (its shells and cavity)
+        takeoff_angles: Angles from the downward vertical (degrees); angles
+            above 90 leave the source upwards
+        phase: 'P' or 'S'
+        source_depth: Source depth below the surface (m)
+        waveguide: Velocity source (default: SeismicWaveguideModel())
+
+    Returns:
+        Dictionary of arrays: takeoff_angle, ray_parameter (s/rad),
+        travel_time (s), distance_deg, distance_km, bottom_radius (m) and
+        ray_type codes (RAY_TYPES); travel time and distance are NaN for
+        rays blocked by the central sun
+    """
+    if phase not in ('P', 'S'):
+        raise ValueError(f"Unknown phase '{phase}' (use 'P' or 'S')")
+
+    waveguide = waveguide or SeismicWaveguideModel()
+    outer, inner, v_p, v_s = shell_velocities(config, waveguide)
+    velocity = v_p if phase == 'P' else v_s
+    cavity = np.zeros(len(outer), dtype=bool)
+    if config.central_hollow_radius > 0:
+        cavity[-1] = True
+    v_cavity = waveguide.v_air
+
+    surface = outer[0]
+    r_source = surface - source_depth
+    if not inner[-1] <= r_source <= surface:
+        raise ValueError("Source depth lies outside the model")
+    source_layer = int(np.clip(np.searchsorted(-inner, -r_source, side='left'), 0, len(outer) - 1))
+    if cavity[source_layer] or velocity[source_layer] <= 0:
+        raise ValueError("Source must lie in a solid shell")
+
+    angles = np.asarray(takeoff_angles, dtype=np.float64)
+    incidence = np.radians(angles)
+    p = r_source * np.abs(np.sin(incidence)) / velocity[source_layer]
+    n_layers = len(outer)
+
+    # Downgoing rays: find the first layer at or below the source where the
+    # ray turns or cannot be transmitted through the layer's lower boundary
+    d = p[:, np.newaxis] * velocity
+    turns = d >= inner
+    v_below = np.append(velocity[1:], 0.0)
+    into_cavity = np.append(cavity[1:], False)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        snell_blocked = p[:, np.newaxis] * v_below > inner
+        # Crust/air convention: transmitted only inside the critical cone
+        sin_at_wall = d / np.where(inner > 0, inner, np.inf)
+        critical = v_cavity / velocity
+        cavity_blocked = (sin_at_wall > critical) | (v_below <= 0)
+    blocked = np.where(into_cavity, cavity_blocked, snell_blocked | (v_below <= 0))
+    event = (turns | blocked) & (np.arange(n_layers) >= source_layer)
+    event[:, -1] = True
+    event_layer = np.argmax(event, axis=1)
+
+    rows = np.arange(len(p))
+    turned = turns[rows, event_layer]
+    bottom = np.where(turned, d[rows, event_layer], inner[event_layer])
+
+    down_time, down_distance = _legs(p, bottom, r_source, outer, inner, velocity)
+    up_time, up_distance = _legs(p, bottom, surface, outer, inner, velocity)
+    travel_time = down_time + up_time
+    distance = down_distance + up_distance
+
+    ray_type = np.where(turned, RAY_TYPES['turning'], RAY_TYPES['reflected'])
+    ray_type = np.where(turned & cavity[event_layer], RAY_TYPES['cavity'], ray_type)
+    if config.central_sun:
+        sun_hit = (ray_type == RAY_TYPES['cavity']) & (bottom < config.central_sun['radius'])
+        ray_type = np.where(sun_hit, RAY_TYPES['blocked'], ray_type)
+
+    # Upgoing rays travel from the source straight to the surface
+    upgoing = np.cos(incidence) < 0
+    if np.any(upgoing):
+        direct_time, direct_distance = _legs(p[upgoing], np.full(np.count_nonzero(upgoing), r_source),
+                                             surface, outer, inner, velocity)
+        travel_time[upgoing] = direct_time
+        distance[upgoing] = direct_distance
+        bottom[upgoing] = r_source
+        ray_type[upgoing] = RAY_TYPES['direct']
+
+    blocked_rays = ray_type == RAY_TYPES['blocked']
+    travel_time[blocked_rays] = np.nan
+    distance[blocked_rays] = np.nan
+
+    # Epicentral distance folds the travelled angle into [0°, 180°]
+    distance = np.remainder(distance, 2 * np.pi)
+    distance = np.where(distance > np.pi, 2 * np.pi - distance, distance)
+
+    return {
+        'takeoff_angle': angles,
+        'ray_parameter': p,
+        'travel_time': travel_time,
+        'distance_deg': np.degrees(distance),
+        'distance_km': distance * CONSTANTS.R_EARTH / 1000,
+        'bottom_radius': bottom,
+        'ray_type': ray_type.astype(np.int8),
+    }
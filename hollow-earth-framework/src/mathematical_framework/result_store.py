@@ -0,0 +1,274 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Result Store - persistent, content-addressed memoization
+
+SQLite-backed store for optimizer and sweep results. Keys are digests of
+(namespace, input parameters, framework version), so results from an older
+framework version are never reused. The database runs in WAL mode with
+busy timeouts, so several worker processes can read and write it at once,
+and is kept under a size cap by evicting least-recently-used entries.
+
+Values are stored as JSON, raw bytes or an .npz archive of arrays, never
+pickled, so reading a store cannot execute code written by another user.
+
+License: MIT
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .core_equations import FRAMEWORK_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Default location, overridable with the HOLLOW_EARTH_STORE environment variable
+DEFAULT_STORE_PATH = Path.home() / '.cache' / 'hollow-earth' / 'results.sqlite'
+
+def default_store_path() -> Path:
+    """Path of the shared result store."""
+    return Path(os.environ.get('HOLLOW_EARTH_STORE', DEFAULT_STORE_PATH))
+
+def _json_default(value):
+    """JSON encoding of numpy scalars."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def encode_value(value: Any) -> bytes:
+    """
+    Serialize a stored value without pickle.
+
+    Dictionaries of arrays become an .npz archive, bytes are kept as-is and
+    anything else must be JSON-serializable (numpy scalars are converted).
+    The first byte tags the format.
+
+    Raises:
+        TypeError: If the value has no safe encoding
+    """
+    if isinstance(value, bytes):
+        return b'B' + value
+    if isinstance(value, dict) and value and all(isinstance(v, np.ndarray) for v in value.values()):
+        buffer = io.BytesIO()
+        np.savez(buffer, **value)
+        return b'N' + buffer.getvalue()
+    return b'J' + json.dumps(value, default=_json_default).encode()
+
+def decode_value(blob: bytes) -> Any:
+    """Inverse of encode_value; arrays are loaded with allow_pickle=False."""
+    tag, payload = blob[:1], blob[1:]
+    if tag == b'B':
+        return bytes(payload)
+    if tag == b'N':
+        with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+    if tag == b'J':
+        return json.loads(payload)
+    raise ValueError(f"Unknown stored value format {tag!r}")
+
+class ResultStore:
+    """
+    Persistent content-addressed result store.
+
+    Values are encoded with encode_value into a single SQLite table. Each
+    process opens its own connection lazily, so a store can be passed to
+    worker processes.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 max_bytes: int = 256 * 1024**2,
+                 framework_version: str = FRAMEWORK_VERSION,
+                 timeout: float = 30.0):
+        """
+        Initialize the result store.
+
+        Args:
+            path: SQLite database file (default: default_store_path())
+            max_bytes: Size cap for stored values; LRU entries are evicted beyond it
+            framework_version: Version mixed into every key
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = Path(path) if path is not None else default_store_path()
+        self.max_bytes = max_bytes
+        self.framework_version = framework_version
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        """Connections are per process; never pickle one."""
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_pid'] = None
+        return state
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection of the current process, created on first use."""
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                ' key TEXT PRIMARY KEY,'
+                ' namespace TEXT NOT NULL,'
+                ' framework_version TEXT NOT NULL,'
+                ' value BLOB NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' created REAL NOT NULL,'
+                ' last_access REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS results_lru ON results (last_access)')
+            self._create_size_total(connection)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self):
+        """Close this process's connection."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+    def make_key(self, namespace: str, params: Dict) -> str:
+        """
+        Content address of a result.
+
+        Args:
+            namespace: Kind of result (e.g. 'optimize_for_mass_conservation')
+            params: JSON-serializable input parameters
+
+        Returns:
+            Hex digest of namespace, canonical parameters and framework version
+        """
+        payload = json.dumps([namespace, params, self.framework_version],
+                             sort_keys=True, separators=(',', ':'), default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, namespace: str, params: Dict, default: Any = None) -> Any:
+        """Stored value for (namespace, params), or default if absent."""
+        key = self.make_key(namespace, params)
+        row = self.connection.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return default
+
+        try:
+            value = decode_value(row[0])
+        except (ValueError, zipfile.BadZipFile) as error:
+            # Written by an older release or another program: treat as a miss
+            logger.warning(f"Ignoring unreadable result store entry {key[:12]}: {error}")
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.connection.execute('UPDATE results SET last_access = ? WHERE key = ?', (time.time(), key))
+        return value
+
+    def put(self, namespace: str, params: Dict, value: Any):
+        """Store a value for (namespace, params), evicting LRU entries above max_bytes."""
+        key = self.make_key(namespace, params)
+        blob = encode_value(value)
+        now = time.time()
+
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            # Upsert rather than REPLACE so the size triggers see the old row
+            connection.execute(
+                'INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET namespace = excluded.namespace,'
+                ' framework_version = excluded.framework_version, value = excluded.value,'
+                ' size = excluded.size, created = excluded.created, last_access = excluded.last_access',
+                (key, namespace, self.framework_version, blob, len(blob), now, now)
+            )
+            self._evict(connection)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def get_or_compute(self, namespace: str, params: Dict, compute: Callable[[], Any]) -> Any:
+        """Return the stored value, computing and storing it on a miss."""
+        sentinel = object()
+        value = self.get(namespace, params, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.put(namespace, params, value)
+        return value
+
+    @staticmethod
+    def _create_size_total(connection: sqlite3.Connection):
+        """
+        Maintain the total stored size in a one-row table.
+
+        Triggers keep it current for every writer process, so checking the
+        size cap is a single-row read instead of a SUM over all entries.
+        Databases created without it are summed once on first open.
+        """
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute('CREATE TABLE IF NOT EXISTS size_total ('
+                               ' id INTEGER PRIMARY KEY CHECK (id = 0),'
+                               ' bytes INTEGER NOT NULL)')
+            if connection.execute('SELECT 1 FROM size_total').fetchone() is None:
+                connection.execute('INSERT INTO size_total SELECT 0, COALESCE(SUM(size), 0) FROM results')
+            connection.execute('CREATE TRIGGER IF NOT EXISTS results_size_insert AFTER INSERT ON results '
+                               'BEGIN UPDATE size_total SET bytes = bytes + NEW.size; END')
+            connection.execute('CREATE TRIGGER IF NOT EXISTS results_size_delete AFTER DELETE ON results '
+                               'BEGIN UPDATE size_total SET bytes = bytes - OLD.size; END')
+            connection.execute('CREATE TRIGGER IF NOT EXISTS results_size_update AFTER UPDATE OF size ON results '
+                               'BEGIN UPDATE size_total SET bytes = bytes + NEW.size - OLD.size; END')
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _evict(self, connection: sqlite3.Connection):
+        """Delete least-recently-used entries until the size cap holds."""
+        total = connection.execute('SELECT bytes FROM size_total').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in connection.execute('SELECT key, size FROM results ORDER BY last_access'):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany('DELETE FROM results WHERE key = ?', stale)
+        logger.info(f"Result store evicted {len(stale)} entries ({freed/1024:.0f} KiB)")
+
+    def clear(self):
+        """Delete every stored result."""
+        self.connection.execute('DELETE FROM results')
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, stored bytes and this instance's hit/miss counters."""
+        count, size = self.connection.execute(
+            'SELECT (SELECT COUNT(*) FROM results), bytes FROM size_total'
+        ).fetchone()
+        return {
+            'path': str(self.path),
+            'entries': count,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
@@ -0,0 +1,113 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Rotation - moment of inertia factor and J2 for batches of models
+
+Closed-form shell moments of inertia, I = Σ 8π/15·ρ·(b⁵ - a⁵), evaluated
+for whole ensembles of layered models at once, plus a hydrostatic
+(Darwin-Radau) estimate of rotational flattening and J2. The observed Earth
+has I/(M·R²) = 0.3307 and J2 = 1.0826e-3; a hollow model concentrates mass
+outwards and pushes the factor towards the thin-shell limit of 2/3.
+
+License: MIT
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence, Union
+
+from .core_equations import CONSTANTS, ModelConfiguration
+
+def radau_darwin_j2(moi_factor: np.ndarray, mass: np.ndarray, radius: np.ndarray,
+                    omega: float = CONSTANTS.OMEGA_EARTH):
+    """
+    Hydrostatic flattening and J2 from the moment of inertia factor.
+
+    Inverts the Darwin-Radau relation
+    C/(M·R²) = 2/3·[1 - 2/5·sqrt(5m/(2f) - 1)], with m = ω²R³/(GM),
+    and uses first-order J2 = (2f - m)/3.
+
+    Args:
+        moi_factor: I/(M·R²)
+        mass: Total mass (kg)
+        radius: Reference radius (m)
+        omega: Rotation rate (rad/s)
+
+    Returns:
+        Tuple of (flattening, j2, rotation_parameter) arrays
+    """
+    m = omega**2 * np.asarray(radius, dtype=np.float64)**3 / (CONSTANTS.G * np.asarray(mass, dtype=np.float64))
+    eta = 2.5 * (1.0 - 1.5 * np.asarray(moi_factor, dtype=np.float64))
+    flattening = 2.5 * m / (1.0 + eta**2)
+    j2 = (2.0 * flattening - m) / 3.0
+    return flattening, j2, m
+
+def moment_of_inertia_batch(outer_radii: np.ndarray,
+                            inner_radii: np.ndarray,
+                            densities: np.ndarray,
+                            radius: Optional[Union[float, np.ndarray]] = None,
+                            omega: float = CONSTANTS.OMEGA_EARTH) -> Dict[str, np.ndarray]:
+    """
+    Moment of inertia factor and J2 for N layered models at once.
+
+    Unused shell slots can be padded with zero density (or zero thickness).
+
+    Args:
+        outer_radii: Shell outer radii (m), shape (N, S)
+        inner_radii: Shell inner radii (m), shape (N, S)
+        densities: Shell densities (kg/m³), shape (N, S)
+        radius: Reference radius (m), scalar or (N,) (default: largest outer radius per model)
+        omega: Rotation rate (rad/s)
+
+    Returns:
+        Dictionary of length-N arrays: total_mass, moment_of_inertia,
+        moi_factor, flattening, j2 and rotation_parameter
+    """
+    outer = np.atleast_2d(np.asarray(outer_radii, dtype=np.float64))
+    inner = np.atleast_2d(np.asarray(inner_radii, dtype=np.float64))
+    rho = np.atleast_2d(np.asarray(densities, dtype=np.float64))
+    if not outer.shape == inner.shape == rho.shape:
+        raise ValueError("outer_radii, inner_radii and densities must have the same shape")
+
+    if radius is None:
+        radius = outer.max(axis=1)
+
+    total_mass = (4.0/3.0) * np.pi * np.sum(rho * (outer**3 - inner**3), axis=1)
+    moment = (8.0/15.0) * np.pi * np.sum(rho * (outer**5 - inner**5), axis=1)
+    moi_factor = moment / (total_mass * np.asarray(radius)**2)
+    flattening, j2, m = radau_darwin_j2(moi_factor, total_mass, radius, omega)
+
+    return {
+        'total_mass': total_mass,
+        'moment_of_inertia': moment,
+        'moi_factor': moi_factor,
+        'flattening': flattening,
+        'j2': j2,
+        'rotation_parameter': m,
+    }
+
+def moment_of_inertia_for_configurations(configs: Sequence[ModelConfiguration],
+                                         omega: float = CONSTANTS.OMEGA_EARTH) -> Dict[str, np.ndarray]:
+    """
+    Moment of inertia factor and J2 for a list of configurations.
+
+    Shell tables are padded to a common shell count with zero-density slots
+    and evaluated in one moment_of_inertia_batch call. The reference radius
+    is Earth's radius, as for the surface gravity of each configuration.
+
+    Args:
+        configs: Model configurations
+        omega: Rotation rate (rad/s)
+
+    Returns:
+        Dictionary of arrays as in moment_of_inertia_batch
+    """
+    tables = [config.shell_table for config in configs]
+    width = max((len(table) for table in tables), default=0)
+    outer = np.zeros((len(tables), width))
+    inner = np.zeros((len(tables), width))
+    rho = np.zeros((len(tables), width))
+    for row, table in enumerate(tables):
+        outer[row, :len(table)] = table.outer_radii
+        inner[row, :len(table)] = table.inner_radii
+        rho[row, :len(table)] = table.densities
+
+    return moment_of_inertia_batch(outer, inner, rho, radius=CONSTANTS.R_EARTH, omega=omega)
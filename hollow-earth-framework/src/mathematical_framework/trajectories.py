@@ -0,0 +1,251 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Cavity Trajectories - batched test-particle integration
+
+Advances thousands of test particles (debris, gas parcels, ballistic
+objects) through the cavity as NumPy arrays. Inside the cavity the shells
+contribute no gravity, so particles move in the field of the central sun.
+Each particle carries its own step size (fixed RK4 or adaptive
+Dormand-Prince 5(4)); all particles are synchronized at the output times,
+where snapshots are buffered and streamed to a memory-mapped .npy file.
+Particles stop when they hit the sun or the cavity wall.
+
+License: MIT
+"""
+
+import logging
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+from .core_equations import ModelConfiguration
+from .gravity_field import sun_gravity
+
+logger = logging.getLogger(__name__)
+
+# Particle status codes
+TRAJECTORY_STATUS = {
+    'active': 0,
+    'sun': 1,     # collided with the central sun
+    'wall': 2,    # reached the cavity wall
+}
+
+# Dormand-Prince 5(4) tableau
+_DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+_DP_B5 = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+_DP_B4 = np.array([5179/57600, 0.0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+class _CavityField:
+    """Acceleration and collision geometry of the cavity."""
+
+    def __init__(self, config: ModelConfiguration, sun_position: Sequence[float]):
+        sun = config.central_sun or {}
+        self.sun_mass = sun.get('mass', 0.0)
+        self.sun_radius = sun.get('radius', 0.0) if self.sun_mass else 0.0
+        self.sun_position = np.asarray(sun_position, dtype=np.float64)
+        self.wall_radius = config.central_hollow_radius
+
+    def derivative(self, state: np.ndarray) -> np.ndarray:
+        """d(position, velocity)/dt for states of shape (n, 6)."""
+        acceleration = (sun_gravity(state[:, :3], self.sun_position, self.sun_mass, self.sun_radius)
+                        if self.sun_mass else np.zeros((len(state), 3)))
+        return np.concatenate((state[:, 3:], acceleration), axis=1)
+
+    def clearances(self, positions: np.ndarray):
+        """Distance outside the sun surface and inside the wall (negative = collided)."""
+        if self.sun_radius > 0:
+            to_sun = np.linalg.norm(positions - self.sun_position, axis=1) - self.sun_radius
+        else:
+            to_sun = np.full(len(positions), np.inf)
+        to_wall = self.wall_radius - np.linalg.norm(positions, axis=1)
+        return to_sun, to_wall
+
+    def sun_entry(self, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """
+        Fraction of the chord start→end at which it first enters the sun (inf if it misses).
+
+        Testing the whole chord rather than its end point catches particles
+        that would pass through the sun within a single step.
+        """
+        if self.sun_radius <= 0:
+            return np.full(len(start), np.inf)
+        chord = end - start
+        offset = start - self.sun_position
+        # |offset + s·chord|² = R² → a·s² + 2b·s + c = 0; entry is the smaller root
+        a = np.einsum('ij,ij->i', chord, chord)
+        b = np.einsum('ij,ij->i', offset, chord)
+        c = np.einsum('ij,ij->i', offset, offset) - self.sun_radius**2
+        discriminant = b**2 - a * c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entry = (-b - np.sqrt(np.maximum(discriminant, 0.0))) / a
+        hit = (a > 0) & (discriminant >= 0) & (entry >= 0) & (entry <= 1)
+        return np.where(hit, entry, np.inf)
+
+def _rk4_step(field: _CavityField, state: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """Classical RK4 step with per-particle step sizes."""
+    h = h[:, np.newaxis]
+    k1 = field.derivative(state)
+    k2 = field.derivative(state + 0.5 * h * k1)
+    k3 = field.derivative(state + 0.5 * h * k2)
+    k4 = field.derivative(state + h * k3)
+    return state + h / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+def _dopri_step(field: _CavityField, state: np.ndarray, h: np.ndarray):
+    """Dormand-Prince 5(4) step; returns the 5th-order state and the error estimate."""
+    h = h[:, np.newaxis]
+    stages = []
+    for row in _DP_A:
+        increment = sum((a * k for a, k in zip(row, stages) if a), np.zeros_like(state))
+        stages.append(field.derivative(state + h * increment))
+    stages = np.stack(stages)
+    new_state = state + h * np.tensordot(_DP_B5, stages, axes=1)
+    error = h * np.tensordot(_DP_B5 - _DP_B4, stages, axes=1)
+    return new_state, error
+
+def integrate_trajectories(config: ModelConfiguration,
+                           positions: np.ndarray,
+                           velocities: np.ndarray,
+                           t_end: float,
+                           output_interval: float,
+                           dt: float = 10.0,
+                           method: str = 'adaptive',
+                           rtol: float = 1e-9,
+                           atol: float = 1e-6,
+                           sun_position: Sequence[float] = (0.0, 0.0, 0.0),
+                           output_path: Optional[str] = None,
+                           chunk_snapshots: int = 64) -> Dict[str, np.ndarray]:
+    """
+    Integrate many test particles through the cavity.
+
+    Args:
+        config: Model configuration (central sun from config.central_sun)
+        positions: Initial positions (m), shape (N, 3)
+        velocities: Initial velocities (m/s), shape (N, 3)
+        t_end: Integration time (s)
+        output_interval: Time between stored snapshots (s); the last snapshot is at t_end
+        dt: Step size for 'rk4', initial step size for 'adaptive' (s)
+        method: 'rk4' (fixed step) or 'adaptive' (Dormand-Prince 5(4))
+        rtol: Relative tolerance of the adaptive method
+        atol: Absolute tolerance of the adaptive method
+        sun_position: Sun center (m), length 3
+        output_path: Optional .npy file for the trajectory (memory-mapped);
+            kept in memory when None
+        chunk_snapshots: Snapshots buffered before each write to disk
+
+    Returns:
+        Dictionary with 'times' (n_out,), 'trajectory' (n_out, N, 6) holding
+        position and velocity, final 'positions' and 'velocities', 'status'
+        codes (TRAJECTORY_STATUS), 'event_time' of collisions (NaN if none)
+        and 'steps' taken per particle
+    """
+    if method not in ('rk4', 'adaptive'):
+        raise ValueError(f"Unknown method '{method}' (use 'rk4' or 'adaptive')")
+
+    state = np.concatenate((np.asarray(positions, dtype=np.float64),
+                            np.asarray(velocities, dtype=np.float64)), axis=1)
+    n = len(state)
+    field = _CavityField(config, sun_position)
+
+    # Output times always end exactly at t_end
+    times = np.arange(0.0, t_end, output_interval)
+    times = np.append(times[times < t_end - 1e-9 * output_interval], t_end)
+    shape = (len(times), n, 6)
+    if output_path is not None:
+        trajectory = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64, shape=shape)
+    else:
+        trajectory = np.empty(shape)
+
+    status = np.zeros(n, dtype=np.int8)
+    event_time = np.full(n, np.nan)
+    steps = np.zeros(n, dtype=np.int64)
+    t = np.zeros(n)
+    h = np.full(n, float(dt))
+
+    # Particles that start inside the sun or outside the cavity are stopped at once
+    to_sun, to_wall = field.clearances(state[:, :3])
+    status[to_sun <= 0] = TRAJECTORY_STATUS['sun']
+    status[(to_wall <= 0) & (status == 0)] = TRAJECTORY_STATUS['wall']
+    event_time[status > 0] = 0.0
+
+    buffer = np.empty((min(chunk_snapshots, len(times)), n, 6))
+    buffer_start = 0
+    buffer[0] = state
+
+    for k in range(1, len(times)):
+        t_out = times[k]
+
+        while True:
+            idx = np.flatnonzero((status == 0) & (t < t_out))
+            if len(idx) == 0:
+                break
+
+            step = np.minimum(h[idx], t_out - t[idx])
+            current = state[idx]
+            if method == 'rk4':
+                candidate = _rk4_step(field, current, step)
+                accepted = np.ones(len(idx), dtype=bool)
+            else:
+                candidate, error = _dopri_step(field, current, step)
+                scale = atol + rtol * np.maximum(np.abs(current), np.abs(candidate))
+                error_norm = np.max(np.abs(error) / scale, axis=1)
+                accepted = error_norm <= 1.0
+                factor = np.clip(0.9 * np.maximum(error_norm, 1e-10)**-0.2, 0.2, 5.0)
+                # Steps shortened only to hit an output time keep their size
+                h[idx] = np.where(accepted & (step < h[idx]), h[idx], step * factor)
+
+            idx, current, candidate, step = idx[accepted], current[accepted], candidate[accepted], step[accepted]
+            steps[idx] += 1
+
+            # Collisions: locate the crossing along the step's chord. The sun is
+            # tested over the whole chord; the wall encloses a convex cavity, so
+            # a chord can only cross it if it ends outside.
+            sun_fraction = field.sun_entry(current[:, :3], candidate[:, :3])
+            _, old_wall = field.clearances(current[:, :3])
+            _, new_wall = field.clearances(candidate[:, :3])
+            hit_sun = np.isfinite(sun_fraction)
+            hit_wall = (new_wall <= 0) & ~hit_sun
+            hit = hit_sun | hit_wall
+            if np.any(hit):
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    wall_fraction = old_wall / (old_wall - new_wall)
+                fraction = np.where(hit_sun, sun_fraction, wall_fraction)[hit]
+                candidate[hit] = current[hit] + fraction[:, np.newaxis] * (candidate[hit] - current[hit])
+                event_time[idx[hit]] = t[idx[hit]] + fraction * step[hit]
+                status[idx[hit_sun]] = TRAJECTORY_STATUS['sun']
+                status[idx[hit_wall]] = TRAJECTORY_STATUS['wall']
+
+            state[idx] = candidate
+            t[idx] += step
+
+        slot = k - buffer_start
+        if slot == len(buffer):
+            trajectory[buffer_start:k] = buffer
+            buffer_start = k
+            slot = 0
+        buffer[slot] = state
+
+    trajectory[buffer_start:len(times)] = buffer[:len(times) - buffer_start]
+    if output_path is not None:
+        trajectory.flush()
+
+    counts = {name: int(np.count_nonzero(status == code)) for name, code in TRAJECTORY_STATUS.items()}
+    logger.info(f"Integrated {n} particles to t={t_end:.0f} s ({method}): "
+                f"{counts['sun']} hit the sun, {counts['wall']} reached the wall, "
+                f"{int(steps.sum())} steps")
+
+    return {
+        'times': times,
+        'trajectory': trajectory,
+        'positions': state[:, :3].copy(),
+        'velocities': state[:, 3:].copy(),
+        'status': status,
+        'event_time': event_time,
+        'steps': steps
+    }
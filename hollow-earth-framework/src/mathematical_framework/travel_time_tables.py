@@ -0,0 +1,270 @@
+"""
+HOLLOW EARTH MATHEMATICAL FRAMEWORK
+Travel-Time Tables - precomputed, memory-mapped first arrivals
+
+Builds dense first-arrival travel-time tables (phase × source depth ×
+epicentral distance) for a configuration once with the vectorized ray
+tracer, stores them as .npy files that are memory-mapped on load, and
+answers millions of (distance, depth) queries with vectorized bilinear
+interpolation. Tables are cached on disk under a digest of the shells,
+velocities and grid, so repeated runs skip ray tracing entirely.
+
+License: MIT
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from .core_equations import FRAMEWORK_VERSION, ModelConfiguration, SeismicWaveguideModel
+from .ray_tracing import shell_velocities, trace_rays
+from .result_store import default_store_path
+
+logger = logging.getLogger(__name__)
+
+# Default grids
+DEFAULT_DISTANCES = np.linspace(0.0, 180.0, 1801)   # degrees
+DEFAULT_DEPTHS = np.linspace(0.0, 700e3, 71)        # m
+DEFAULT_RAYS = 20_000
+
+def default_table_dir() -> Path:
+    """Directory of cached travel-time tables, next to the result store."""
+    return default_store_path().parent / 'travel_times'
+
+def _first_arrivals(rays: Dict[str, np.ndarray], distances: np.ndarray,
+                    boundaries: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Earliest travel time at each grid distance from a fan of rays.
+
+    Consecutive rays form a branch segment only if they have the same ray
+    type, bottom in the same layer and land at most one grid spacing apart;
+    each segment is interpolated linearly onto the grid distances it spans
+    and the minimum over all branches is kept (first arrival through
+    triplications). Jumps between branches are not bridged, so shadow zones
+    stay NaN.
+
+    Args:
+        rays: Output of trace_rays
+        distances: Regular epicentral-distance grid (degrees)
+        boundaries: Layer boundary radii (m); rays bottoming in different
+            layers are never joined (default: only ray type and spacing split)
+
+    Returns:
+        First-arrival times (s) on the grid, NaN where no branch arrives
+    """
+    first = np.full(len(distances), np.inf)
+    t, x, kind = rays['travel_time'], rays['distance_deg'], rays['ray_type']
+
+    spacing = (distances[-1] - distances[0]) / max(len(distances) - 1, 1)
+    if boundaries is not None:
+        layer = np.searchsorted(np.sort(boundaries), rays['bottom_radius'], side='right')
+    else:
+        layer = np.zeros(len(t), dtype=np.intp)
+
+    valid = (np.isfinite(t[:-1]) & np.isfinite(t[1:]) & (kind[:-1] == kind[1:]) &
+             (layer[:-1] == layer[1:]) & (np.abs(x[1:] - x[:-1]) <= spacing))
+    x0, x1, t0, t1 = x[:-1][valid], x[1:][valid], t[:-1][valid], t[1:][valid]
+    lo = np.searchsorted(distances, np.minimum(x0, x1), side='left')
+    hi = np.searchsorted(distances, np.maximum(x0, x1), side='right')
+    counts = hi - lo
+
+    segment = np.repeat(np.arange(len(counts)), counts)
+    grid = np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    span = x1[segment] - x0[segment]
+    fraction = np.where(span != 0, (distances[grid] - x0[segment]) / np.where(span != 0, span, 1.0), 0.0)
+    np.minimum.at(first, grid, t0[segment] + fraction * (t1[segment] - t0[segment]))
+
+    # Isolated rays landing exactly on a grid point
+    exact = np.isfinite(t)
+    on_grid = np.searchsorted(distances, x[exact])
+    hit = (on_grid < len(distances)) & (distances[np.minimum(on_grid, len(distances) - 1)] == x[exact])
+    np.minimum.at(first, on_grid[hit], t[exact][hit])
+
+    first[np.isinf(first)] = np.nan
+    return first
+
+class TravelTimeTable:
+    """
+    First-arrival travel times on a regular (phase, depth, distance) grid.
+
+    times has shape (n_phases, n_depths, n_distances) and is NaN where no
+    ray of that phase arrives.
+    """
+
+    def __init__(self, times: np.ndarray, phases: Sequence[str],
+                 depths: np.ndarray, distances: np.ndarray, metadata: Optional[Dict] = None):
+        """
+        Initialize a travel-time table.
+
+        Args:
+            times: Travel times (s), shape (n_phases, n_depths, n_distances)
+            phases: Phase names along the first axis
+            depths: Regular source-depth grid (m)
+            distances: Regular epicentral-distance grid (degrees)
+            metadata: Optional provenance (key, velocities, framework version)
+        """
+        self.times = times
+        self.phases = tuple(phases)
+        self.depths = np.asarray(depths, dtype=np.float64)
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self.metadata = metadata or {}
+
+    @classmethod
+    def build(cls, config: ModelConfiguration,
+              phases: Sequence[str] = ('P', 'S'),
+              depths: np.ndarray = DEFAULT_DEPTHS,
+              distances: np.ndarray = DEFAULT_DISTANCES,
+              n_rays: int = DEFAULT_RAYS,
+              waveguide: Optional[SeismicWaveguideModel] = None) -> 'TravelTimeTable':
+        """
+        Trace ray fans for every phase and depth and tabulate first arrivals.
+
+        Args:
+            config: Model configuration
+            phases: Phases to tabulate ('P', 'S')
+            depths: Regular source-depth grid (m)
+            distances: Regular epicentral-distance grid (degrees)
+            n_rays: Take-off angles per fan (0° to 180°)
+            waveguide: Velocity source (default: SeismicWaveguideModel())
+
+        Returns:
+            TravelTimeTable held in memory
+        """
+        start = time.perf_counter()
+        waveguide = waveguide or SeismicWaveguideModel()
+        depths = np.asarray(depths, dtype=np.float64)
+        distances = np.asarray(distances, dtype=np.float64)
+        angles = np.linspace(0.0, 180.0, n_rays)
+        boundaries = shell_velocities(config, waveguide)[1]
+
+        times = np.empty((len(phases), len(depths), len(distances)))
+        for i, phase in enumerate(phases):
+            for j, depth in enumerate(depths):
+                rays = trace_rays(config, angles, phase=phase, source_depth=depth, waveguide=waveguide)
+                times[i, j] = _first_arrivals(rays, distances, boundaries)
+
+        logger.info(f"Built travel-time table {times.shape} in {time.perf_counter() - start:.2f} s")
+        return cls(times, phases, depths, distances,
+                   {'key': table_key(config, phases, depths, distances, n_rays, waveguide)})
+
+    def save(self, path: str):
+        """Write the table to a directory (times.npy plus metadata.json)."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        tmp = path / f'times.npy.tmp{os.getpid()}'
+        with open(tmp, 'wb') as f:
+            np.save(f, np.ascontiguousarray(self.times))
+        os.replace(tmp, path / 'times.npy')
+
+        metadata = dict(self.metadata, phases=list(self.phases),
+                        depths=self.depths.tolist(), distances=self.distances.tolist())
+        tmp = path / f'metadata.json.tmp{os.getpid()}'
+        tmp.write_text(json.dumps(metadata))
+        os.replace(tmp, path / 'metadata.json')
+
+    @classmethod
+    def load(cls, path: str) -> 'TravelTimeTable':
+        """Load a saved table; the times are memory-mapped, not read."""
+        path = Path(path)
+        metadata = json.loads((path / 'metadata.json').read_text())
+        times = np.load(path / 'times.npy', mmap_mode='r')
+        return cls(times, metadata.pop('phases'), metadata.pop('depths'),
+                   metadata.pop('distances'), metadata)
+
+    def travel_time(self, distance_deg: np.ndarray, depth: np.ndarray,
+                    phase: str = 'P') -> np.ndarray:
+        """
+        Interpolated first-arrival travel time.
+
+        Bilinear interpolation on the regular grid; cell indices are computed
+        arithmetically, so each query is O(1). Queries outside the grid or in
+        cells without arrivals return NaN.
+
+        Args:
+            distance_deg: Epicentral distances (degrees), any shape
+            depth: Source depths (m), broadcastable to distance_deg
+            phase: Phase name
+
+        Returns:
+            Travel times (s)
+        """
+        if phase not in self.phases:
+            raise ValueError(f"Phase '{phase}' not in table (have {self.phases})")
+        grid = self.times[self.phases.index(phase)]
+
+        x, z = np.broadcast_arrays(np.asarray(distance_deg, dtype=np.float64),
+                                   np.asarray(depth, dtype=np.float64))
+
+        def cell(values, axis):
+            step = (axis[-1] - axis[0]) / max(len(axis) - 1, 1)
+            position = (values - axis[0]) / step if step > 0 else np.zeros_like(values)
+            index = np.clip(np.floor(position).astype(np.intp), 0, max(len(axis) - 2, 0))
+            weight = np.clip(position - index, 0.0, 1.0) if len(axis) > 1 else np.zeros_like(values)
+            inside = (values >= axis[0]) & (values <= axis[-1])
+            return index, weight, inside
+
+        ix, wx, inside_x = cell(x, self.distances)
+        iz, wz, inside_z = cell(z, self.depths)
+        ix1 = np.minimum(ix + 1, len(self.distances) - 1)
+        iz1 = np.minimum(iz + 1, len(self.depths) - 1)
+
+        result = ((1 - wz) * ((1 - wx) * grid[iz, ix] + wx * grid[iz, ix1]) +
+                  wz * ((1 - wx) * grid[iz1, ix] + wx * grid[iz1, ix1]))
+        return np.where(inside_x & inside_z, result, np.nan)
+
+def table_key(config: ModelConfiguration, phases: Sequence[str], depths: np.ndarray,
+              distances: np.ndarray, n_rays: int,
+              waveguide: Optional[SeismicWaveguideModel] = None) -> str:
+    """Digest of everything a travel-time table depends on."""
+    waveguide = waveguide or SeismicWaveguideModel()
+    sun_radius = config.central_sun['radius'] if config.central_sun else None
+    payload = json.dumps({
+        'shells': config.shell_table.content_hash,
+        'materials': list(config.shell_table.material_types),
+        'cavity': float(config.central_hollow_radius),
+        'sun_radius': sun_radius,
+        'velocities': [waveguide.v_p_crust, waveguide.v_s_crust, waveguide.v_p_mantle,
+                       waveguide.v_s_mantle, waveguide.v_air],
+        'phases': list(phases),
+        'depths': np.asarray(depths, dtype=np.float64).tolist(),
+        'distances': np.asarray(distances, dtype=np.float64).tolist(),
+        'n_rays': int(n_rays),
+        'framework_version': FRAMEWORK_VERSION,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+def get_travel_time_table(config: ModelConfiguration,
+                          cache_dir: Optional[str] = None,
+                          phases: Sequence[str] = ('P', 'S'),
+                          depths: np.ndarray = DEFAULT_DEPTHS,
+                          distances: np.ndarray = DEFAULT_DISTANCES,
+                          n_rays: int = DEFAULT_RAYS,
+                          waveguide: Optional[SeismicWaveguideModel] = None) -> TravelTimeTable:
+    """
+    Load the cached travel-time table for a configuration, building it on a miss.
+
+    Args:
+        config: Model configuration
+        cache_dir: Table directory (default: default_table_dir())
+        phases: Phases to tabulate
+        depths: Regular source-depth grid (m)
+        distances: Regular epicentral-distance grid (degrees)
+        n_rays: Take-off angles per fan
+        waveguide: Velocity source (default: SeismicWaveguideModel())
+
+    Returns:
+        Memory-mapped TravelTimeTable
+    """
+    key = table_key(config, phases, depths, distances, n_rays, waveguide)
+    path = Path(cache_dir) if cache_dir is not None else default_table_dir()
+    path = path / key
+
+    if not (path / 'metadata.json').exists():
+        TravelTimeTable.build(config, phases, depths, distances, n_rays, waveguide).save(path)
+    return TravelTimeTable.load(path)
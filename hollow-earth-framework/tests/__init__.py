@@ -0,0 +1 @@
+"""Tests for the Hollow Earth Mathematical Framework."""
@@ -0,0 +1,128 @@
+"""Tests for mathematical_framework.catalog_scoring."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.catalog_scoring import (
+    MIN_RESIDUAL_RANGE, _ResidualAccumulator, iter_catalog_chunks, residual_bins, score_catalog
+)
+from mathematical_framework.core_equations import (
+    CONSTANTS, ModelConfiguration, SeismicWaveguideModel, SphericalShell
+)
+
+R = CONSTANTS.R_EARTH
+
+
+@pytest.fixture(scope='module')
+def uniform():
+    shells = [SphericalShell(outer_radius=R, inner_radius=0.0, density=3000.0, material_type="crustal")]
+    return ModelConfiguration(shells=shells, central_hollow_radius=0.0)
+
+
+def chord_time(distance_deg, velocity):
+    return 2 * R * np.sin(np.radians(distance_deg) / 2) / velocity
+
+
+def write_catalog(path, lines):
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+def test_ragged_rows_become_nan(tmp_path):
+    path = write_catalog(tmp_path / 'catalog.csv', [
+        'phase,depth_km,distance_deg,travel_time,station',
+        'P,10,30,300,AAA',
+        'P,10,40',
+        'S,20,50,600,CCC',
+    ])
+
+    chunk = next(iter_catalog_chunks(path))
+    assert len(chunk['phase']) == 3
+    np.testing.assert_array_equal(chunk['distance_deg'], [30.0, 40.0, 50.0])
+    np.testing.assert_array_equal(chunk['travel_time'][[0, 2]], [300.0, 600.0])
+    assert np.isnan(chunk['travel_time'][1])
+
+
+def test_coordinates_and_arrival_times(tmp_path):
+    path = write_catalog(tmp_path / 'catalog.csv', [
+        'phase,depth_km,event_lat,event_lon,station_lat,station_lon,arrival_time,origin_time',
+        ' p ,5,0,0,0,90,1000.5,400.25',
+        'S,5,90,0,-90,0,2000,1000',
+    ])
+
+    chunks = list(iter_catalog_chunks(path, chunk_size=1))
+    assert len(chunks) == 2
+    np.testing.assert_array_equal(chunks[0]['phase'], ['P'])
+    np.testing.assert_allclose([chunks[0]['distance_deg'][0], chunks[1]['distance_deg'][0]], [90.0, 180.0])
+    np.testing.assert_array_equal([chunks[0]['travel_time'][0], chunks[1]['travel_time'][0]], [600.25, 1000.0])
+    np.testing.assert_array_equal(chunks[0]['depth'], [5000.0])
+
+
+def test_missing_columns_rejected(tmp_path):
+    path = write_catalog(tmp_path / 'catalog.csv', ['phase,depth_km,travel_time', 'P,0,1'])
+    with pytest.raises(ValueError):
+        next(iter_catalog_chunks(path))
+
+
+def test_accumulator_counts_clipped_residuals():
+    accumulator = _ResidualAccumulator(residual_bins())
+    accumulator.add(np.array([1.0, -2.0, MIN_RESIDUAL_RANGE + 10.0, -MIN_RESIDUAL_RANGE - 10.0, np.nan]))
+    summary = accumulator.summary()
+
+    assert summary['count'] == 4
+    assert summary['unpredicted'] == 1
+    assert summary['clipped'] == 2
+    assert summary['mean'] == pytest.approx(-0.25)
+
+
+def test_bins_widen_to_max_travel_time():
+    bins = residual_bins(5000.0)
+    assert bins[0] <= -5000.0 and bins[-1] >= 5000.0
+    assert residual_bins(10.0)[-1] == pytest.approx(MIN_RESIDUAL_RANGE)
+
+
+def test_score_catalog_large_residuals_not_clipped(uniform, tmp_path):
+    waveguide = SeismicWaveguideModel()
+    distances = np.array([20.0, 60.0, 120.0, 170.0])
+    offset = 3000.0
+    lines = ['phase,depth_km,distance_deg,travel_time']
+    for distance in distances:
+        lines.append(f'P,0,{distance},{chord_time(distance, waveguide.v_p_crust) + offset}')
+    lines.append('PKP,0,50,100')
+    path = write_catalog(tmp_path / 'catalog.csv', lines)
+
+    results = score_catalog(path, hollow_config=uniform, standard_config=uniform,
+                            chunk_size=2, table_dir=str(tmp_path / 'tables'))
+
+    assert results['n_arrivals'] == 5
+    assert results['n_skipped_phases'] == 1
+    for name in ('hollow', 'standard'):
+        summary = results['models'][name]['P']
+        assert summary['count'] == 4
+        assert summary['clipped'] == 0
+        assert summary['mean'] == pytest.approx(offset, abs=1.0)
+        assert summary['median'] == pytest.approx(offset, abs=1.0)
+        assert results['models'][name]['S']['count'] == 0
+
+
+def test_missing_observations_are_not_unpredicted(uniform, tmp_path):
+    waveguide = SeismicWaveguideModel()
+    path = write_catalog(tmp_path / 'catalog.csv', [
+        'phase,depth_km,distance_deg,travel_time',
+        f'P,0,30,{chord_time(30.0, waveguide.v_p_crust)}',
+        'P,0,40,',
+        'P,0,,500',
+        'S,0,50',
+        'PKP,0,50,',
+    ])
+
+    results = score_catalog(path, hollow_config=uniform, standard_config=uniform,
+                            table_dir=str(tmp_path / 'tables'))
+
+    assert results['n_arrivals'] == 5
+    assert results['n_skipped_phases'] == 1
+    assert results['n_missing_observations'] == 3
+    for name in ('hollow', 'standard'):
+        assert results['models'][name]['P']['count'] == 1
+        assert results['models'][name]['P']['unpredicted'] == 0
+        assert results['models'][name]['S'] == {'count': 0, 'unpredicted': 0, 'clipped': 0}
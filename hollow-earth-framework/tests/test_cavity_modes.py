@@ -0,0 +1,80 @@
+"""Tests for mathematical_framework.cavity_modes."""
+
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+from scipy.special import spherical_jn
+
+from mathematical_framework.cavity_modes import cavity_mode_spectrum, spherical_bessel_derivative_roots
+from mathematical_framework.core_equations import SeismicWaveguideModel
+
+# Tabulated roots of j_l'(x) (Abramowitz & Stegun 10.1)
+KNOWN_ROOTS = {
+    0: [4.493409, 7.725252, 10.904122],
+    1: [2.081576, 5.940370, 9.205840],
+    2: [3.342094, 7.289932, 10.613855],
+}
+
+
+def test_known_roots():
+    roots = spherical_bessel_derivative_roots(2, 3)
+    for l, expected in KNOWN_ROOTS.items():
+        np.testing.assert_allclose(roots[l], expected, atol=1e-6)
+
+
+def test_roots_are_zeros_of_derivative():
+    roots = spherical_bessel_derivative_roots(12, 6)
+    degrees = np.arange(13)[:, np.newaxis]
+
+    assert roots.shape == (13, 6)
+    assert np.all(np.diff(roots, axis=1) > 0)
+    np.testing.assert_allclose(spherical_jn(degrees, roots, derivative=True), 0.0, atol=1e-12)
+
+
+def test_l0_roots_match_tan_x_equals_x():
+    # j_0'(x) = 0  <=>  tan x = x, with one root in each ((k + 1)π, (k + 3/2)π)
+    roots = spherical_bessel_derivative_roots(0, 5)[0]
+    expected = [brentq(lambda x: np.sin(x) - x * np.cos(x), (k + 1) * np.pi, (k + 1.5) * np.pi - 1e-9)
+                for k in range(5)]
+    np.testing.assert_allclose(roots, expected, rtol=1e-13)
+
+
+def test_spectrum_scales_with_radius():
+    radii = np.array([1e6, 2e6, 4e6])
+    spectrum = cavity_mode_spectrum(radii, l_max=4, n_max=3)
+    c = SeismicWaveguideModel().v_air
+
+    assert spectrum['frequency'].shape == (3, 15)
+    assert np.all(np.diff(spectrum['x']) >= 0)
+    np.testing.assert_allclose(spectrum['frequency'], c * spectrum['x'] / (2 * np.pi * radii[:, np.newaxis]))
+    np.testing.assert_allclose(spectrum['frequency'][0], 2 * spectrum['frequency'][1])
+    np.testing.assert_array_equal(spectrum['degeneracy'], 2 * spectrum['l'] + 1)
+    # Lowest mode is the l = 1 sloshing mode
+    assert spectrum['l'][0] == 1 and spectrum['n'][0] == 1
+
+
+def test_scalar_radius_matches_array():
+    scalar = cavity_mode_spectrum(3e6, l_max=3, n_max=2)
+    array = cavity_mode_spectrum([1e6, 3e6], l_max=3, n_max=2)
+    np.testing.assert_array_equal(scalar['frequency'][0], array['frequency'][1])
+    np.testing.assert_array_equal(scalar['q'][0], array['q'][1])
+
+
+def test_damping():
+    lossless = cavity_mode_spectrum(2e6, l_max=3, n_max=2)
+    lossy = cavity_mode_spectrum(2e6, l_max=3, n_max=2, q_medium=100.0)
+
+    assert 0.0 < lossless['wall_absorption'] < 1.0
+    np.testing.assert_allclose(1.0 / lossy['q'], 1.0 / lossless['q'] + 1.0 / 100.0)
+    np.testing.assert_allclose(lossy['ringing_time'], lossy['q'] / (np.pi * lossy['frequency']))
+    # Wall losses alone: energy decay time 4a / (3cα) for every mode
+    c = SeismicWaveguideModel().v_air
+    tau_energy = lossless['q'] / (2 * np.pi * lossless['frequency'])
+    np.testing.assert_allclose(tau_energy, 4 * 2e6 / (3 * c * lossless['wall_absorption']))
+
+
+def test_matched_impedance_absorbs_everything():
+    waveguide = SeismicWaveguideModel()
+    wall_density = 1.2 * waveguide.v_air / waveguide.v_p_crust
+    spectrum = cavity_mode_spectrum(1e6, l_max=1, n_max=1, air_density=1.2, wall_density=wall_density)
+    assert spectrum['wall_absorption'] == pytest.approx(1.0)
@@ -0,0 +1,401 @@
+"""Tests for mathematical_framework.core_equations."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import (
+    CONSTANTS, HollowEarthModel, ModelConfiguration, SeismicWaveguideModel, ShellTable
+)
+
+
+@pytest.fixture
+def model():
+    return HollowEarthModel(cache_size=0)
+
+
+@pytest.fixture(params=['standard', 'hollow', 'central_sun'])
+def config(request, model):
+    if request.param == 'standard':
+        return model.create_standard_earth_model()
+    if request.param == 'hollow':
+        return model.create_hollow_earth_model()
+    return model.create_hollow_earth_with_central_sun()
+
+
+def per_shell_gravity(radius, shells):
+    """Original scalar rule: sum whole shells below r and the fraction of the shell containing it."""
+    if radius <= 0:
+        return 0.0
+    enclosed = 0.0
+    for shell in shells:
+        r_out, r_in = shell.outer_radius, shell.inner_radius
+        if radius >= r_out:
+            enclosed += shell.mass
+        elif radius > r_in:
+            enclosed += shell.mass * (radius**3 - r_in**3) / (r_out**3 - r_in**3)
+    return CONSTANTS.G * enclosed / radius**2
+
+
+def test_gravity_at_radii_matches_per_shell_loop(model, config):
+    radii = np.concatenate(([0.0, config.central_hollow_radius],
+                            np.linspace(1e3, 1.2 * CONSTANTS.R_EARTH, 257),
+                            [shell.outer_radius for shell in config.shells],
+                            [shell.inner_radius for shell in config.shells]))
+    expected = np.array([per_shell_gravity(r, config.shells) for r in radii])
+
+    np.testing.assert_allclose(model.calculate_gravity_at_radii(radii, config), expected,
+                               rtol=1e-12, atol=0.0)
+    np.testing.assert_allclose([model.calculate_gravity_at_radius(r, config) for r in radii], expected,
+                               rtol=1e-12, atol=0.0)
+
+
+def test_gravity_at_radii_keeps_shape(model, config):
+    radii = np.linspace(0.0, CONSTANTS.R_EARTH, 12).reshape(3, 4)
+
+    assert model.calculate_gravity_at_radii(radii, config).shape == (3, 4)
+
+
+def test_gravity_profile_uses_array_engine(model, config):
+    radii, gravity = model.calculate_gravity_profile(config, n_points=50)
+
+    assert radii[0] == config.central_hollow_radius
+    assert radii[-1] == CONSTANTS.R_EARTH
+    np.testing.assert_allclose(gravity[-1], CONSTANTS.G * config.shell_mass / CONSTANTS.R_EARTH**2,
+                               rtol=1e-12)
+
+
+def test_total_mass_counts_central_sun(model, config):
+    sun_mass = config.central_sun['mass'] if config.central_sun else 0.0
+    constraints = model.validate_physical_constraints(config)
+
+    assert config.shell_mass == config.shell_table.total_mass
+    np.testing.assert_allclose(config.total_mass, config.shell_mass + sun_mass, rtol=1e-15)
+    np.testing.assert_allclose(config.surface_gravity, CONSTANTS.G * config.total_mass / CONSTANTS.R_EARTH**2,
+                               rtol=1e-15)
+    assert constraints['mass_conservation'] == (abs(config.total_mass / CONSTANTS.M_EARTH - 1) < 0.01)
+    assert constraints['earth_surface_gravity'] == (9.5 <= config.surface_gravity <= 10.5)
+
+
+def test_shell_table_round_trip(config):
+    table = config.shell_table
+    shells = table.to_shells()
+
+    assert [shell.name for shell in shells] == [shell.name for shell in config.shells]
+    assert shells == config.shells
+    rebuilt = ShellTable.from_shells(shells)
+    for column in ('outer_radii', 'inner_radii', 'densities', 'masses', 'cumulative_masses'):
+        np.testing.assert_array_equal(getattr(rebuilt, column), getattr(table, column))
+    assert rebuilt.material_types == table.material_types
+    assert rebuilt.content_hash == table.content_hash
+
+
+def test_shell_table_matches_shell_masses(config):
+    table = config.shell_table
+
+    assert np.all(np.diff(table.outer_radii) > 0)
+    np.testing.assert_allclose(table.total_mass, sum(shell.mass for shell in config.shells),
+                               rtol=1e-14)
+    assert not table.densities.flags.writeable
+
+
+def test_configuration_from_shell_table(config):
+    rebuilt = ModelConfiguration.from_shell_table(config.shell_table, central_sun=config.central_sun)
+
+    assert rebuilt.central_hollow_radius == config.central_hollow_radius
+    assert rebuilt.total_mass == config.total_mass
+    assert rebuilt.shell_table.content_hash == config.shell_table.content_hash
+
+
+def test_shell_table_is_the_only_stored_copy(config):
+    table = config.shell_table
+    rebuilt = ModelConfiguration.from_shell_table(table, central_sun=config.central_sun)
+
+    assert rebuilt.shell_table is table
+    assert rebuilt._shells is None
+    assert len(rebuilt.shells) == len(table)
+    assert rebuilt.shell_table is table
+
+
+def test_shell_table_rejects_bad_columns():
+    with pytest.raises(ValueError):
+        ShellTable(outer_radii=[2.0, 3.0], inner_radii=[1.0], densities=[1.0, 1.0])
+    with pytest.raises(ValueError):
+        ShellTable(outer_radii=[1.0], inner_radii=[2.0], densities=[1.0])
+    with pytest.raises(ValueError):
+        ShellTable(outer_radii=[2.0], inner_radii=[1.0], densities=[-1.0])
+
+
+@pytest.mark.parametrize('target_ratio, method', [(1.0, 'root-density'), (0.81, 'root-thickness')])
+def test_mass_optimizer_direct_solve(model, target_ratio, method):
+    target = target_ratio * CONSTANTS.M_EARTH
+    config = model.optimize_for_mass_conservation(target_mass=target)
+
+    assert model.last_optimization['method'] == method
+    assert model.last_optimization['success']
+    assert model.last_optimization['evaluations'] <= 2
+    np.testing.assert_allclose(config.total_mass, target, rtol=1e-10)
+
+
+def test_mass_optimizer_builds_only_the_result(model, monkeypatch):
+    built = []
+    create = model.create_hollow_earth_model
+    monkeypatch.setattr(model, 'create_hollow_earth_model', lambda **kwargs: built.append(kwargs) or create(**kwargs))
+    model.optimize_for_mass_conservation()
+
+    assert len(built) == 1 and 'dense_shell_density' in built[0]
+
+
+def test_mass_optimizer_falls_back_when_unreachable(model):
+    config = model.optimize_for_mass_conservation(target_mass=3.0 * CONSTANTS.M_EARTH)
+
+    assert model.last_optimization['method'] == 'L-BFGS-B'
+    density = config.shell_table.densities.max()
+    assert density == pytest.approx(HollowEarthModel.MASS_OPTIMIZATION_BOUNDS[0][1])
+
+
+def test_solve_mass_parameters_is_vectorized(model):
+    targets = np.array([0.81, 1.0, 1.2]) * CONSTANTS.M_EARTH
+    density, thickness, feasible = model._solve_mass_parameters(
+        targets, 200e3, HollowEarthModel.MASS_OPTIMIZATION_BOUNDS)
+
+    assert feasible.all()
+    for target, rho, t in zip(targets, density, thickness):
+        config = model.create_hollow_earth_model(dense_shell_density=rho, inner_shell_thickness=t)
+        np.testing.assert_allclose(config.total_mass, target, rtol=1e-10)
+
+
+@pytest.mark.parametrize('target_ratio, gravity_ratio', [(1.0, 0.2), (1.0, 1.0), (1.6, 1.0), (3.0, 2.0)])
+def test_gravity_balance_counts_sun_mass(model, target_ratio, gravity_ratio):
+    target = target_ratio * CONSTANTS.M_EARTH
+    solution = model.optimize_gravity_balance_batch(target, gravity_ratio)
+
+    assert solution['feasible']
+    np.testing.assert_allclose(solution['total_mass'], target, rtol=1e-10)
+    np.testing.assert_allclose(solution['shell_mass'] + solution['sun_mass'], target, rtol=1e-10)
+    np.testing.assert_allclose(solution['exterior_gravity'], CONSTANTS.G * target / CONSTANTS.R_EARTH**2,
+                               rtol=1e-10)
+    np.testing.assert_allclose(solution['interior_gravity'] / solution['exterior_gravity'], gravity_ratio,
+                               rtol=1e-10)
+    assert solution['dense_mass_fraction'] > HollowEarthModel.MIN_DENSE_MASS_FRACTION
+
+
+def test_gravity_balance_default_is_feasible(model):
+    config = model.optimize_for_gravity_balance()
+    sun = config.central_sun
+
+    assert model.last_optimization['success']
+    np.testing.assert_allclose(config.total_mass, CONSTANTS.M_EARTH, rtol=1e-10)
+    np.testing.assert_allclose(config.surface_gravity, CONSTANTS.G * CONSTANTS.M_EARTH / CONSTANTS.R_EARTH**2,
+                               rtol=1e-10)
+    interior = CONSTANTS.G * sun['mass'] / config.central_hollow_radius**2
+    np.testing.assert_allclose(interior, config.surface_gravity, rtol=1e-10)
+    assert sun['radius'] + HollowEarthModel.SUN_SAFETY_MARGIN <= config.central_hollow_radius
+    assert all(model.validate_physical_constraints(config).values())
+
+
+def test_gravity_balance_clips_sun_radius_into_cavity(model):
+    solution = model.optimize_gravity_balance_batch(CONSTANTS.M_EARTH, 1.0, sun_radius=5000e3)
+
+    assert solution['feasible']
+    assert solution['sun_radius'] == HollowEarthModel.GRAVITY_BALANCE_BOUNDS['sun_radius'][1]
+    assert solution['sun_radius'] + HollowEarthModel.SUN_SAFETY_MARGIN <= solution['cavity_radius']
+
+
+def test_gravity_balance_flags_unreachable_targets(model):
+    # Lighter than the thinnest shells allow: no geometry reaches the target
+    solution = model.optimize_gravity_balance_batch(np.array([0.1, 0.5]) * CONSTANTS.M_EARTH, 1.0)
+
+    assert not solution['feasible'].any()
+    np.testing.assert_array_equal(solution['outer_shell_thickness'], 100e3)
+    assert np.all(solution['total_mass'] > [0.1 * CONSTANTS.M_EARTH, 0.5 * CONSTANTS.M_EARTH])
+
+
+def test_cache_hits_and_misses():
+    model = HollowEarthModel(cache_size=8)
+    config = model.create_hollow_earth_model()
+
+    first = model.calculate_gravity_at_radius(5e6, config)
+    second = model.calculate_gravity_at_radius(5e6, config)
+    assert first == second
+    assert model.cache_info()['hits'] == 1
+    assert model.cache_info()['misses'] == 1
+
+    # Equal contents share entries across configuration objects
+    model.calculate_gravity_at_radius(5e6, model.create_hollow_earth_model())
+    assert model.cache_info()['hits'] == 2
+
+
+def test_cache_returns_copies():
+    model = HollowEarthModel(cache_size=8)
+    config = model.create_hollow_earth_model()
+
+    radii, gravity = model.calculate_gravity_profile(config, n_points=10)
+    gravity[:] = -1.0
+    assert np.all(model.calculate_gravity_profile(config, n_points=10)[1] >= 0.0)
+
+
+def test_cache_is_bounded_lru():
+    model = HollowEarthModel(cache_size=3)
+    config = model.create_hollow_earth_model()
+
+    for radius in (1e6, 2e6, 3e6, 4e6):
+        model.calculate_gravity_at_radius(radius, config)
+    assert model.cache_info()['size'] == 3
+
+    model.calculate_gravity_at_radius(1e6, config)
+    assert model.cache_info()['hits'] == 0
+    model.calculate_gravity_at_radius(4e6, config)
+    assert model.cache_info()['hits'] == 1
+
+
+def test_cache_invalidation_after_mutation():
+    model = HollowEarthModel(cache_size=8)
+    config = model.create_hollow_earth_model()
+    other = model.create_standard_earth_model()
+    before = model.calculate_gravity_at_radius(CONSTANTS.R_EARTH, config)
+    model.calculate_gravity_at_radius(CONSTANTS.R_EARTH, other)
+
+    config.shells[1].density *= 1.1
+    model.invalidate_cache(config)
+    after = model.calculate_gravity_at_radius(CONSTANTS.R_EARTH, config)
+
+    assert after > before
+    np.testing.assert_allclose(after, config.surface_gravity, rtol=1e-12)
+    assert model.cache_info()['size'] == 2
+    model.calculate_gravity_at_radius(CONSTANTS.R_EARTH, other)
+    assert model.cache_info()['hits'] == 1
+
+    model.invalidate_cache()
+    assert model.cache_info()['size'] == 0
+
+
+def test_cache_disabled():
+    model = HollowEarthModel(cache_size=0)
+    config = model.create_hollow_earth_model()
+    model.calculate_gravity_at_radius(5e6, config)
+    model.calculate_gravity_at_radius(5e6, config)
+
+    assert model.cache_info() == {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 0}
+
+
+RHO_UNIFORM = 5500.0
+
+
+def uniform_sphere_pressure(r):
+    return (2.0/3.0) * np.pi * CONSTANTS.G * RHO_UNIFORM**2 * (CONSTANTS.R_EARTH**2 - r**2)
+
+
+@pytest.mark.parametrize('boundaries', [[0.0, CONSTANTS.R_EARTH],
+                                        [0.0, 1.2e6, 3.5e6, 6.0e6, CONSTANTS.R_EARTH]])
+def test_pressure_uniform_sphere(boundaries):
+    table = ShellTable(outer_radii=boundaries[1:], inner_radii=boundaries[:-1],
+                       densities=[RHO_UNIFORM] * (len(boundaries) - 1))
+    radii = np.concatenate(([0.0], np.linspace(1.0, CONSTANTS.R_EARTH, 200), boundaries))
+
+    with np.errstate(all='raise'):
+        pressure = table.pressure(radii)
+    np.testing.assert_allclose(pressure, uniform_sphere_pressure(radii), rtol=1e-12,
+                               atol=1e-12 * uniform_sphere_pressure(0.0))
+
+
+def test_pressure_uniform_shell_with_central_mass():
+    a, R, central_mass = 3.0e6, CONSTANTS.R_EARTH, 2e24
+    table = ShellTable(outer_radii=[R], inner_radii=[a], densities=[RHO_UNIFORM])
+    radii = np.linspace(a, R, 50)
+
+    # ∫_r^R ρ·G·(M_c + 4/3·π·ρ·(s³ - a³))/s² ds
+    expected = CONSTANTS.G * RHO_UNIFORM * (
+        (central_mass - (4.0/3.0) * np.pi * RHO_UNIFORM * a**3) * (1.0/radii - 1.0/R) +
+        (2.0/3.0) * np.pi * RHO_UNIFORM * (R**2 - radii**2)
+    )
+    np.testing.assert_allclose(table.pressure(radii, central_mass=central_mass), expected, rtol=1e-12,
+                               atol=1e-12 * expected[0])
+    assert table.pressure(0.5 * a) == 0.0
+    assert table.pressure(1.1 * R) == 0.0
+
+
+def test_pressure_profile_of_solid_earth_is_finite(model):
+    config = model.create_standard_earth_model()
+
+    with np.errstate(all='raise'):
+        radii, pressure = model.calculate_pressure_profile(config, n_points=200)
+    assert radii[0] == 0.0
+    assert np.all(np.isfinite(pressure))
+    assert pressure[-1] == 0.0
+    assert np.all(np.diff(pressure) <= 0.0)
+    # Central pressure of the four-shell Earth is a few hundred GPa
+    assert 2e11 < pressure[0] < 6e11
+
+
+def test_pressure_profile_matches_density_profile(model):
+    from mathematical_framework.density_profiles import RadialDensityProfile
+
+    config = model.create_hollow_earth_with_central_sun()
+    profile_config = ModelConfiguration.from_density_profile(
+        RadialDensityProfile.from_shell_table(config.shell_table), central_sun=config.central_sun)
+
+    radii, pressure = model.calculate_pressure_profile(config, n_points=100)
+    _, profile_pressure = model.calculate_pressure_profile(profile_config, n_points=100)
+    np.testing.assert_allclose(profile_pressure, pressure, rtol=1e-10, atol=1e-10 * pressure[0])
+
+
+def legacy_critical_angle(v1, v2):
+    """Original scalar rule: arcsin(v2/v1) when v2 < v1, else 90°."""
+    return np.degrees(np.arcsin(v2 / v1)) if v2 < v1 else 90.0
+
+
+def test_critical_angle_matches_scalar_rule():
+    velocities = [0.0, 343.0, 3500.0, 6000.0, 8000.0]
+    v1, v2 = np.meshgrid(velocities[1:], velocities, indexing='ij')
+    expected = np.array([[legacy_critical_angle(a, b) for a, b in zip(row1, row2)]
+                         for row1, row2 in zip(v1, v2)])
+
+    np.testing.assert_allclose(SeismicWaveguideModel.critical_angle(v1, v2), expected, rtol=1e-14)
+    assert SeismicWaveguideModel.critical_angle(6000.0, 3000.0) == pytest.approx(30.0)
+
+
+def test_default_critical_angles_unchanged():
+    waveguide = SeismicWaveguideModel()
+
+    assert waveguide.critical_angles['crust_air'] == pytest.approx(legacy_critical_angle(6000, 343))
+    assert waveguide.critical_angles['mantle_crust'] == pytest.approx(48.590377890729)
+    assert waveguide.critical_angles['crust_mantle'] == 90.0
+
+
+def test_critical_angle_matrix():
+    rng = np.random.default_rng(0)
+    velocities = rng.uniform(300.0, 9000.0, size=(4, 3, 5))
+    matrix = SeismicWaveguideModel.critical_angle_matrix(velocities)
+
+    assert matrix.shape == (4, 3, 5, 5)
+    np.testing.assert_array_equal(np.diagonal(matrix, axis1=-2, axis2=-1), 90.0)
+    for index in np.ndindex(4, 3):
+        for i in range(5):
+            for j in range(5):
+                assert matrix[index][i, j] == pytest.approx(
+                    legacy_critical_angle(velocities[index][i], velocities[index][j]), rel=1e-14)
+
+
+def test_analyze_velocity_models_matches_per_model_objects():
+    rng = np.random.default_rng(1)
+    n = 50
+    v_p = rng.uniform(5000.0, 9000.0, size=(n, 1))
+    v_s = v_p / np.sqrt(3.0)
+    v_cavity = rng.uniform(300.0, 1500.0, size=n)
+    cavity_radius = rng.uniform(1e2, 4e6, size=n)
+    thickness = CONSTANTS.R_EARTH - cavity_radius
+
+    batch = SeismicWaveguideModel.analyze_velocity_models(v_p, v_s, v_cavity, cavity_radius, thickness)
+
+    assert batch['critical_angles_p'].shape == (n, 2, 2)
+    # No S waves in the cavity: every S ray is totally reflected at the wall
+    np.testing.assert_array_equal(batch['critical_angles_s'][:, 0, 1], 0.0)
+    for i in range(n):
+        waveguide = SeismicWaveguideModel(v_p_crust=v_p[i, 0], v_s_crust=v_s[i, 0], v_air=v_cavity[i])
+        modes = waveguide.calculate_waveguide_modes(cavity_radius[i], thickness[i])
+        for key in ('numerical_aperture_equivalent', 'v_parameter', 'estimated_modes',
+                    'fundamental_frequency_hz'):
+            assert batch[key][i] == pytest.approx(modes[key], rel=1e-12)
+        assert batch['wall_cavity_critical_angle'][i] == pytest.approx(waveguide.critical_angles['crust_air'])
+        assert batch['critical_angles_p'][i, 0, 1] == pytest.approx(waveguide.critical_angles['crust_air'])
+        assert batch['cladding_radius'][i] == pytest.approx(CONSTANTS.R_EARTH)
@@ -0,0 +1,95 @@
+"""Tests for mathematical_framework.density_profiles."""
+
+import numpy as np
+import pytest
+from scipy.interpolate import PPoly
+
+from mathematical_framework.core_equations import CONSTANTS, HollowEarthModel, ModelConfiguration
+from mathematical_framework.density_profiles import RadialDensityProfile
+
+R = CONSTANTS.R_EARTH
+RHO0 = 12000.0
+
+
+@pytest.fixture
+def linear_profile():
+    # ρ(r) = ρ0·(1 - r/R), split into many layers
+    radii = np.linspace(0.0, R, 1001)
+    return RadialDensityProfile.from_table(radii, RHO0 * (1.0 - radii / R))
+
+
+def analytic_linear_mass(r):
+    return 4.0 * np.pi * RHO0 * (r**3 / 3.0 - r**4 / (4.0 * R))
+
+
+def test_linear_profile_mass_is_exact(linear_profile):
+    radii = np.linspace(0.0, R, 333)
+
+    np.testing.assert_allclose(linear_profile.enclosed_mass(radii), analytic_linear_mass(radii),
+                               rtol=1e-11, atol=1e-12 * analytic_linear_mass(R))
+    np.testing.assert_allclose(linear_profile.density(radii), RHO0 * (1.0 - radii / R), rtol=1e-11,
+                               atol=1e-9)
+    assert linear_profile.density(1.1 * R) == 0.0
+
+
+def test_gravity_includes_central_mass(linear_profile):
+    radii = np.array([0.0, 0.5 * R, R, 2.0 * R])
+    gravity = linear_profile.gravity(radii, central_mass=1e23)
+
+    expected = CONSTANTS.G * (analytic_linear_mass(np.minimum(radii, R)) + 1e23) / np.where(radii > 0, radii, 1.0)**2
+    np.testing.assert_allclose(gravity[1:], expected[1:], rtol=1e-11)
+    assert gravity[0] == 0.0
+
+
+def test_shell_table_round_trip():
+    model = HollowEarthModel(cache_size=0)
+    table = model.create_hollow_earth_model().shell_table
+    profile = RadialDensityProfile.from_shell_table(table)
+
+    radii = np.linspace(0.0, R, 500)
+    np.testing.assert_allclose(profile.enclosed_mass(radii), table.enclosed_mass(radii), rtol=1e-12)
+    back = profile.to_shell_table()
+    np.testing.assert_allclose(back.densities, table.densities, rtol=1e-12)
+    np.testing.assert_allclose(back.total_mass, table.total_mass, rtol=1e-12)
+
+
+def test_to_shell_table_preserves_mass(linear_profile):
+    table = linear_profile.to_shell_table()
+
+    np.testing.assert_allclose(table.total_mass, linear_profile.total_mass, rtol=1e-12)
+    np.testing.assert_allclose(table.cumulative_masses, linear_profile.cumulative_masses, rtol=1e-12)
+
+
+def test_from_ppoly_matches_table(linear_profile):
+    x = linear_profile.boundaries
+    ppoly = PPoly(linear_profile.coefficients[:, ::-1].T.copy(), x)
+    profile = RadialDensityProfile.from_ppoly(ppoly)
+
+    assert profile.content_hash == linear_profile.content_hash
+
+
+def test_configuration_uses_continuous_profile(linear_profile):
+    model = HollowEarthModel(cache_size=0)
+    config = ModelConfiguration.from_density_profile(linear_profile)
+    radii = np.linspace(1e3, R, 77)
+
+    np.testing.assert_allclose(model.calculate_gravity_at_radii(radii, config),
+                               CONSTANTS.G * analytic_linear_mass(radii) / radii**2, rtol=1e-10)
+    np.testing.assert_allclose(config.total_mass, analytic_linear_mass(R), rtol=1e-12)
+
+
+def test_rejects_bad_tables():
+    with pytest.raises(ValueError):
+        RadialDensityProfile.from_table([0.0, 1.0, 2.0], [1.0, 2.0], kind='linear')
+    with pytest.raises(ValueError):
+        RadialDensityProfile.from_table([0.0, 2.0, 1.0], [1.0, 2.0], kind='constant')
+    with pytest.raises(ValueError):
+        RadialDensityProfile.from_table([0.0, 1.0], [1.0], kind='cubic')
+
+
+def test_pressure_uniform_sphere():
+    profile = RadialDensityProfile.from_table([0.0, 2e6, R], [5500.0, 5500.0], kind='constant')
+    radii = np.linspace(0.0, R, 101)
+    expected = (2.0/3.0) * np.pi * CONSTANTS.G * 5500.0**2 * (R**2 - radii**2)
+
+    np.testing.assert_allclose(profile.pressure(radii), expected, rtol=1e-12, atol=1e-12 * expected[0])
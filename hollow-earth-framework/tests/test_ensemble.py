@@ -0,0 +1,66 @@
+"""Tests for mathematical_framework.ensemble."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import CONSTANTS, HollowEarthModel
+from mathematical_framework.ensemble import evaluate_hollow_earth_ensemble
+
+PARAMS = np.array([
+    [100e3, 1800e3, 200e3, 8649.0],
+    [50e3, 2500e3, 500e3, 15000.0],
+    [200e3, 800e3, 50e3, 8000.0],
+])
+
+
+def test_ensemble_matches_single_models():
+    model = HollowEarthModel(cache_size=0)
+    results = evaluate_hollow_earth_ensemble(PARAMS, target_interior_gravity=9.0, sun_radius=100e3)
+
+    for i, (outer, dense, inner, density) in enumerate(PARAMS):
+        config = model.create_hollow_earth_with_central_sun(outer, dense, inner, density,
+                                                            target_interior_gravity=9.0,
+                                                            sun_radius=100e3)
+        assert results['valid'][i]
+        np.testing.assert_allclose(results['total_mass'][i], config.total_mass, rtol=1e-12)
+        np.testing.assert_allclose(results['surface_gravity'][i], config.surface_gravity, rtol=1e-12)
+        np.testing.assert_allclose(results['cavity_radius'][i], config.central_hollow_radius, rtol=1e-12)
+        np.testing.assert_allclose(results['sun_mass'][i], config.central_sun['mass'], rtol=1e-12)
+        np.testing.assert_allclose(results['sun_density'][i], config.central_sun['density'], rtol=1e-12)
+
+
+def test_ensemble_matches_physical_constraints():
+    model = HollowEarthModel(cache_size=0)
+    balanced = model.optimize_gravity_balance_batch()
+    params = np.vstack((PARAMS, [[balanced['outer_shell_thickness'], balanced['dense_shell_thickness'],
+                                  balanced['inner_shell_thickness'], balanced['dense_shell_density']]]))
+    gravity = balanced['interior_gravity']
+    results = evaluate_hollow_earth_ensemble(params, target_interior_gravity=gravity)
+
+    for i, (outer, dense, inner, density) in enumerate(params):
+        config = model.create_hollow_earth_with_central_sun(outer, dense, inner, density,
+                                                            target_interior_gravity=gravity)
+        constraints = model.validate_physical_constraints(config)
+        np.testing.assert_allclose(results['shell_mass'][i], config.shell_mass, rtol=1e-12)
+        assert constraints['mass_conservation'] == (abs(results['mass_ratio'][i] - 1) < 0.01)
+        assert constraints['earth_surface_gravity'] == (9.5 <= results['surface_gravity'][i] <= 10.5)
+        ratio = results['interior_gravity_total'][i] / results['surface_gravity'][i]
+        assert constraints['gravity_balance'] == (0.8 <= ratio <= 1.2)
+    # The balanced row conserves Earth's mass only because the sun is counted
+    assert results['mass_ratio'][-1] == pytest.approx(1.0)
+    assert results['shell_mass'][-1] < 0.99 * CONSTANTS.M_EARTH
+    assert model.validate_physical_constraints(config)['mass_conservation']
+
+
+def test_invalid_rows_are_nan():
+    params = np.vstack((PARAMS[:1], [[3000e3, 3000e3, 1000e3, 8649.0]]))
+    results = evaluate_hollow_earth_ensemble(params)
+
+    assert results['valid'].tolist() == [True, False]
+    assert np.isfinite(results['total_mass'][0])
+    assert np.isnan(results['total_mass'][1])
+
+
+def test_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        evaluate_hollow_earth_ensemble(np.zeros((3, 3)))
@@ -0,0 +1,221 @@
+"""Tests for geological_feedback_system."""
+
+import numpy as np
+import pytest
+
+from geological_feedback_system import (
+    ESTADOS_ENERGETICOS, ESTADOS_GENERALES, ESTADOS_VOLCANICOS, ProportionalGrowthSystem
+)
+
+YEARS = np.array([0.0, 1e6, 1e7, 1e8, 5e8, 1e9, 5e9, 1e10, 1e11, 1e12])
+
+
+@pytest.fixture
+def system():
+    return ProportionalGrowthSystem()
+
+
+def test_arrays_match_scalar_methods(system):
+    arrays = system.simulate_evolution_arrays(YEARS)
+
+    for i, years in enumerate(YEARS):
+        scalar = {**system.calculate_proportional_expansion(years),
+                  **system.analyze_volcanic_feedback(years),
+                  **system.analyze_energy_balance(years)}
+        shared = [key for key in arrays if key in scalar]
+        assert len(shared) > 40
+        for key in shared:
+            assert arrays[key][i] == pytest.approx(scalar[key], rel=1e-12, abs=1e-12), key
+
+        assert ESTADOS_VOLCANICOS[arrays['volcanic_status_code'][i]] == scalar['system_status']
+        assert ESTADOS_ENERGETICOS[arrays['energy_status_code'][i]] == scalar['system_energy_status']
+
+
+def test_overall_status_matches_scalar(system):
+    arrays = system.simulate_evolution_arrays(YEARS)
+
+    for i, years in enumerate(YEARS):
+        status = system._assess_overall_status(system.calculate_proportional_expansion(years),
+                                               system.analyze_volcanic_feedback(years),
+                                               system.analyze_energy_balance(years))
+        assert ESTADOS_GENERALES[arrays['system_status_code'][i]] == status
+
+
+def test_arrays_keep_shape(system):
+    years = np.linspace(0.0, 1e10, 12).reshape(3, 4)
+    arrays = system.simulate_evolution_arrays(years)
+
+    assert arrays['years'].shape == (3, 4)
+    assert arrays['new_earth_radius_km'].shape == (3, 4)
+    assert arrays['system_status_code'].dtype == np.int8
+
+
+def test_parameter_arrays_broadcast_against_years():
+    rates = np.array([0.0005, 0.001, 0.002])
+    batch = ProportionalGrowthSystem(core_expansion_rate=rates[:, np.newaxis])
+    arrays = batch.simulate_evolution_arrays(YEARS)
+
+    assert arrays['expansion_factor'].shape == (3, len(YEARS))
+    for row, rate in enumerate(rates):
+        single = ProportionalGrowthSystem(core_expansion_rate=rate).simulate_evolution_arrays(YEARS)
+        for key in ('expansion_factor', 'new_surface_gravity', 'sun_lifetime_years', 'system_status_code'):
+            np.testing.assert_allclose(arrays[key][row], single[key], rtol=1e-15)
+
+
+def test_timeline_uses_array_engine(system):
+    timeline = system.simulate_system_evolution(1e9)
+
+    assert list(timeline) == ['1e+06_years', '1e+07_years', '1e+08_years', '5e+08_years', '1e+09_years']
+    scalar = system.calculate_proportional_expansion(5e8)
+    assert timeline['5e+08_years']['surface_gravity'] == pytest.approx(scalar['new_surface_gravity'], rel=1e-12)
+
+
+DECAY_RATE = np.log(2) / 4.5e9
+
+
+def test_coupled_core_growth_is_analytic(system):
+    years = np.linspace(0.0, 1e10, 51)
+    results = system.integrate_coupled_evolution(1e10, output_years=years)
+
+    assert results['success']
+    np.testing.assert_allclose(results['radioactive_fraction_remaining'], np.exp(-DECAY_RATE * years), rtol=1e-6)
+    expected_growth = system.core_expansion_rate / DECAY_RATE * (1 - np.exp(-DECAY_RATE * years))
+    np.testing.assert_allclose(results['core_growth_km'] * 1000, expected_growth, rtol=1e-6, atol=1e-6)
+
+
+def test_coupled_sun_mass_without_expansion_is_linear():
+    system = ProportionalGrowthSystem(core_expansion_rate=0.0)
+    gas_per_area, burn_per_area, _ = system._coupled_coefficients()
+    area = 4 * np.pi * system.initial_cavity_radius**2
+    years = np.linspace(0.0, 1e9, 11)
+    results = system.integrate_coupled_evolution(1e9, output_years=years)
+
+    rate = (gas_per_area - burn_per_area) * area + system.sun_accretion_rate
+    np.testing.assert_allclose(results['sun_mass_kg'], system.initial_sun_mass + rate * years, rtol=1e-8)
+    np.testing.assert_allclose(results['cumulative_gas_to_sun_tons'] * 1000, gas_per_area * area * years,
+                               rtol=1e-8)
+
+
+def test_coupled_jacobian_matches_finite_differences(system):
+    state = system.coupled_initial_state() + np.array([5e3, -0.2, 1e21, 1e20, 1e22])
+    jacobian = system._coupled_jacobian(0.0, state, 1.3)
+
+    for column in range(5):
+        step = 1e-6 * max(abs(state[column]), 1.0)
+        delta = np.zeros(5)
+        delta[column] = step
+        numeric = (system._coupled_rhs(0.0, state + delta, 1.3) -
+                   system._coupled_rhs(0.0, state - delta, 1.3)) / (2 * step)
+        np.testing.assert_allclose(jacobian[:, column], numeric, rtol=1e-6, atol=1e-12)
+
+
+def test_coupled_events(system):
+    results = system.integrate_coupled_evolution(1e10)
+    initial_gravity = system.calculate_proportional_expansion(0.0)['new_surface_gravity']
+
+    # Gravity scales with the expansion factor, so its crossing of 12 m/s² is analytic
+    growth = system.initial_dense_core * (12.0 / initial_gravity - 1)
+    expected = -np.log(1 - DECAY_RATE * growth / system.core_expansion_rate) / DECAY_RATE
+    np.testing.assert_allclose(results['events']['gravity_above_12'], [expected], rtol=1e-6)
+
+    light_exit = results['events']['light_below_95']
+    assert light_exit == pytest.approx([4.553e7], rel=1e-3)
+    at_exit = system.integrate_coupled_evolution(light_exit[0], output_years=light_exit)
+    assert at_exit['light_intensity_ratio'][0] == pytest.approx(0.95, rel=1e-6)
+    assert len(results['events']['light_above_105']) == 0
+
+
+def test_coupled_stop_on_event(system):
+    results = system.integrate_coupled_evolution(1e10, stop_on_event=True)
+    assert results['years'][-1] == pytest.approx(results['events']['light_below_95'][0])
+
+
+@pytest.mark.parametrize('method', ['Radau', 'BDF', 'RK45'])
+def test_coupled_methods_agree(system, method):
+    years = np.linspace(0.0, 5e9, 6)
+    reference = system.integrate_coupled_evolution(5e9, output_years=years)
+    results = system.integrate_coupled_evolution(5e9, output_years=years, method=method)
+
+    for key in ('core_growth_km', 'sun_mass_kg', 'sun_fuel_kg', 'light_intensity_ratio'):
+        np.testing.assert_allclose(results[key], reference[key], rtol=1e-5)
+
+
+def concatenate(chunks):
+    chunks = list(chunks)
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}, len(chunks)
+
+
+def test_chunks_equal_full_evolution(system):
+    chunked, n_chunks = concatenate(system.iter_evolution_chunks(1e10, 1e7, chunk_size=128))
+    full = system.simulate_evolution_arrays(1e7 * np.arange(1001))
+
+    assert n_chunks == 8
+    assert chunked.keys() == full.keys()
+    for key in full:
+        np.testing.assert_array_equal(chunked[key], full[key])
+
+
+def test_chunks_start_and_partial_last_step(system):
+    chunked, _ = concatenate(system.iter_evolution_chunks(10.5, 2.0, chunk_size=2, start_years=3.0))
+    np.testing.assert_array_equal(chunked['years'], [3.0, 5.0, 7.0, 9.0])
+
+
+@pytest.mark.parametrize('max_years, step_years, start_years, n_rows',
+                         [(0.3, 0.1, 0.0, 4), (0.7, 0.1, 0.0, 8), (1.0, 0.1, 0.3, 8), (0.35, 0.1, 0.0, 4)])
+def test_chunks_keep_last_step_of_inexact_ratio(system, max_years, step_years, start_years, n_rows):
+    chunked, _ = concatenate(system.iter_evolution_chunks(max_years, step_years, chunk_size=3,
+                                                          start_years=start_years))
+    np.testing.assert_allclose(chunked['years'], start_years + step_years * np.arange(n_rows))
+
+
+def test_coupled_chunks_match_single_integration(system):
+    years = 1e8 * np.arange(101)
+    chunked, n_chunks = concatenate(system.iter_evolution_chunks(1e10, 1e8, chunk_size=16, coupled=True))
+    reference = system.integrate_coupled_evolution(1e10, output_years=years)
+
+    assert n_chunks == 7
+    np.testing.assert_array_equal(chunked['years'], years)
+    for key in ('core_growth_km', 'sun_mass_kg', 'light_intensity_ratio', 'surface_gravity'):
+        np.testing.assert_allclose(chunked[key], reference[key], rtol=1e-6)
+
+
+def test_monte_carlo_resume_is_bit_identical(system, tmp_path):
+    path = str(tmp_path / 'mc.npz')
+    kwargs = dict(max_years=1e9, step_years=5e7, n_realizations=64, volcanic_sigma=0.3, seed=7)
+    full = system.run_monte_carlo_evolution(checkpoint_path=path, checkpoint_interval=6, **kwargs)
+    # The last checkpoint (step 18 of 20) is still on disk: finishing from it must give the same run
+    resumed = ProportionalGrowthSystem.resume_monte_carlo_evolution(path)
+    uncheckpointed = system.run_monte_carlo_evolution(**kwargs)
+
+    with np.load(path) as checkpoint:
+        assert int(checkpoint['step']) == 18
+    for key in full:
+        np.testing.assert_array_equal(resumed[key], full[key])
+        np.testing.assert_array_equal(uncheckpointed[key], full[key])
+
+
+@pytest.mark.parametrize('coupled', [False, True])
+def test_chunk_resume_is_bit_identical(system, tmp_path, coupled):
+    path = str(tmp_path / 'chunks.npz')
+    kwargs = dict(max_years=1e10, step_years=1e8, chunk_size=16, start_years=5e7, coupled=coupled)
+    expected = list(system.iter_evolution_chunks(**kwargs))
+
+    interrupted = system.iter_evolution_chunks(checkpoint_path=path, **kwargs)
+    for _ in range(3):
+        next(interrupted)
+    # Chunk 2 was handed out but never finished: the checkpoint restarts there
+    del interrupted
+    resumed = list(ProportionalGrowthSystem.resume_evolution_chunks(path))
+
+    assert len(resumed) == len(expected) - 2
+    for chunk, reference in zip(resumed, expected[2:]):
+        assert chunk.keys() == reference.keys()
+        for key in reference:
+            np.testing.assert_array_equal(chunk[key], reference[key])
+
+
+def test_chunk_resume_rejects_monte_carlo_checkpoint(system, tmp_path):
+    path = str(tmp_path / 'mc.npz')
+    system.run_monte_carlo_evolution(1e8, 1e7, n_realizations=2, checkpoint_path=path, checkpoint_interval=5)
+    with pytest.raises(ValueError):
+        next(ProportionalGrowthSystem.resume_evolution_chunks(path))
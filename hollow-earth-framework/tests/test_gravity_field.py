@@ -0,0 +1,60 @@
+"""Tests for mathematical_framework.gravity_field."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import CONSTANTS, HollowEarthModel
+from mathematical_framework.gravity_field import compute_gravity_field, sun_gravity
+
+LATITUDES = np.linspace(-80.0, 80.0, 5)
+LONGITUDES = np.linspace(0.0, 300.0, 6)
+ALTITUDES = np.array([-50e3, 0.0, 1000e3, 3000e3])
+
+
+@pytest.fixture(scope='module')
+def config():
+    return HollowEarthModel(cache_size=0).create_hollow_earth_with_central_sun()
+
+
+def test_centered_sun_matches_radial_gravity(config):
+    field = compute_gravity_field(config, LATITUDES, LONGITUDES, ALTITUDES, frame='local')
+    radii = config.central_hollow_radius - ALTITUDES
+    shells = np.array([HollowEarthModel(cache_size=0).calculate_gravity_at_radius(r, config) for r in radii])
+    expected = shells + CONSTANTS.G * config.central_sun['mass'] / radii**2
+
+    np.testing.assert_allclose(field[..., 2], np.broadcast_to(-expected, field.shape[:3]), rtol=1e-12)
+    np.testing.assert_allclose(field[..., :2], 0.0, atol=1e-12)
+
+
+def test_frames_agree_and_chunking_is_invisible(config):
+    sun_position = (300e3, -200e3, 100e3)
+    cartesian = compute_gravity_field(config, LATITUDES, LONGITUDES, ALTITUDES, sun_position=sun_position)
+    chunked = compute_gravity_field(config, LATITUDES, LONGITUDES, ALTITUDES, sun_position=sun_position,
+                                    chunk_points=1)
+    local = compute_gravity_field(config, LATITUDES, LONGITUDES, ALTITUDES, sun_position=sun_position,
+                                  frame='local')
+
+    np.testing.assert_array_equal(chunked, cartesian)
+    np.testing.assert_allclose(np.linalg.norm(local, axis=-1), np.linalg.norm(cartesian, axis=-1), rtol=1e-12)
+
+
+def test_extended_sun_interior_is_linear():
+    points = np.array([[0.0, 0.0, 50e3], [0.0, 0.0, 100e3], [0.0, 0.0, 400e3]])
+    point_mass = sun_gravity(points, (0.0, 0.0, 0.0), 1e24)
+    extended = sun_gravity(points, (0.0, 0.0, 0.0), 1e24, sun_radius=100e3)
+
+    np.testing.assert_allclose(extended[0], 0.5 * extended[1])
+    np.testing.assert_allclose(extended[1:], point_mass[1:])
+    assert np.all(sun_gravity(np.zeros(3), (0.0, 0.0, 0.0), 1e24) == 0.0)
+
+
+def test_memmap_output(config, tmp_path):
+    path = tmp_path / 'field.npy'
+    field = compute_gravity_field(config, LATITUDES, LONGITUDES, ALTITUDES, memmap_path=str(path))
+
+    np.testing.assert_array_equal(np.load(path), np.asarray(field))
+
+
+def test_rejects_altitude_beyond_center(config):
+    with pytest.raises(ValueError):
+        compute_gravity_field(config, [0.0], [0.0], [2 * config.central_hollow_radius])
@@ -0,0 +1,96 @@
+"""Tests for growth_sensitivity."""
+
+import numpy as np
+import pytest
+
+from geological_feedback_system import ProportionalGrowthSystem
+from growth_sensitivity import (
+    PARAMETROS_ACOPLADOS, PARAMETROS_AJUSTABLES, default_bounds, morris_screening, sobol_indices
+)
+
+COEFFICIENTS = np.array([1.0, 2.0, 3.0, 0.0])
+UNIT_BOUNDS = {f'x{i}': (0.0, 1.0) for i in range(len(COEFFICIENTS))}
+
+
+def additive_model(values, horizons):
+    """f = Σ c_i·x_i: S_i = ST_i = c_i² / Σ c²."""
+    return values @ COEFFICIENTS
+
+
+def test_default_bounds_depend_on_mode():
+    proportional = default_bounds()
+    coupled = default_bounds(coupled=True)
+
+    assert set(coupled) == set(PARAMETROS_AJUSTABLES)
+    assert set(proportional) == set(PARAMETROS_AJUSTABLES) - set(PARAMETROS_ACOPLADOS)
+    nominal = ProportionalGrowthSystem().core_expansion_rate
+    assert proportional['core_expansion_rate'] == pytest.approx((0.8 * nominal, 1.2 * nominal))
+
+
+def test_sobol_additive_model_has_known_indices():
+    results = sobol_indices(n_samples=2**14, horizons=[0.0], outputs=['f'], bounds=UNIT_BOUNDS,
+                            model=additive_model)
+    expected = COEFFICIENTS**2 / np.sum(COEFFICIENTS**2)
+
+    assert results['first_order'].shape == (1, 1, 4)
+    np.testing.assert_allclose(results['first_order'][0, 0], expected, atol=5e-3)
+    np.testing.assert_allclose(results['total'][0, 0], expected, atol=5e-3)
+    assert results['variance'][0, 0] == pytest.approx(np.sum(COEFFICIENTS**2) / 12, rel=1e-3)
+    assert results['n_evaluations'] == 2**14 * 6
+
+
+def test_sobol_is_independent_of_blocking():
+    kwargs = dict(n_samples=2**10, horizons=[0.0], outputs=['f'], bounds=UNIT_BOUNDS, model=additive_model)
+    single = sobol_indices(block_size=2**10, **kwargs)
+    blocked = sobol_indices(block_size=2**7, **kwargs)
+
+    np.testing.assert_allclose(blocked['first_order'], single['first_order'], rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(blocked['total'], single['total'], rtol=1e-10, atol=1e-12)
+
+
+def test_morris_additive_model_is_exact():
+    results = morris_screening(n_trajectories=50, horizons=[0.0], outputs=['f'], bounds=UNIT_BOUNDS,
+                               model=additive_model, block_size=16)
+
+    np.testing.assert_allclose(results['mu'][0, 0], COEFFICIENTS, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(results['mu_star'][0, 0], COEFFICIENTS, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(results['sigma'][0, 0], 0.0, atol=1e-6)
+
+
+def test_sobol_growth_system_proportional():
+    results = sobol_indices(n_samples=2**9, horizons=[1e9], outputs=['surface_gravity'])
+    first = dict(zip(results['parameters'], results['first_order'][0, 0]))
+
+    assert 'sun_accretion_rate' not in results['parameters']
+    assert np.all(np.isfinite(results['first_order']))
+    # The shell densities and radii dominate the surface gravity; the sun does not
+    assert first['dense_core_density'] > 0.1
+    assert abs(first['initial_sun_mass']) < 0.02
+
+
+def test_morris_growth_system_coupled():
+    results = morris_screening(n_trajectories=20, horizons=[1e9], outputs=['sun_lifetime_years'],
+                               coupled=True, coupled_step_years=2.5e8)
+
+    assert 'sun_accretion_rate' in results['parameters']
+    assert np.all(np.isfinite(results['mu_star']))
+    assert results['n_evaluations'] == 20 * (len(PARAMETROS_AJUSTABLES) + 1)
+
+
+def test_unknown_names_rejected():
+    with pytest.raises(ValueError):
+        sobol_indices(n_samples=4, bounds={'not_a_field': (0.0, 1.0)})
+    with pytest.raises(ValueError):
+        sobol_indices(n_samples=4, outputs=['not_an_output'])
+    with pytest.raises(ValueError):
+        sobol_indices(n_samples=4, model=additive_model)
+
+
+def test_sobol_process_pool_matches_inline():
+    kwargs = dict(n_samples=2**8, horizons=[0.0], outputs=['f'], bounds=UNIT_BOUNDS,
+                  model=additive_model, block_size=2**6)
+    inline = sobol_indices(max_workers=0, **kwargs)
+    pooled = sobol_indices(max_workers=2, **kwargs)
+
+    np.testing.assert_array_equal(pooled['first_order'], inline['first_order'])
+    np.testing.assert_array_equal(pooled['total'], inline['total'])
@@ -0,0 +1,70 @@
+"""Tests for mathematical_framework.parameter_sweep."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.parameter_sweep import (
+    SweepSpec, evaluate_sweep_chunk, iter_sweep_results, run_parameter_sweep
+)
+
+
+@pytest.fixture
+def spec():
+    return SweepSpec(ranges={'dense_shell_density': (8000.0, 12000.0),
+                             'sun_radius': (100e3, 200e3)},
+                     points_per_axis=3, chunk_size=4)
+
+
+def test_grid_chunks_cover_design(spec):
+    samples = [spec.chunk_samples(chunk_id) for chunk_id in range(spec.n_chunks)]
+    density = np.concatenate([s['dense_shell_density'] for s in samples])
+    radius = np.concatenate([s['sun_radius'] for s in samples])
+
+    assert spec.n_chunks == 3
+    assert len(set(zip(density, radius))) == spec.n_total == 9
+    assert np.all(np.concatenate([s['inner_shell_thickness'] for s in samples]) == 200e3)
+
+
+def test_lhs_strata_are_a_permutation():
+    spec = SweepSpec(ranges={'dense_shell_density': (8000.0, 12000.0), 'sun_radius': (100e3, 200e3)},
+                     method='lhs', n_samples=50, chunk_size=7, seed=3)
+    density = np.concatenate([spec.chunk_samples(c)['dense_shell_density'] for c in range(spec.n_chunks)])
+    strata = np.floor((density - 8000.0) / 4000.0 * 50).astype(int)
+
+    assert sorted(strata.tolist()) == list(range(50))
+    rebuilt = SweepSpec(ranges=spec.ranges, method='lhs', n_samples=50, chunk_size=7, seed=3)
+    np.testing.assert_array_equal(rebuilt.chunk_samples(2)['sun_radius'], spec.chunk_samples(2)['sun_radius'])
+
+
+def test_sweep_runs_and_resumes(spec, tmp_path):
+    summary = run_parameter_sweep(spec, str(tmp_path), max_workers=0)
+    assert summary['chunks_run'] == 3
+    assert summary['samples_run'] == 9
+
+    (tmp_path / 'chunk_000001.npz').unlink()
+    summary = run_parameter_sweep(spec, str(tmp_path), max_workers=0)
+    assert summary['chunks_run'] == 1
+    assert summary['chunks_skipped'] == 2
+
+    chunks = list(iter_sweep_results(str(tmp_path)))
+    np.testing.assert_array_equal(np.concatenate([c['sample_id'] for c in chunks]), np.arange(9))
+    expected = evaluate_sweep_chunk(spec, 1)
+    for name, value in expected.items():
+        np.testing.assert_array_equal(chunks[1][name], value)
+
+
+def test_sweep_rejects_different_manifest(spec, tmp_path):
+    run_parameter_sweep(spec, str(tmp_path), max_workers=0)
+    other = SweepSpec(ranges={'sun_radius': (100e3, 200e3)}, points_per_axis=2)
+
+    with pytest.raises(ValueError):
+        run_parameter_sweep(other, str(tmp_path), max_workers=0)
+
+
+def test_jsonl_output_matches_npz(spec, tmp_path):
+    run_parameter_sweep(spec, str(tmp_path / 'npz'), max_workers=0)
+    run_parameter_sweep(spec, str(tmp_path / 'jsonl'), fmt='jsonl', max_workers=0)
+
+    for a, b in zip(iter_sweep_results(str(tmp_path / 'npz')), iter_sweep_results(str(tmp_path / 'jsonl'))):
+        for name in a:
+            np.testing.assert_array_equal(a[name], b[name])
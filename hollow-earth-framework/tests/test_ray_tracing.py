@@ -0,0 +1,69 @@
+"""Tests for mathematical_framework.ray_tracing."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import (
+    CONSTANTS, HollowEarthModel, ModelConfiguration, SeismicWaveguideModel, SphericalShell
+)
+from mathematical_framework.ray_tracing import RAY_TYPES, shell_velocities, trace_rays
+
+R = CONSTANTS.R_EARTH
+
+
+@pytest.fixture(scope='module')
+def uniform_sphere():
+    shells = [SphericalShell(outer_radius=R, inner_radius=0.0, density=3000.0, name="Uniform",
+                             material_type="crustal")]
+    return ModelConfiguration(shells=shells, central_hollow_radius=0.0)
+
+
+def test_uniform_sphere_rays_are_chords(uniform_sphere):
+    angles = np.linspace(0.0, 89.0, 90)
+    rays = trace_rays(uniform_sphere, angles)
+    incidence = np.radians(angles)
+    velocity = SeismicWaveguideModel().v_p_crust
+
+    assert np.all(rays['ray_type'] == RAY_TYPES['turning'])
+    np.testing.assert_allclose(rays['travel_time'], 2 * R * np.cos(incidence) / velocity, rtol=1e-10)
+    np.testing.assert_allclose(rays['distance_deg'], 180.0 - 2 * angles, rtol=1e-10, atol=1e-8)
+    np.testing.assert_allclose(rays['bottom_radius'], R * np.sin(incidence), rtol=1e-12, atol=1e-6)
+    np.testing.assert_allclose(rays['ray_parameter'], R * np.sin(incidence) / velocity, rtol=1e-14)
+
+
+def test_upgoing_rays_are_direct(uniform_sphere):
+    rays = trace_rays(uniform_sphere, [180.0, 150.0], source_depth=10e3)
+    velocity = SeismicWaveguideModel().v_p_crust
+
+    assert np.all(rays['ray_type'] == RAY_TYPES['direct'])
+    np.testing.assert_allclose(rays['travel_time'][0], 10e3 / velocity, rtol=1e-12)
+    assert rays['travel_time'][1] > rays['travel_time'][0]
+
+
+def test_hollow_earth_ray_types():
+    model = HollowEarthModel(cache_size=0)
+    hollow = trace_rays(model.create_hollow_earth_model(), np.linspace(0.0, 89.0, 300))
+    with_sun = trace_rays(model.create_hollow_earth_with_central_sun(), [0.0, 0.5, 89.0])
+
+    assert hollow['ray_type'][0] == RAY_TYPES['cavity']
+    assert hollow['ray_type'][-1] == RAY_TYPES['turning']
+    assert np.all(np.diff(hollow['bottom_radius'][hollow['ray_type'] == RAY_TYPES['turning']]) >= 0)
+    assert with_sun['ray_type'][0] == RAY_TYPES['blocked']
+    assert np.isnan(with_sun['travel_time'][0])
+    assert np.isfinite(with_sun['travel_time'][-1])
+
+
+def test_s_waves_do_not_enter_cavity():
+    config = HollowEarthModel(cache_size=0).create_hollow_earth_model()
+    rays = trace_rays(config, np.linspace(0.0, 89.0, 50), phase='S')
+    _, _, _, v_s = shell_velocities(config)
+
+    assert v_s[-1] == 0.0
+    assert not np.any(rays['ray_type'] == RAY_TYPES['cavity'])
+
+
+def test_rejects_bad_sources(uniform_sphere):
+    with pytest.raises(ValueError):
+        trace_rays(uniform_sphere, [10.0], phase='X')
+    with pytest.raises(ValueError):
+        trace_rays(uniform_sphere, [10.0], source_depth=2 * R)
@@ -0,0 +1,125 @@
+"""Tests for mathematical_framework.result_store."""
+
+import pickle
+import sqlite3
+
+import numpy as np
+import pytest
+
+from mathematical_framework.result_store import ResultStore, decode_value, encode_value
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(tmp_path / 'results.sqlite', max_bytes=10**6)
+    yield store
+    store.close()
+
+
+def stored_bytes(store):
+    return store.connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+
+def test_get_put_round_trip(store):
+    assert store.get('ns', {'a': 1}) is None
+    store.put('ns', {'a': 1}, {'value': [1, 2, 3]})
+
+    assert store.get('ns', {'a': 1}) == {'value': [1, 2, 3]}
+    assert store.get('other', {'a': 1}) is None
+    assert (store.hits, store.misses) == (1, 2)
+
+
+def test_values_are_not_pickled(store):
+    columns = {'x': np.arange(3.0), 'ok': np.array([True, False, True])}
+    solution = {'density': np.float64(8004.5), 'feasible': True, 'method': 'closed-form'}
+    store.put('ns', {'k': 'columns'}, columns)
+    store.put('ns', {'k': 'solution'}, solution)
+
+    loaded = store.get('ns', {'k': 'columns'})
+    assert loaded.keys() == columns.keys()
+    for name in columns:
+        np.testing.assert_array_equal(loaded[name], columns[name])
+    assert store.get('ns', {'k': 'solution'}) == {'density': 8004.5, 'feasible': True, 'method': 'closed-form'}
+    assert decode_value(encode_value(b'raw')) == b'raw'
+    with pytest.raises(TypeError):
+        encode_value(object())
+
+
+def test_pickled_entries_are_never_loaded(store):
+    class Payload:
+        def __reduce__(self):
+            return (pytest.fail, ('pickle.loads ran',))
+
+    key = store.make_key('ns', {'a': 1})
+    store.put('ns', {'a': 1}, 'placeholder')
+    store.connection.execute('UPDATE results SET value = ? WHERE key = ?', (pickle.dumps(Payload()), key))
+
+    assert store.get('ns', {'a': 1}) is None
+    assert store.misses == 1
+
+
+def test_keys_depend_on_framework_version(tmp_path):
+    old = ResultStore(tmp_path / 'results.sqlite', framework_version='0.9')
+    old.put('ns', {'a': 1}, 'old')
+    new = ResultStore(tmp_path / 'results.sqlite', framework_version='1.0')
+
+    assert new.get('ns', {'a': 1}) is None
+
+
+def test_running_size_total(store):
+    for i in range(5):
+        store.put('ns', {'i': i}, b'x' * (100 * i))
+    store.put('ns', {'i': 2}, b'x' * 1000)
+    store.connection.execute('DELETE FROM results WHERE namespace = ?', ('ns',))
+    store.put('ns', {'i': 9}, b'y' * 10)
+
+    assert store.stats()['bytes'] == stored_bytes(store)
+    assert store.stats()['entries'] == 1
+
+
+def test_eviction_is_lru(store):
+    store.max_bytes = 5000
+    for i in range(4):
+        store.put('ns', {'i': i}, b'x' * 1000)
+    store.get('ns', {'i': 0})
+    store.put('ns', {'i': 4}, b'x' * 1000)
+    store.put('ns', {'i': 5}, b'x' * 1000)
+
+    assert store.stats()['bytes'] <= 5000
+    assert store.stats()['bytes'] == stored_bytes(store)
+    assert store.get('ns', {'i': 0}) is not None
+    assert store.get('ns', {'i': 1}) is None
+    assert store.get('ns', {'i': 5}) is not None
+
+
+def test_total_shared_between_connections(store):
+    other = ResultStore(store.path, max_bytes=store.max_bytes)
+    store.put('ns', {'i': 0}, b'x' * 500)
+    other.put('ns', {'i': 1}, b'x' * 500)
+
+    assert store.stats()['bytes'] == other.stats()['bytes'] == stored_bytes(store)
+    other.close()
+
+
+def test_existing_database_is_migrated(tmp_path):
+    path = tmp_path / 'old.sqlite'
+    connection = sqlite3.connect(str(path))
+    connection.execute('CREATE TABLE results (key TEXT PRIMARY KEY, namespace TEXT NOT NULL,'
+                       ' framework_version TEXT NOT NULL, value BLOB NOT NULL, size INTEGER NOT NULL,'
+                       ' created REAL NOT NULL, last_access REAL NOT NULL)')
+    connection.execute("INSERT INTO results VALUES ('k', 'ns', '1.0.0', x'00', 1234, 0, 0)")
+    connection.commit()
+    connection.close()
+
+    store = ResultStore(path)
+    assert store.stats()['bytes'] == 1234
+    store.close()
+
+
+def test_get_or_compute(store):
+    calls = []
+    compute = lambda: calls.append(1) or 42
+
+    assert store.get_or_compute('ns', {'x': 1}, compute) == 42
+    assert store.get_or_compute('ns', {'x': 1}, compute) == 42
+    assert len(calls) == 1
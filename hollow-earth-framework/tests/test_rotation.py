@@ -0,0 +1,47 @@
+"""Tests for mathematical_framework.rotation."""
+
+import numpy as np
+
+from mathematical_framework.core_equations import CONSTANTS, HollowEarthModel
+from mathematical_framework.rotation import (
+    moment_of_inertia_batch, moment_of_inertia_for_configurations, radau_darwin_j2
+)
+
+
+def test_uniform_sphere_and_thin_shell():
+    R = CONSTANTS.R_EARTH
+    results = moment_of_inertia_batch([[R], [R]], [[0.0], [0.9999 * R]], [[5500.0], [5500.0]])
+
+    np.testing.assert_allclose(results['moi_factor'], [0.4, 2.0 / 3.0], rtol=1e-3)
+    np.testing.assert_allclose(results['moi_factor'][0], 0.4, rtol=1e-14)
+
+
+def test_homogeneous_body_gives_maclaurin_flattening():
+    flattening, j2, m = radau_darwin_j2(0.4, CONSTANTS.M_EARTH, CONSTANTS.R_EARTH)
+
+    np.testing.assert_allclose(flattening, 1.25 * m, rtol=1e-14)
+    np.testing.assert_allclose(j2, (2.0 * flattening - m) / 3.0, rtol=1e-14)
+
+
+def test_zero_density_padding_is_ignored():
+    R = CONSTANTS.R_EARTH
+    padded = moment_of_inertia_batch([[R, 3e6, 0.0]], [[3e6, 1e6, 0.0]], [[4000.0, 9000.0, 0.0]])
+    plain = moment_of_inertia_batch([[R, 3e6]], [[3e6, 1e6]], [[4000.0, 9000.0]])
+
+    for key in plain:
+        np.testing.assert_allclose(padded[key], plain[key], rtol=1e-14)
+
+
+def test_configurations_match_shell_tables():
+    model = HollowEarthModel(cache_size=0)
+    configs = [model.create_standard_earth_model(), model.create_hollow_earth_model()]
+    results = moment_of_inertia_for_configurations(configs)
+
+    for i, config in enumerate(configs):
+        table = config.shell_table
+        np.testing.assert_allclose(results['moment_of_inertia'][i], table.moment_of_inertia, rtol=1e-14)
+        np.testing.assert_allclose(results['moi_factor'][i],
+                                   table.moment_of_inertia / (table.total_mass * CONSTANTS.R_EARTH**2),
+                                   rtol=1e-14)
+    # A hollow model concentrates mass outwards
+    assert results['moi_factor'][1] > results['moi_factor'][0]
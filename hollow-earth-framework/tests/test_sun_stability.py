@@ -0,0 +1,50 @@
+"""Tests for mathematical_framework.sun_stability."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import HollowEarthModel
+from mathematical_framework.sun_stability import analyze_sun_stability, contact_times
+
+GAP = 1000.0
+
+
+def test_ballistic_contact_times():
+    positions = np.array([[0.0, 0.0, 0.0], [500.0, 0.0, 0.0], [500.0, 0.0, 0.0], [2000.0, 0.0, 0.0]])
+    velocities = np.array([[0.0, 0.0, 2.0], [1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+
+    times = contact_times(positions, velocities, np.zeros((4, 3)), GAP)
+    np.testing.assert_allclose(times, [500.0, 500.0, 1500.0, 0.0])
+    assert contact_times(np.zeros((1, 3)), np.zeros((1, 3)), np.zeros((1, 3)), GAP)[0] == np.inf
+
+
+def test_accelerated_contact_times():
+    # From rest at the center: GAP = a·t²/2
+    times = contact_times(np.zeros((1, 3)), np.zeros((1, 3)), np.array([[0.0, 0.02, 0.0]]), GAP)
+    np.testing.assert_allclose(times, np.sqrt(2 * GAP / 0.02))
+
+    # Random samples: |x(t)| reaches GAP at t and stays below it before
+    rng = np.random.default_rng(1)
+    x, v, a = rng.normal(scale=200.0, size=(50, 3)), rng.normal(size=(50, 3)), rng.normal(scale=1e-3, size=(50, 3))
+    times = contact_times(x, v, a, GAP)
+    assert np.all(np.isfinite(times))
+    position = lambda t: x + v * t[:, None] + 0.5 * a * t[:, None]**2
+    np.testing.assert_allclose(np.linalg.norm(position(times), axis=1), GAP, rtol=1e-6)
+    for fraction in np.linspace(0.0, 0.999, 50):
+        assert np.all(np.linalg.norm(position(fraction * times), axis=1) < GAP * (1 + 1e-9))
+
+
+def test_analysis_is_reproducible():
+    config = HollowEarthModel(cache_size=0).create_hollow_earth_with_central_sun()
+    inline = analyze_sun_stability(config, n_samples=2500, batch_size=1000, acceleration_sigma=1e-9, seed=7)
+    pooled = analyze_sun_stability(config, n_samples=2500, batch_size=1000, acceleration_sigma=1e-9, seed=7,
+                                   max_workers=1)
+
+    np.testing.assert_array_equal(inline['drift_times'], pooled['drift_times'])
+    assert len(inline['drift_times']) == 2500
+    assert inline['fraction_contact'] == 1.0
+
+
+def test_requires_central_sun():
+    with pytest.raises(ValueError):
+        analyze_sun_stability(HollowEarthModel(cache_size=0).create_hollow_earth_model(), n_samples=10)
@@ -0,0 +1,87 @@
+"""Tests for mathematical_framework.synthetic_seismograms."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import (
+    CONSTANTS, HollowEarthModel, ModelConfiguration, SphericalShell
+)
+from mathematical_framework.synthetic_seismograms import generate_synthetic_seismograms, ricker_wavelet
+
+R = CONSTANTS.R_EARTH
+SAMPLING_RATE = 10.0
+DELTA = np.array([1.0])
+
+
+@pytest.fixture(scope='module')
+def table_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('tables'))
+
+
+@pytest.fixture(scope='module')
+def hollow():
+    return HollowEarthModel(cache_size=0).create_hollow_earth_with_central_sun()
+
+
+def generate(config, distances, path, table_dir, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        return generate_synthetic_seismograms(config, distances, str(path), sampling_rate=SAMPLING_RATE,
+                                              table_dir=table_dir, **kwargs)
+
+
+def test_ricker_wavelet():
+    wavelet = ricker_wavelet(1.0, 100.0)
+    assert len(wavelet) % 2 == 1
+    assert wavelet[len(wavelet) // 2] == pytest.approx(1.0)
+    np.testing.assert_allclose(wavelet, wavelet[::-1])
+
+
+def test_impulses_land_on_arrival_times(tmp_path, table_dir):
+    shells = [SphericalShell(outer_radius=R, inner_radius=0.0, density=3000.0, material_type="crustal")]
+    config = ModelConfiguration(shells=shells, central_hollow_radius=0.0)
+    result = generate(config, [30.0, 90.0], tmp_path / 'uniform.npy', table_dir,
+                      duration=3600.0, source_time_function=DELTA, block_size=1000)
+    records = np.asarray(result['seismograms'])
+
+    np.testing.assert_allclose(records.sum(axis=1), 2.5)
+    for phase, amplitude in (('P', 1.0), ('S', 1.5)):
+        for station, arrival in enumerate(result['arrival_times'][phase]):
+            sample = int(np.floor(arrival * SAMPLING_RATE))
+            assert records[station, sample:sample + 2].sum() == pytest.approx(amplitude)
+
+
+@pytest.mark.parametrize('block_size', [7, 1000])
+def test_ricker_peaks_at_arrival_times(tmp_path, table_dir, block_size):
+    shells = [SphericalShell(outer_radius=R, inner_radius=0.0, density=3000.0, material_type="crustal")]
+    config = ModelConfiguration(shells=shells, central_hollow_radius=0.0)
+    result = generate(config, [30.0, 90.0], tmp_path / 'ricker.npy', table_dir, duration=3600.0,
+                      source_time_function=ricker_wavelet(1.0, SAMPLING_RATE), block_size=block_size)
+    records = np.asarray(result['seismograms'])
+
+    for phase in ('P', 'S'):
+        for station, arrival in enumerate(result['arrival_times'][phase]):
+            window = slice(int(arrival - 1.0) * int(SAMPLING_RATE), int(arrival + 2.0) * int(SAMPLING_RATE))
+            peak = window.start + np.argmax(records[station, window])
+            assert abs(peak / SAMPLING_RATE - arrival) <= 1.0 / SAMPLING_RATE
+
+
+def test_shadow_stations_and_ringing_across_blocks(hollow, tmp_path, table_dir):
+    distances = [10.0, 60.0, 120.0, 170.0]
+    kwargs = dict(duration=1800.0, source_time_function=DELTA, l_max=2, n_max=2)
+    blocked = generate(hollow, distances, tmp_path / 'blocked.npy', table_dir, block_size=4096, **kwargs)
+    whole = generate(hollow, distances, tmp_path / 'whole.npy', table_dir, block_size=2**15, **kwargs)
+    records = np.asarray(blocked['seismograms'])
+
+    assert np.all(np.isfinite(records))
+    # No arrivals in the shadow zone: no impulses and no ringing
+    assert np.all(np.isnan(blocked['arrival_times']['P'][2:]))
+    assert not np.any(records[2:])
+    # Nothing before the P arrival, cavity ringing after it
+    for station in (0, 1):
+        onset = int(np.floor(blocked['arrival_times']['P'][station] * SAMPLING_RATE))
+        np.testing.assert_allclose(records[station, :onset], 0.0, atol=1e-15)
+        assert np.abs(records[station, onset + 2:]).max() > 1e-6
+    np.testing.assert_allclose(records, np.asarray(whole['seismograms']), rtol=1e-9, atol=1e-12)
@@ -0,0 +1,97 @@
+"""Tests for mathematical_framework.trajectories."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import CONSTANTS, HollowEarthModel
+from mathematical_framework.trajectories import TRAJECTORY_STATUS, integrate_trajectories
+
+
+@pytest.fixture(scope='module')
+def model():
+    return HollowEarthModel(cache_size=0)
+
+
+@pytest.fixture(scope='module')
+def sun_config(model):
+    return model.create_hollow_earth_with_central_sun()
+
+
+def energy(config, trajectory):
+    positions, velocities = trajectory[..., :3], trajectory[..., 3:]
+    return (0.5 * np.sum(velocities**2, axis=-1) -
+            CONSTANTS.G * config.central_sun['mass'] / np.linalg.norm(positions, axis=-1))
+
+
+@pytest.mark.parametrize('method, dt, tolerance', [('adaptive', 100.0, 1e-8), ('rk4', 1.0, 1e-8)])
+def test_orbits_conserve_energy(sun_config, method, dt, tolerance):
+    radii = np.array([1.0e6, 2.0e6, 3.0e6])
+    speeds = np.sqrt(CONSTANTS.G * sun_config.central_sun['mass'] / radii) * np.array([1.0, 0.9, 1.05])
+    positions = np.column_stack((radii, np.zeros(3), np.zeros(3)))
+    velocities = np.column_stack((np.zeros(3), speeds, np.zeros(3)))
+
+    result = integrate_trajectories(sun_config, positions, velocities, t_end=3600.0, output_interval=600.0,
+                                    dt=dt, method=method)
+    e = energy(sun_config, result['trajectory'])
+
+    assert np.all(result['status'] == TRAJECTORY_STATUS['active'])
+    np.testing.assert_allclose(e, np.broadcast_to(e[0], e.shape), rtol=tolerance)
+    # Circular orbit keeps its radius
+    np.testing.assert_allclose(np.linalg.norm(result['trajectory'][:, 0, :3], axis=-1), radii[0], rtol=1e-7)
+
+
+def test_radial_infall_hits_sun_at_analytic_time(sun_config):
+    sun = sun_config.central_sun
+    r0 = 2.0e6
+    x = sun['radius'] / r0
+    expected = np.sqrt(r0**3 / (2.0 * CONSTANTS.G * sun['mass'])) * (np.sqrt(x * (1.0 - x)) + np.arccos(np.sqrt(x)))
+
+    result = integrate_trajectories(sun_config, [[r0, 0.0, 0.0]], [[0.0, 0.0, 0.0]],
+                                    t_end=2 * expected, output_interval=expected / 4)
+
+    assert result['status'][0] == TRAJECTORY_STATUS['sun']
+    np.testing.assert_allclose(result['event_time'][0], expected, rtol=1e-6)
+    np.testing.assert_allclose(np.linalg.norm(result['positions'][0]), sun['radius'], rtol=1e-9)
+
+
+def test_fast_particle_cannot_tunnel_through_sun(sun_config):
+    # A 2000 km step carries the particle from one side of the 150 km sun to the other
+    result = integrate_trajectories(sun_config, [[-1.0e6, 0.0, 0.0]], [[1.0e5, 0.0, 0.0]],
+                                    t_end=60.0, output_interval=60.0, dt=20.0, method='rk4')
+
+    assert result['status'][0] == TRAJECTORY_STATUS['sun']
+    assert result['event_time'][0] < 20.0
+    np.testing.assert_allclose(np.linalg.norm(result['positions'][0]), sun_config.central_sun['radius'],
+                               rtol=1e-9)
+
+
+def test_free_particle_reaches_wall(model):
+    config = model.create_hollow_earth_model()
+    wall = config.central_hollow_radius
+    result = integrate_trajectories(config, [[0.0, 0.0, 0.0], [0.0, 1e6, 0.0]], [[0.0, 0.0, 1e4], [0.0, 0.0, 0.0]],
+                                    t_end=1000.0, output_interval=100.0, dt=7.0, method='rk4')
+
+    assert result['status'].tolist() == [TRAJECTORY_STATUS['wall'], TRAJECTORY_STATUS['active']]
+    np.testing.assert_allclose(result['event_time'][0], wall / 1e4, rtol=1e-12)
+    np.testing.assert_allclose(result['positions'][0, 2], wall, rtol=1e-12)
+
+
+def test_output_times_end_at_t_end(sun_config):
+    result = integrate_trajectories(sun_config, [[1e6, 0.0, 0.0]], [[0.0, 5e3, 0.0]],
+                                    t_end=1000.0, output_interval=300.0)
+
+    np.testing.assert_array_equal(result['times'], [0.0, 300.0, 600.0, 900.0, 1000.0])
+    assert result['trajectory'].shape == (5, 1, 6)
+    reference = integrate_trajectories(sun_config, [[1e6, 0.0, 0.0]], [[0.0, 5e3, 0.0]],
+                                       t_end=1000.0, output_interval=1000.0)
+    np.testing.assert_allclose(result['positions'], reference['positions'], rtol=1e-6)
+
+
+def test_memmap_output_matches_memory(sun_config, tmp_path):
+    kwargs = dict(positions=[[1e6, 0.0, 0.0]], velocities=[[0.0, 5e3, 0.0]], t_end=1000.0,
+                  output_interval=100.0, chunk_snapshots=3)
+    in_memory = integrate_trajectories(sun_config, **kwargs)
+    on_disk = integrate_trajectories(sun_config, output_path=str(tmp_path / 'trajectory.npy'), **kwargs)
+
+    np.testing.assert_array_equal(np.load(tmp_path / 'trajectory.npy'), in_memory['trajectory'])
+    np.testing.assert_array_equal(on_disk['positions'], in_memory['positions'])
@@ -0,0 +1,113 @@
+"""Tests for mathematical_framework.travel_time_tables."""
+
+import numpy as np
+import pytest
+
+from mathematical_framework.core_equations import (
+    CONSTANTS, HollowEarthModel, ModelConfiguration, SeismicWaveguideModel, SphericalShell
+)
+from mathematical_framework.ray_tracing import RAY_TYPES, shell_velocities, trace_rays
+from mathematical_framework.travel_time_tables import (
+    TravelTimeTable, _first_arrivals, get_travel_time_table
+)
+
+R = CONSTANTS.R_EARTH
+DISTANCES = np.linspace(0.0, 180.0, 181)
+DEPTHS = np.array([0.0, 100e3])
+
+
+@pytest.fixture(scope='module')
+def hollow():
+    return HollowEarthModel(cache_size=0).create_hollow_earth_with_central_sun()
+
+
+@pytest.fixture(scope='module')
+def hollow_table(hollow):
+    return TravelTimeTable.build(hollow, depths=DEPTHS, distances=DISTANCES, n_rays=20000)
+
+
+def test_uniform_sphere_table_is_chord_time():
+    shells = [SphericalShell(outer_radius=R, inner_radius=0.0, density=3000.0, material_type="crustal")]
+    config = ModelConfiguration(shells=shells, central_hollow_radius=0.0)
+    table = TravelTimeTable.build(config, phases=('P',), depths=[0.0], distances=DISTANCES, n_rays=4000)
+    queries = np.linspace(0.0, 180.0, 1000)
+
+    expected = 2 * R * np.sin(np.radians(queries) / 2) / SeismicWaveguideModel().v_p_crust
+    np.testing.assert_allclose(table.travel_time(queries, 0.0), expected, rtol=2e-4, atol=1e-3)
+
+
+def bracketing_first_arrivals(rays, distances, boundaries):
+    """Reference first arrivals: earliest crossing of each grid distance by a pair of adjacent rays."""
+    t, x, kind = rays['travel_time'], rays['distance_deg'], rays['ray_type']
+    layer = np.searchsorted(np.sort(boundaries), rays['bottom_radius'], side='right')
+    spacing = distances[1] - distances[0]
+    first = np.full(len(distances), np.inf)
+    for i in range(len(t) - 1):
+        if not (np.isfinite(t[i]) and np.isfinite(t[i + 1]) and kind[i] == kind[i + 1] and
+                layer[i] == layer[i + 1] and abs(x[i + 1] - x[i]) <= spacing):
+            continue
+        for g in np.flatnonzero((distances >= min(x[i], x[i + 1])) & (distances <= max(x[i], x[i + 1]))):
+            fraction = (distances[g] - x[i]) / (x[i + 1] - x[i]) if x[i + 1] != x[i] else 0.0
+            first[g] = min(first[g], t[i] + fraction * (t[i + 1] - t[i]))
+    first[np.isinf(first)] = np.nan
+    return first
+
+
+@pytest.mark.parametrize('phase', ['P', 'S'])
+@pytest.mark.parametrize('depth_index', [0, 1])
+def test_table_agrees_with_trace_rays(hollow, hollow_table, phase, depth_index):
+    depth = DEPTHS[depth_index]
+    table = hollow_table.times[hollow_table.phases.index(phase), depth_index]
+
+    # Same fan as the table, joined by an independent per-ray loop
+    rays = trace_rays(hollow, np.linspace(0.0, 180.0, 20000), phase=phase, source_depth=depth)
+    reference = bracketing_first_arrivals(rays, DISTANCES, shell_velocities(hollow)[1])
+    np.testing.assert_array_equal(np.isnan(table), np.isnan(reference))
+    np.testing.assert_allclose(table, reference, rtol=1e-12)
+
+
+def test_branch_gaps_stay_nan():
+    distances = np.linspace(0.0, 10.0, 11)
+    kind = np.full(6, RAY_TYPES['turning'], dtype=np.int8)
+    rays = {
+        'travel_time': np.array([0.0, 1.0, 2.0, 6.0, 7.0, 8.0]),
+        'distance_deg': np.array([0.0, 1.0, 2.0, 6.0, 7.0, 8.0]),
+        'ray_type': kind,
+        'bottom_radius': np.full(6, 5.0),
+    }
+
+    first = _first_arrivals(rays, distances)
+    np.testing.assert_allclose(first[[0, 1, 2, 6, 7, 8]], [0, 1, 2, 6, 7, 8])
+    assert np.all(np.isnan(first[[3, 4, 5, 9, 10]]))
+
+
+def test_bottoming_layer_change_splits_branches():
+    distances = np.linspace(0.0, 5.0, 6)
+    x = np.array([0.0, 0.8, 1.6, 2.4, 3.2, 4.0])
+    rays = {
+        'travel_time': x.copy(),
+        'distance_deg': x,
+        'ray_type': np.full(6, RAY_TYPES['turning'], dtype=np.int8),
+        'bottom_radius': np.array([5.0, 5.0, 5.0, 5.0, 1.0, 1.0]),
+    }
+
+    joined = _first_arrivals(rays, distances)
+    split = _first_arrivals(rays, distances, boundaries=np.array([0.0, 3.0, 10.0]))
+    np.testing.assert_allclose(joined[:5], [0, 1, 2, 3, 4])
+    np.testing.assert_allclose(split[[0, 1, 2, 4]], [0, 1, 2, 4])
+    assert np.isnan(split[3])
+
+
+def test_cache_round_trip(hollow, tmp_path):
+    kwargs = dict(cache_dir=str(tmp_path), phases=('P',), depths=[0.0], distances=DISTANCES, n_rays=2000)
+    first = get_travel_time_table(hollow, **kwargs)
+    second = get_travel_time_table(hollow, **kwargs)
+
+    assert isinstance(second.times, np.memmap)
+    np.testing.assert_array_equal(np.asarray(first.times), np.asarray(second.times))
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_unknown_phase(hollow_table):
+    with pytest.raises(ValueError):
+        hollow_table.travel_time(10.0, 0.0, phase='PKP')